@@ -0,0 +1,371 @@
+import math
+import tkinter as tk
+from tkinter import ttk
+from GUI.common.app_theme import AppTheme
+
+# Load more items once the view is this many rows from the end of the loaded items
+LOAD_MORE_MARGIN = 5
+
+
+def truncate(text, length=50):
+    return text[:length] + ('...' if len(text) > length else '')
+
+
+def star_rating(mastery_level):
+    """Convert mastery level (0-5) to stars"""
+    return "★" * mastery_level + "☆" * (5 - mastery_level)
+
+
+class _VirtualView(ttk.Frame):
+    """Shared item and selection state of the recycled renderers
+
+    Items are word dicts with 'id', 'word', 'definition' and 'mastery'. Only
+    the items in view get widgets, so the cost of a render depends on the
+    window size rather than on the number of items. Subclasses provide
+    reset_view(), render() and scroll(units).
+    """
+    def __init__(self, parent, on_need_more=None):
+        super().__init__(parent)
+        self.items = []
+        self.selected_ids = set()
+        self.on_need_more = on_need_more
+        self.has_more = False
+
+    def set_items(self, items, has_more=False):
+        """Replace the items and scroll back to the top"""
+        self.items = list(items)
+        self.has_more = has_more
+        self.selected_ids.clear()
+        self.reset_view()
+
+    def append_items(self, items, has_more=False):
+        """Add a page of items at the end"""
+        self.items.extend(items)
+        self.has_more = has_more
+        self.render()
+
+    def get_selected_ids(self):
+        return list(self.selected_ids)
+
+    def request_more(self, last_visible):
+        if self.has_more and self.on_need_more and last_visible >= len(self.items) - LOAD_MORE_MARGIN:
+            # Cleared until the owner answers with append_items
+            self.has_more = False
+            self.on_need_more()
+
+    def on_mouse_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll(-1)
+        else:
+            self.scroll(1)
+        return "break"
+
+    def bind_mouse_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_mouse_wheel)
+        widget.bind("<Button-4>", self.on_mouse_wheel)
+        widget.bind("<Button-5>", self.on_mouse_wheel)
+
+
+class VirtualCardGrid(_VirtualView):
+    """Word cards on a canvas, drawn only for the rows in view
+
+    The canvas scroll region spans every item, but only enough cards to fill
+    the visible rows plus one exist. Item i is always shown by pool card
+    i % pool size, so scrolling by a row rebinds a single row of cards.
+    """
+    def __init__(self, parent, on_card_click=None, on_need_more=None,
+                 min_card_width=200, row_height=130, padding=10):
+        super().__init__(parent, on_need_more)
+        self.on_card_click = on_card_click
+        self.min_card_width = min_card_width
+        self.row_height = row_height
+        self.padding = padding
+        self.columns = 1
+        self.cards = []
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical")
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, background=AppTheme.BG_LIGHT,
+                                yscrollincrement=row_height // 4)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.config(yscrollcommand=self._on_canvas_scrolled)
+        self.scrollbar.config(command=self.canvas.yview)
+
+        self.canvas.bind("<Configure>", lambda e: self._layout())
+        self.bind_mouse_wheel(self.canvas)
+
+    def reset_view(self):
+        for card in self.cards:
+            card.item_index = None
+        self.canvas.yview_moveto(0)
+        self._layout()
+
+    def scroll(self, units):
+        self.canvas.yview_scroll(units, "units")
+
+    def _layout(self):
+        """Fit columns and the card pool to the canvas size"""
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        self.columns = max(1, width // self.min_card_width)
+        self._update_scroll_region()
+
+        pool_size = (math.ceil(height / self.row_height) + 1) * self.columns
+        while len(self.cards) < pool_size:
+            self.cards.append(self._create_card())
+        for card in self.cards:
+            card.item_index = None
+        self.render()
+
+    def _update_scroll_region(self):
+        rows = math.ceil(len(self.items) / self.columns)
+        self.canvas.config(scrollregion=(0, 0, max(self.canvas.winfo_width(), 1), rows * self.row_height))
+
+    def append_items(self, items, has_more=False):
+        self.items.extend(items)
+        self.has_more = has_more
+        self._update_scroll_region()
+        self.render()
+
+    def _create_card(self):
+        card = ttk.Frame(self.canvas, borderwidth=1, relief="solid")
+        card.word_label = ttk.Label(card, font=AppTheme.HEADING_FONT)
+        card.word_label.pack(pady=(10, 5))
+        card.def_label = ttk.Label(card)
+        card.def_label.pack(pady=5)
+        card.mastery_label = ttk.Label(card, foreground=AppTheme.ACCENT)
+        card.mastery_label.pack(pady=5)
+
+        card.item_index = None
+        card.window = self.canvas.create_window(0, 0, window=card, anchor="nw", state="hidden")
+
+        for widget in (card, card.word_label, card.def_label, card.mastery_label):
+            widget.bind("<Button-1>", lambda e, c=card: self._on_card_click(c))
+            self.bind_mouse_wheel(widget)
+        return card
+
+    def _on_canvas_scrolled(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render()
+
+    def render(self):
+        """Bind the card pool to the items in view"""
+        if not self.cards:
+            return
+
+        pool_size = len(self.cards)
+        first_row = int(self.canvas.canvasy(0) // self.row_height)
+        start = max(0, first_row * self.columns)
+        card_width = max(self.canvas.winfo_width(), 1) // self.columns
+
+        for index in range(start, start + pool_size):
+            card = self.cards[index % pool_size]
+            if index >= len(self.items):
+                self.canvas.itemconfigure(card.window, state="hidden")
+                card.item_index = None
+                continue
+
+            if card.item_index != index:
+                self._bind_card(card, index)
+                row, col = divmod(index, self.columns)
+                self.canvas.coords(card.window, col * card_width + self.padding,
+                                   row * self.row_height + self.padding)
+                self.canvas.itemconfigure(card.window, state="normal",
+                                          width=card_width - 2 * self.padding,
+                                          height=self.row_height - 2 * self.padding)
+
+        self.request_more(start + pool_size)
+
+    def _bind_card(self, card, index):
+        word_data = self.items[index]
+        card.item_index = index
+        card.word_label.config(text=word_data['word'])
+        card.def_label.config(text=truncate(word_data['definition']))
+        card.mastery_label.config(text=star_rating(word_data['mastery']))
+        card.config(relief="raised" if word_data['id'] in self.selected_ids else "solid")
+
+    def _on_card_click(self, card):
+        if card.item_index is None:
+            return
+        word_id = self.items[card.item_index]['id']
+        if word_id in self.selected_ids:
+            self.selected_ids.remove(word_id)
+        else:
+            self.selected_ids.add(word_id)
+        self._bind_card(card, card.item_index)
+
+        if self.on_card_click:
+            self.on_card_click(word_id)
+
+
+class VirtualWordList(_VirtualView):
+    """Word table that reuses one Treeview row per visible line
+
+    The Treeview only ever holds as many rows as fit in its height. The
+    scrollbar tracks the position in the full item list and scrolling rebinds
+    the values of the existing rows.
+    """
+    def __init__(self, parent, on_need_more=None, row_height=20):
+        super().__init__(parent, on_need_more)
+        self.row_height = row_height
+        self.first = 0
+        self.row_ids = []
+        self._rendering = False
+
+        list_columns = ("word", "definition", "mastery")
+        self.tree = ttk.Treeview(self, columns=list_columns, show="headings",
+                                 selectmode="extended", height=1)
+        self.tree.heading("word", text="Word")
+        self.tree.heading("definition", text="Definition")
+        self.tree.heading("mastery", text="Mastery")
+
+        self.tree.column("word", width=100)
+        self.tree.column("definition", width=300)
+        self.tree.column("mastery", width=80)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind("<Configure>", lambda e: self._layout(e.height))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.bind_mouse_wheel(self.tree)
+
+    def visible_rows(self):
+        return len(self.row_ids)
+
+    def reset_view(self):
+        self.first = 0
+        self.render()
+
+    def scroll(self, units):
+        self._scroll_to(self.first + units * 3)
+
+    def _layout(self, height):
+        """Keep one Treeview row per line that fits in the widget"""
+        rows = max(1, (height - self.row_height) // self.row_height)
+        while len(self.row_ids) < rows:
+            self.row_ids.append(self.tree.insert("", "end", values=("", "", "")))
+        while len(self.row_ids) > rows:
+            self.tree.delete(self.row_ids.pop())
+        self.render()
+
+    def _on_scrollbar(self, action, *args):
+        page = max(1, self.visible_rows() - 1)
+        if action == "moveto":
+            self._scroll_to(int(float(args[0]) * len(self.items)))
+        elif args[1] == "pages":
+            self._scroll_to(self.first + int(args[0]) * page)
+        else:
+            self._scroll_to(self.first + int(args[0]))
+
+    def _scroll_to(self, first):
+        last_first = max(0, len(self.items) - self.visible_rows())
+        first = min(max(0, first), last_first)
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def render(self):
+        """Bind the Treeview rows to the items in view"""
+        self._rendering = True
+        selection = []
+        for offset, row_id in enumerate(self.row_ids):
+            index = self.first + offset
+            if index < len(self.items):
+                word_data = self.items[index]
+                self.tree.item(row_id, values=(
+                    word_data['word'],
+                    truncate(word_data['definition']),
+                    star_rating(word_data['mastery'])
+                ), tags=(str(word_data['id']),))
+                if word_data['id'] in self.selected_ids:
+                    selection.append(row_id)
+            else:
+                self.tree.item(row_id, values=("", "", ""), tags=())
+        self.tree.selection_set(selection)
+        self._rendering = False
+
+        total = max(len(self.items), 1)
+        self.scrollbar.set(self.first / total, min(1.0, (self.first + self.visible_rows()) / total))
+        self.request_more(self.first + self.visible_rows())
+
+    def _on_select(self, event):
+        if self._rendering:
+            return
+        shown = self.items[self.first:self.first + self.visible_rows()]
+        selected_rows = set(self.tree.selection())
+        for row_id, word_data in zip(self.row_ids, shown):
+            if row_id in selected_rows:
+                self.selected_ids.add(word_data['id'])
+            else:
+                self.selected_ids.discard(word_data['id'])
+
+
+if __name__ == "__main__":
+    # Compare render time and widget count against building a widget per word
+    import time
+
+    def count_widgets(widget):
+        return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+    def render_all_cards(container, words):
+        for i, word_data in enumerate(words):
+            card_frame = ttk.Frame(container, borderwidth=1, relief="solid")
+            card_frame.grid(row=i // 4, column=i % 4, padx=10, pady=10, sticky="nsew")
+            ttk.Label(card_frame, text=word_data['word'], font=AppTheme.HEADING_FONT).pack(pady=(10, 5))
+            ttk.Label(card_frame, text=truncate(word_data['definition'])).pack(pady=5)
+            ttk.Label(card_frame, text=star_rating(word_data['mastery'])).pack(pady=5)
+
+    def render_all_rows(tree, words):
+        for word_data in words:
+            tree.insert("", "end", values=(word_data['word'], truncate(word_data['definition']),
+                                           star_rating(word_data['mastery'])))
+
+    words = [{'id': i, 'word': f"word{i}", 'definition': f"Definition number {i} of a sample word.",
+              'mastery': i % 6} for i in range(10000)]
+
+    root = tk.Tk()
+    root.geometry("900x600")
+
+    def bench(name, build):
+        frame = ttk.Frame(root)
+        frame.pack(fill=tk.BOTH, expand=True)
+        root.update()
+        start = time.perf_counter()
+        build(frame)
+        root.update()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<28} {elapsed * 1000:9.1f} ms  {count_widgets(frame) - 1:6} widgets")
+        frame.destroy()
+        root.update()
+
+    def build_grid(frame):
+        grid = VirtualCardGrid(frame)
+        grid.pack(fill=tk.BOTH, expand=True)
+        root.update_idletasks()
+        grid.set_items(words)
+
+    def build_list(frame):
+        word_list = VirtualWordList(frame)
+        word_list.pack(fill=tk.BOTH, expand=True)
+        root.update_idletasks()
+        word_list.set_items(words)
+
+    def scroll_grid(frame):
+        grid = VirtualCardGrid(frame)
+        grid.pack(fill=tk.BOTH, expand=True)
+        root.update_idletasks()
+        grid.set_items(words)
+        for _ in range(200):
+            grid.scroll(4)
+            root.update_idletasks()
+
+    print(f"Rendering {len(words)} words")
+    bench("virtual cards", build_grid)
+    bench("virtual cards + 200 scrolls", scroll_grid)
+    bench("virtual list", build_list)
+    bench("one frame per card", lambda frame: render_all_cards(frame, words))
+    bench("one Treeview row per word", lambda frame: render_all_rows(ttk.Treeview(frame), words))
+    root.destroy()
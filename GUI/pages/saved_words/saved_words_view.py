@@ -1,11 +1,28 @@
 import tkinter as tk
 from tkinter import messagebox, Scrollbar, Label, Entry, Button, Listbox
 
+SEARCH_DELAY_MS = 150
+PAGE_SIZE = 100
+# Rows kept in the Listbox, pages beyond this are dropped from the far end
+WINDOW_SIZE = PAGE_SIZE * 3
+# Load the next page once the view is this many rows from the edge of the window
+LOAD_MARGIN = PAGE_SIZE // 2
+
 class SavedWordsInterface(tk.Toplevel):
     def __init__(self, parent, word_db):
         super().__init__(parent)
         self.parent = parent
         self.word_db = word_db
+        self._search_job = None
+        self._check_job = None
+        
+        # Rows currently in the Listbox, a window onto the full result set
+        self.word_items = []
+        self.query = ""
+        self.window_offset = 0
+        self.total_rows = 0
+        self.has_older = False
+        self.has_newer = False
         
         self.title("Saved Words")
         self.geometry("500x400")
@@ -21,8 +38,7 @@ class SavedWordsInterface(tk.Toplevel):
         self.create_button_frame()
         
         # Load initial data
-        self.word_items = self.word_db.get_saved_words()
-        self.update_word_list(self.word_items)
+        self.refresh_list()
     
     def create_search_frame(self):
         search_frame = tk.Frame(self)
@@ -31,6 +47,7 @@ class SavedWordsInterface(tk.Toplevel):
         Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
         self.search_entry = Entry(search_frame, width=20)
         self.search_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self.search_entry.bind("<KeyRelease>", self.on_search_typed)
         
         search_button = Button(search_frame, text="Search", command=self.search_words)
         search_button.pack(side=tk.LEFT, padx=5)
@@ -39,12 +56,12 @@ class SavedWordsInterface(tk.Toplevel):
         list_frame = tk.Frame(self)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        scrollbar = Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # The scrollbar spans the full result set, not just the rows in the Listbox
+        self.scrollbar = Scrollbar(list_frame, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.word_listbox = Listbox(list_frame, yscrollcommand=scrollbar.set, font=("Arial", 12))
+        self.word_listbox = Listbox(list_frame, yscrollcommand=self.on_list_scrolled, font=("Arial", 12))
         self.word_listbox.pack(fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.word_listbox.yview)
     
     def create_button_frame(self):
         button_frame = tk.Frame(self)
@@ -59,14 +76,15 @@ class SavedWordsInterface(tk.Toplevel):
         refresh_button = Button(button_frame, text="Refresh", command=self.refresh_list)
         refresh_button.pack(side=tk.LEFT, padx=5)
     
+    def on_search_typed(self, event=None):
+        """Search as the user types, once typing pauses"""
+        if self._search_job:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DELAY_MS, self.search_words)
+    
     def search_words(self):
-        query = self.search_entry.get().strip()
-        if query:
-            words = self.word_db.search_words(query)
-        else:
-            words = self.word_db.get_saved_words()
-        
-        self.update_word_list(words)
+        self._search_job = None
+        self.load_words(self.search_entry.get().strip())
     
     def delete_selected_word(self):
         selection = self.word_listbox.curselection()
@@ -76,27 +94,160 @@ class SavedWordsInterface(tk.Toplevel):
             
             if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this word?"):
                 self.word_db.delete_word(word_id)
-                self.refresh_list()
+                self.word_listbox.delete(index)
+                del self.word_items[index]
+                self.total_rows = max(0, self.total_rows - 1)
+                self.schedule_window_check()
     
     def toggle_favorite(self):
         selection = self.word_listbox.curselection()
         if selection:
             index = selection[0]
-            word_id = self.word_items[index][0]
+            word_id, word_text, lang, date, favorite = self.word_items[index]
             
             self.word_db.toggle_favorite(word_id)
-            self.refresh_list()
+            self.word_items[index] = (word_id, word_text, lang, date, 0 if favorite else 1)
+            self.word_listbox.delete(index)
+            self.word_listbox.insert(index, self.format_word(self.word_items[index]))
+            self.word_listbox.selection_set(index)
     
     def refresh_list(self):
-        self.word_items = self.word_db.get_saved_words()
-        self.update_word_list(self.word_items)
+        self.load_words(self.search_entry.get().strip())
+    
+    def load_words(self, query=""):
+        """Reset the window to the first page of saved words or search results"""
+        self.query = query
+        self.window_offset = 0
+        self.has_newer = False
+        
+        if query:
+            words = self.word_db.search_words(query, PAGE_SIZE)
+            self.total_rows = self.word_db.count_search_results(query)
+        else:
+            words = self.word_db.get_words_page(limit=PAGE_SIZE)
+            self.total_rows = self.word_db.count_words()
+        
+        self.has_older = len(words) == PAGE_SIZE
+        self.update_word_list(words)
+        self.word_listbox.yview_moveto(0)
+    
+    def fetch_older(self):
+        """Fetch the page after the last row in the window"""
+        if self.query:
+            return self.word_db.search_words(self.query, PAGE_SIZE, self.window_offset + len(self.word_items))
+        
+        last = self.word_items[-1]
+        return self.word_db.get_words_page((last[3], last[0]), "older", PAGE_SIZE)
+    
+    def fetch_newer(self):
+        """Fetch the page before the first row in the window"""
+        if self.query:
+            offset = max(0, self.window_offset - PAGE_SIZE)
+            return self.word_db.search_words(self.query, self.window_offset - offset, offset)
+        
+        first = self.word_items[0]
+        return self.word_db.get_words_page((first[3], first[0]), "newer", PAGE_SIZE)
+    
+    def jump_to(self, row):
+        """Move the window to a row of the full result set, for scrollbar drags past the window"""
+        offset = max(0, min(row - LOAD_MARGIN, self.total_rows - PAGE_SIZE))
+        if self.query:
+            words = self.word_db.search_words(self.query, PAGE_SIZE, offset)
+        else:
+            words = self.word_db.get_saved_words(PAGE_SIZE, offset)
+        
+        self.window_offset = offset
+        self.has_newer = offset > 0
+        self.has_older = len(words) == PAGE_SIZE
+        self.update_word_list(words)
+        self.word_listbox.yview(row - offset)
+    
+    def on_scrollbar(self, action, *args):
+        if action != "moveto":
+            self.word_listbox.yview(action, *args)
+            return
+        
+        total = max(self.total_rows, self.window_offset + len(self.word_items), 1)
+        row = int(float(args[0]) * total)
+        if self.window_offset <= row < self.window_offset + len(self.word_items):
+            self.word_listbox.yview(row - self.window_offset)
+        else:
+            self.jump_to(row)
+    
+    def on_list_scrolled(self, first, last):
+        # Map the Listbox fractions of the window onto the full result set
+        rows = len(self.word_items)
+        total = max(self.total_rows, self.window_offset + rows, 1)
+        self.scrollbar.set((self.window_offset + float(first) * rows) / total,
+                           (self.window_offset + float(last) * rows) / total)
+        self.schedule_window_check()
+    
+    def schedule_window_check(self):
+        # The Listbox calls yscrollcommand while it redraws, so the window is
+        # changed afterwards rather than from inside the callback
+        if self._check_job is None:
+            self._check_job = self.after_idle(self.check_window)
+    
+    def check_window(self):
+        """Load a page when the view gets close to either edge of the window"""
+        self._check_job = None
+        if not self.word_items:
+            return
+        
+        top = self.word_listbox.nearest(0)
+        bottom = self.word_listbox.nearest(self.word_listbox.winfo_height())
+        
+        if self.has_older and bottom >= len(self.word_items) - LOAD_MARGIN:
+            self.load_older()
+        elif self.has_newer and top < LOAD_MARGIN:
+            self.load_newer()
+    
+    def load_older(self):
+        words = self.fetch_older()
+        self.has_older = len(words) == PAGE_SIZE
+        if not words:
+            return
+        
+        self.word_items.extend(words)
+        self.word_listbox.insert(tk.END, *[self.format_word(word) for word in words])
+        
+        excess = len(self.word_items) - WINDOW_SIZE
+        if excess > 0:
+            top = self.word_listbox.nearest(0)
+            self.word_listbox.delete(0, excess - 1)
+            del self.word_items[:excess]
+            self.window_offset += excess
+            self.has_newer = True
+            self.word_listbox.yview(max(0, top - excess))
+    
+    def load_newer(self):
+        words = self.fetch_newer()
+        if self.query:
+            self.has_newer = self.window_offset - len(words) > 0
+        else:
+            self.has_newer = len(words) == PAGE_SIZE
+        if not words:
+            return
+        
+        top = self.word_listbox.nearest(0)
+        self.word_items[:0] = words
+        self.word_listbox.insert(0, *[self.format_word(word) for word in words])
+        self.window_offset = max(0, self.window_offset - len(words))
+        self.word_listbox.yview(top + len(words))
+        
+        if len(self.word_items) > WINDOW_SIZE:
+            self.word_listbox.delete(WINDOW_SIZE, tk.END)
+            del self.word_items[WINDOW_SIZE:]
+            self.has_older = True
+    
+    def format_word(self, word_item):
+        word_id, word_text, lang, date, favorite = word_item
+        star = "★" if favorite else "☆"
+        return f"{star} {word_text} ({lang})"
     
     def update_word_list(self, words):
         self.word_listbox.delete(0, tk.END)
-        self.word_items = words
+        self.word_items = list(words)
         
-        for word_item in self.word_items:
-            word_id, word_text, lang, date, favorite = word_item
-            star = "★" if favorite else "☆"
-            display_text = f"{star} {word_text} ({lang})"
-            self.word_listbox.insert(tk.END, display_text)
\ No newline at end of file
+        if self.word_items:
+            self.word_listbox.insert(tk.END, *[self.format_word(word) for word in self.word_items])
@@ -0,0 +1,137 @@
+import tkinter as tk
+from tkinter import ttk
+from GUI.common.app_theme import AppTheme
+from util.services.vocabulary_service import GRADE_AGAIN, GRADE_HARD, GRADE_GOOD, GRADE_EASY
+
+GRADE_BUTTONS = (
+    ("Again", GRADE_AGAIN),
+    ("Hard", GRADE_HARD),
+    ("Good", GRADE_GOOD),
+    ("Easy", GRADE_EASY)
+)
+
+class StudySessionInterface(tk.Toplevel):
+    """Flashcard review of a list of cards
+
+    Each card shows the word, the answer reveals its definitions and the grade
+    is stored through the vocabulary service. Cards graded Again come back at
+    the end of the session.
+    """
+    def __init__(self, parent, vocabulary_service, cards, dictionary_service=None, scheduler=None):
+        super().__init__(parent)
+        self.parent = parent
+        self.vocabulary_service = vocabulary_service
+        self.dictionary_service = dictionary_service
+        self.scheduler = scheduler
+        # One answer lookup per window, the key is dropped when the window closes
+        self.answer_key = f"study.answer.{id(self)}"
+        self.cards = list(cards)
+        self.position = 0
+        self.reviewed = 0
+
+        self.title("Study Session")
+        self.geometry("500x400")
+        self.minsize(400, 300)
+
+        self.progress_label = ttk.Label(self, font=AppTheme.SMALL_FONT)
+        self.progress_label.pack(pady=(10, 0))
+
+        self.word_label = ttk.Label(self, font=("Segoe UI", 20, "bold"))
+        self.word_label.pack(pady=(30, 5))
+
+        self.language_label = ttk.Label(self, font=AppTheme.SMALL_FONT)
+        self.language_label.pack()
+
+        self.answer_text = tk.Text(self, wrap=tk.WORD, height=8, font=AppTheme.BODY_FONT)
+        self.answer_text.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+
+        self.button_frame = ttk.Frame(self)
+        self.button_frame.pack(fill=tk.X, padx=20, pady=10)
+
+        self.show_button = ttk.Button(self.button_frame, text="Show Answer", command=self.show_answer)
+
+        self.grade_buttons = [
+            ttk.Button(self.button_frame, text=text, command=lambda g=grade: self.grade_card(g))
+            for text, grade in GRADE_BUTTONS
+        ]
+
+        self.bind("<Destroy>", self._on_destroy, add="+")
+        self.show_card()
+
+    def _on_destroy(self, event):
+        # Only the Toplevel itself, not its child widgets
+        if event.widget is self and self.scheduler:
+            self.scheduler.discard(self.answer_key)
+
+    def current_card(self):
+        return self.cards[self.position] if self.position < len(self.cards) else None
+
+    def show_card(self):
+        # A definition still loading belongs to the previous card
+        if self.scheduler:
+            self.scheduler.cancel(self.answer_key)
+        card = self.current_card()
+        self._set_answer("")
+        for button in self.grade_buttons:
+            button.pack_forget()
+
+        if card is None:
+            self.progress_label.config(text=f"Reviewed {self.reviewed} cards")
+            self.word_label.config(text="Session complete")
+            self.language_label.config(text="")
+            self.show_button.config(text="Close", command=self.destroy)
+            self.show_button.pack(fill=tk.X)
+            return
+
+        self.progress_label.config(text=f"Card {self.position + 1} of {len(self.cards)}")
+        self.word_label.config(text=card['word'])
+        self.language_label.config(text=card['source_language'] or "")
+        self.show_button.pack(fill=tk.X)
+
+    def show_answer(self):
+        card = self.current_card()
+        self.show_button.pack_forget()
+        for button in self.grade_buttons:
+            button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+
+        if self.dictionary_service is None:
+            self._set_answer("Grade how well you remembered the meaning.")
+            return
+
+        self._set_answer("Loading...")
+        language = card['source_language'] or "English"
+        if self.scheduler:
+            self.scheduler.submit(
+                self.answer_key,
+                self.dictionary_service.get_word_data, card['word'], language,
+                on_done=self.show_word_data
+            )
+        else:
+            self.show_word_data(self.dictionary_service.get_word_data(card['word'], language))
+
+    def show_word_data(self, word_data):
+        if not self.winfo_exists():
+            return
+
+        definitions = word_data.get("definitions") or []
+        if definitions:
+            self._set_answer("\n".join(f"{i}. {definition}" for i, definition in enumerate(definitions[:5], 1)))
+        else:
+            self._set_answer(word_data.get("error", "No definitions found."))
+
+    def grade_card(self, grade):
+        card = self.current_card()
+        self.vocabulary_service.record_review(card, grade)
+        self.reviewed += 1
+
+        if grade < GRADE_HARD:
+            self.cards.append(dict(card))
+
+        self.position += 1
+        self.show_card()
+
+    def _set_answer(self, text):
+        self.answer_text.config(state=tk.NORMAL)
+        self.answer_text.delete(1.0, tk.END)
+        self.answer_text.insert(tk.END, text)
+        self.answer_text.config(state=tk.DISABLED)
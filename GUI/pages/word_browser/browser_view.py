@@ -4,9 +4,13 @@ import webbrowser
 import urllib.parse
 
 class BrowserInterface(tk.Toplevel):
-    def __init__(self, parent, initial_word=None):
+    def __init__(self, parent, initial_word=None, dictionary_service=None, scheduler=None):
         super().__init__(parent)
         self.parent = parent
+        self.dictionary_service = dictionary_service
+        self.scheduler = scheduler
+        # One search per window, the key is dropped when the window closes
+        self.search_key = f"browser.search.{id(self)}"
         self.title("Wiktionary Browser")
         self.geometry("800x600")
         self.minsize(600, 400)
@@ -100,17 +104,37 @@ class BrowserInterface(tk.Toplevel):
                                 command=self.save_to_my_words)
         save_button.pack(side=tk.RIGHT, padx=5)
         
+        self.bind("<Destroy>", self._on_destroy, add="+")
+        
         if initial_word:
             self.search_word()
     
+    def _on_destroy(self, event):
+        # Only the Toplevel itself, not its child widgets
+        if event.widget is self and self.scheduler:
+            self.scheduler.discard(self.search_key)
+    
     def search_word(self, event=None):
         word = self.search_var.get().strip()
         if not word:
             return
             
-        from util.services.wiktionary_service import WiktionaryService
-        service = WiktionaryService()
-        word_data = service.get_word_data(word)
+        if self.dictionary_service is None:
+            from util.services.wiktionary_service import WiktionaryService
+            self.dictionary_service = WiktionaryService()
+        
+        if self.scheduler:
+            self.scheduler.submit(
+                self.search_key,
+                self.dictionary_service.get_word_data, word,
+                on_done=self.show_word_data
+            )
+        else:
+            self.show_word_data(self.dictionary_service.get_word_data(word))
+    
+    def show_word_data(self, word_data):
+        if not self.winfo_exists():
+            return
         
         self.update_definition_tab(word_data)
         self.update_etymology_tab(word_data)
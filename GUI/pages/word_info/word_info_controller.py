@@ -6,8 +6,9 @@ from GUI.pages.word_info.word_info_model import WordInfoModel, DatabaseHandler
 from GUI.pages.word_info.word_info_view import WordInfoView
 
 class WordInfoController:
-    def __init__(self, parent, word, source_lang="English"):
-        self.model = WordInfoModel(word, source_lang)
+    def __init__(self, parent, word, source_lang="English", dictionary_service=None, scheduler=None):
+        self.model = WordInfoModel(word, source_lang, dictionary_service)
+        self.scheduler = scheduler
         self.view = WordInfoView(parent)
         self.db_handler = DatabaseHandler()
         
@@ -35,12 +36,20 @@ class WordInfoController:
         self.view.etym_text.insert(tk.END, f"Loading etymology for '{self.model.word}'...\n\n")
         self.view.examples_text.insert(tk.END, f"Loading examples for '{self.model.word}'...\n\n")
         
-        self.view.after(500, self.update_view)
+        if self.scheduler:
+            self.scheduler.submit(None, self.model.fetch_data, on_done=lambda model: self.update_view())
+        else:
+            self.view.after(500, self.fetch_and_update_view)
+    
+    def fetch_and_update_view(self):
+        self.model.fetch_data()
+        self.update_view()
     
     def update_view(self):
         """Update UI with word data"""
-        # TODO - Make async call to fetch data
-        self.model.fetch_data()
+        # The popup closes itself on focus loss, possibly before the lookup finished
+        if not self.view.winfo_exists():
+            return
         
         for text_widget in [self.view.def_text, self.view.etym_text, self.view.examples_text]:
             text_widget.delete(1.0, tk.END)
@@ -1,14 +1,26 @@
 class WordInfoModel:
     """This class is responsible for managing the data of a word info window"""
-    def __init__(self, word, source_lang="English"):
+    def __init__(self, word, source_lang="English", dictionary_service=None):
         self.word = word
         self.source_lang = source_lang
+        self.dictionary_service = dictionary_service
         self.definitions = []
         self.etymology = ""
         self.examples = []
 
     def fetch_data(self):
-        # TODO - Implement actual data fetching
+        if self.dictionary_service:
+            word_data = self.dictionary_service.get_word_data(self.word)
+            if "error" in word_data:
+                self.definitions = [word_data["error"]]
+                self.etymology = ""
+                self.examples = []
+            else:
+                self.definitions = word_data.get("definitions", [])
+                self.etymology = word_data.get("etymology", "")
+                self.examples = word_data.get("examples", [])
+            return self
+        
         self.definitions = [
             "This is a placeholder definition.",
             "In a real implementation, this would show actual word data."
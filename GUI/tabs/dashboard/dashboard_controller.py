@@ -1,22 +1,26 @@
-import threading
+import time
+from data.database_manager import REVIEW_DUE_CAP
 
 class DashboardController:
-    def __init__(self, view, db_manager):
+    def __init__(self, view, db_manager, scheduler):
         self.view = view
         self.view.set_controller(self)
         self.db_manager = db_manager
+        self.scheduler = scheduler
         
         self.load_dashboard_data()
     
     def load_dashboard_data(self):
-        threading.Thread(target=self._fetch_dashboard_data, daemon=True).start()
+        self.scheduler.submit(
+            "dashboard.statistics",
+            self._get_vocabulary_statistics,
+            on_done=self.view.update_statistics,
+            on_error=lambda e: print(f"Dashboard data error: {e}")
+        )
     
-    def _fetch_dashboard_data(self):
-        try:
-            stats = self._get_vocabulary_statistics()
-            self.view.after(0, lambda: self.view.update_statistics(stats))
-        except Exception as e:
-            self.view.after(0, lambda: print(f"Dashboard data error: {e}"))
+    def refresh(self):
+        """Reload the statistics, called on every switch to the tab"""
+        self.load_dashboard_data()
     
     def _get_vocabulary_statistics(self):
         stats = {
@@ -29,11 +33,17 @@ class DashboardController:
         }
         
         if self.db_manager:
-            # TODO - get data from database
-            try:
-                word_count = self.db_manager.count_words()
-                stats["total_words"] = word_count
-            except:
-                pass
+            # Precomputed counters, cheap enough to read on every tab switch
+            counters = self.db_manager.get_statistics(time.time())
+            streak = counters["streak"]
+            review_due = counters["review_due"]
+            
+            stats["total_words"] = counters["total_words"]
+            stats["words_to_learn"] = counters["new_words"]
+            stats["learning_streak"] = f"{streak} day{'s' if streak != 1 else ''}"
+            stats["words_mastered"] = counters["mastered"]
+            stats["review_due"] = f"{REVIEW_DUE_CAP}+" if review_due > REVIEW_DUE_CAP else review_due
+            if counters["last_activity"]:
+                stats["last_activity"] = counters["last_activity"][:16]
                 
-        return stats
\ No newline at end of file
+        return stats
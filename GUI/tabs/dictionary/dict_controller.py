@@ -1,20 +1,26 @@
-import threading
 import webbrowser
 import urllib.parse
 
+SUGGESTION_LIMIT = 10
+NETWORK_SUGGESTION_DELAY_MS = 350
+
 class DictionaryController:
-    def __init__(self, view, wiktionary_service, db_manager):
+    def __init__(self, view, wiktionary_service, db_manager, scheduler, autocomplete=None):
         """Initialize the dictionary controller
         
         Args:
             view: The dictionary tab view
             wiktionary_service: Service for dictionary lookups
             db_manager: Database manager for saving words
+            scheduler: TaskScheduler running lookups in the background
+            autocomplete: Local PrefixIndex used for suggestions
         """
         self.view = view
         self.view.set_controller(self)
         self.wiktionary_service = wiktionary_service
         self.db_manager = db_manager
+        self.scheduler = scheduler
+        self.autocomplete = autocomplete
         self.current_word_data = None
     
     def lookup_word(self):
@@ -26,26 +32,19 @@ class DictionaryController:
         # Show loading state
         self.view.show_loading()
         
-        # Perform lookup in background thread
-        threading.Thread(
-            target=self._background_lookup,
-            args=(word,),
-            daemon=True
-        ).start()
-    
-    def _background_lookup(self, word):
-        """Perform dictionary lookup in background thread"""
-        try:
-            word_data = self.wiktionary_service.get_word_data(word)
-            
-            # Update UI in main thread
-            self.view.after(0, lambda: self._update_ui_with_results(word_data))
-        except Exception as e:
-            self.view.after(0, lambda: self._handle_lookup_error(str(e)))
+        # A newer lookup supersedes one still in flight
+        self.scheduler.submit(
+            "dictionary.lookup",
+            self.wiktionary_service.get_word_data, word,
+            on_done=lambda word_data: self._update_ui_with_results(word, word_data),
+            on_error=lambda e: self._handle_lookup_error(str(e))
+        )
     
-    def _update_ui_with_results(self, word_data):
+    def _update_ui_with_results(self, word, word_data):
         """Update UI with lookup results"""
         self.current_word_data = word_data
+        if self.autocomplete and "error" not in word_data:
+            self.autocomplete.record_use(word)
         self.view.display_word_info(word_data)
     
     def _handle_lookup_error(self, error_message):
@@ -60,22 +59,32 @@ class DictionaryController:
         self.view.display_word_info(error_data)
     
     def on_search_text_changed(self, text):
-        """Handle changes to the search text for suggestions"""
-        if len(text) >= 2 and self.wiktionary_service:
-            threading.Thread(
-                target=self._fetch_suggestions,
-                args=(text,),
-                daemon=True
-            ).start()
+        """Show local suggestions at once, falling back to the network after a pause in typing"""
+        self.scheduler.cancel("dictionary.suggestions")
+        if len(text) < 2:
+            return
+        
+        suggestions = self.autocomplete.complete(text, SUGGESTION_LIMIT) if self.autocomplete else []
+        self.view.update_suggestions(suggestions)
+        
+        if len(suggestions) < SUGGESTION_LIMIT and self.wiktionary_service:
+            # Suggestions are best effort, so errors are ignored
+            self.scheduler.submit(
+                "dictionary.suggestions",
+                self.wiktionary_service.search_similar_words, text, SUGGESTION_LIMIT,
+                on_done=lambda remote: self._merge_suggestions(suggestions, remote),
+                on_error=lambda e: None,
+                delay_ms=NETWORK_SUGGESTION_DELAY_MS
+            )
     
-    def _fetch_suggestions(self, prefix):
-        """Fetch word suggestions in background thread"""
-        try:
-            suggestions = self.wiktionary_service.search_similar_words(prefix)
-            self.view.after(0, lambda: self.view.update_suggestions(suggestions))
-        except Exception:
-            # Silently fail for suggestions
-            pass
+    def _merge_suggestions(self, local_suggestions, remote):
+        seen = {word.casefold() for word in local_suggestions}
+        merged = list(local_suggestions)
+        for word in remote:
+            if word.casefold() not in seen:
+                seen.add(word.casefold())
+                merged.append(word)
+        self.view.update_suggestions(merged[:SUGGESTION_LIMIT])
     
     def on_suggestion_selected(self, word):
         """Handle selection of a suggestion"""
@@ -96,6 +105,8 @@ class DictionaryController:
         # We should have a proper method in the main controller for this
         # For now, we'll just call through to the database directly
         result = self.db_manager.save_word(word, "English")  # Default language
+        if self.autocomplete:
+            self.autocomplete.record_use(word)
         
         # Ideally we would show feedback to the user
         # We could expose a method on the main controller to show a message
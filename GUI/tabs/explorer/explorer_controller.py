@@ -1,11 +1,11 @@
-import threading
 from GUI.common.app_theme import AppTheme
 
 class ExplorerController:
-    def __init__(self, view, word_service, dictionary_controller=None):
+    def __init__(self, view, word_service, scheduler, dictionary_controller=None):
         self.view = view
         self.view.set_controller(self)
         self.word_service = word_service
+        self.scheduler = scheduler
         self.dictionary_controller = dictionary_controller
         self.current_word = None
         self.current_view_type = "Word Network"
@@ -18,38 +18,32 @@ class ExplorerController:
         self.current_word = word
         self.current_view_type = self.view.get_current_view_type()
         
-        threading.Thread(
-            target=self._fetch_word_data,
-            args=(word, self.current_view_type),
-            daemon=True
-        ).start()
+        self._schedule_fetch(word, self.current_view_type)
     
     def change_visualization_type(self, view_type):
         if self.current_word and view_type != self.current_view_type:
             self.current_view_type = view_type
             self.view.update_visualization_title(view_type)
             
-            threading.Thread(
-                target=self._fetch_word_data,
-                args=(self.current_word, view_type),
-                daemon=True
-            ).start()
+            self._schedule_fetch(self.current_word, view_type)
+    
+    def _schedule_fetch(self, word, view_type):
+        self.scheduler.submit(
+            "explorer.visualization",
+            self._fetch_word_data, word, view_type,
+            on_done=lambda data: self._update_visualization(view_type, data),
+            on_error=lambda e: self._handle_error(str(e))
+        )
     
     def _fetch_word_data(self, word, view_type):
-        try:
-            if view_type == "Word Network":
-                data = self._generate_network_data(word)
-            elif view_type == "Etymology Tree":
-                data = self._generate_etymology_data(word)
-            elif view_type == "Word Family":
-                data = self._generate_family_data(word)
-            else:  # Semantic Field
-                data = self._generate_semantic_data(word)
-            
-            self.view.after(0, lambda: self._update_visualization(view_type, data))
-                
-        except Exception as e:
-            self.view.after(0, lambda: self._handle_error(str(e)))
+        if view_type == "Word Network":
+            return self._generate_network_data(word)
+        elif view_type == "Etymology Tree":
+            return self._generate_etymology_data(word)
+        elif view_type == "Word Family":
+            return self._generate_family_data(word)
+        else:  # Semantic Field
+            return self._generate_semantic_data(word)
     
     def _update_visualization(self, view_type, data):
         if view_type == "Word Network":
@@ -1,19 +1,43 @@
-import re
+import threading
 import tkinter as tk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
+from util.services import text_analysis
+from util.services.frequency_service import KnownWords
+from util.services.text_analysis import IncrementalAnalyzer
+
+UNKNOWN_WORDS_PAGE = 50
+# Live statistics refresh once typing pauses, larger edits are diffed off the Tk thread
+LIVE_STATS_DELAY_MS = 300
+INLINE_DIFF_CHARS = 20000
 
 class ReadingController:
-    def __init__(self, view, dictionary_controller, db_manager):
+    def __init__(self, view, dictionary_controller, db_manager, scheduler, frequency_service=None,
+                 language="English"):
         """Initialize the reading controller
             - view: The reading tab view
             - dictionary_controller: Dictionary controller for lookups
             - db_manager: Database manager for saving words
+            - scheduler: TaskScheduler for background work
+            - frequency_service: FrequencyService ranking words of the text's language
+            - language: Language of the reading text
         """
         self.view = view
         self.view.set_controller(self)
         self.dictionary_controller = dictionary_controller
         self.db_manager = db_manager
+        self.scheduler = scheduler
+        self.frequency_service = frequency_service
+        self.language = language
+        self.known_words = KnownWords(db_manager) if db_manager else None
+        self.analyzer = IncrementalAnalyzer()
         self.unknown_words = []
+        self.unknown_shown = 0
+        self.cancel_event = None
+        self.edit_count = 0
+        self.vocabulary_version = None
+        self._refresh_job = None
+        
+        self._refresh_vocabulary()
     
     def import_text(self):
         file_path = filedialog.askopenfilename(
@@ -32,61 +56,190 @@ class ReadingController:
             print(f"Error importing file: {e}")
     
     def clear_text(self):
+        self.cancel_analysis()
         self.view.set_text("")
-        self.view.update_statistics({"word_count": 0, "unique_words": 0, "reading_level": "N/A"})
-        self.view.update_unknown_words([])
-        self.unknown_words = []
+        # Nothing is left to count, pending and in-flight edits are dropped with the old analyzer
+        self.analyzer = IncrementalAnalyzer(self.analyzer.table, self.analyzer.known)
+        self._show_live_stats()
+    
+    def on_text_edited(self, old_text, new_text):
+        """Record an edit of the reading text, given the touched paragraphs before and after it"""
+        self.analyzer.record_edit(old_text, new_text)
+        self.edit_count += 1
+        if self._refresh_job is not None:
+            self.view.after_cancel(self._refresh_job)
+        self._refresh_job = self.view.after(LIVE_STATS_DELAY_MS, self._refresh_live_stats)
+    
+    def _refresh_live_stats(self):
+        self._refresh_job = None
+        analyzer = self.analyzer
+        if analyzer.pending_chars() <= INLINE_DIFF_CHARS:
+            analyzer.apply(analyzer.diff(analyzer.take_pending()))
+            self._show_live_stats()
+            return
+        
+        # Deltas add up in any order, so several of these may run at once
+        self.scheduler.submit(
+            None,
+            analyzer.diff, analyzer.take_pending(),
+            on_done=lambda delta: self._apply_live_delta(analyzer, delta)
+        )
+    
+    def _apply_live_delta(self, analyzer, delta):
+        # A full analysis or clearing the text may have replaced the analyzer
+        if analyzer is self.analyzer:
+            analyzer.apply(delta)
+            self._show_live_stats()
+    
+    def _show_live_stats(self):
+        if self.db_manager and self.db_manager.words_version != self.vocabulary_version:
+            self._refresh_vocabulary()
+        
+        self.view.update_statistics(self.analyzer.statistics())
+        self.unknown_shown = max(self.unknown_shown, UNKNOWN_WORDS_PAGE)
+        self.unknown_words = self.analyzer.unknown_words(self.unknown_shown)
+        self.unknown_shown = len(self.unknown_words)
+        self.view.update_unknown_words(self.unknown_words,
+                                       self.analyzer.unknown_count() - self.unknown_shown)
+    
+    def _refresh_vocabulary(self):
+        """Load the frequency table and known words in the background"""
+        self.scheduler.submit(
+            "reading.vocabulary",
+            self._load_vocabulary,
+            on_done=self._on_vocabulary_loaded
+        )
+    
+    def _load_vocabulary(self):
+        # Runs on a worker thread
+        version = self.db_manager.words_version if self.db_manager else None
+        table = self.frequency_service.get_table(self.language) if self.frequency_service else None
+        known = self.known_words.get() if self.known_words else frozenset()
+        return version, table, known
+    
+    def _on_vocabulary_loaded(self, result):
+        self.vocabulary_version, table, known = result
+        if table is not self.analyzer.table or known is not self.analyzer.known:
+            self.analyzer.set_vocabulary(table, known)
+            self._show_live_stats()
     
     def analyze_text(self):
-        """ Analyzes the reading text
+        """ Analyzes the reading text in the background
             Provides statistics such as:
             - word count
             - unique words in the text
             - reading level based on frequency
+            Clicking again while an analysis runs cancels it.
         """
-        text = self.view.get_text()
-        if not text.strip():
+        if self.cancel_event is not None:
+            self.cancel_analysis()
             return
         
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        word_count = len(words)
-        unique_words = len(set(words))
-        
-        # TODO - implement algorithm for comparing frequency of words to determine reading level
-        if word_count == 0:
-            reading_level = "N/A"
-        elif len([w for w in words if len(w) > 6]) / word_count > 0.2:
-            reading_level = "Advanced"
-        elif len([w for w in words if len(w) > 4]) / word_count > 0.3:
-            reading_level = "Intermediate"
-        else:
-            reading_level = "Beginner"
-        
-        stats = {
-            "word_count": word_count,
-            "unique_words": unique_words,
-            "reading_level": reading_level
-        }
-        self.view.update_statistics(stats)
+        text = self.view.get_text()
+        if not text or text.isspace():
+            return
         
-        # TODO - find unknown words (words not in the database)
-        unique_word_list = list(set(words))
-        unique_word_list.sort()
+        self.cancel_event = threading.Event()
+        self.view.show_analysis_progress(0, len(text))
+        self.scheduler.submit(
+            "reading.analyze",
+            self._run_analysis, text, self.cancel_event, self.edit_count,
+            on_done=self._on_analysis_done,
+            on_error=self._on_analysis_failed
+        )
+    
+    def cancel_analysis(self):
+        if self.cancel_event is None:
+            return
+        self.cancel_event.set()
+        self.cancel_event = None
+        self.scheduler.cancel("reading.analyze")
+        self.view.reset_analysis_progress()
+    
+    def _run_analysis(self, text, cancel_event, edit_count):
+        # Runs on a worker thread
+        stats = text_analysis.analyze(
+            text,
+            progress_callback=lambda processed, total: self._post_analysis_progress(cancel_event, processed, total),
+            cancel_event=cancel_event
+        )
+        if stats is None:
+            return None
         
-        # TODO - add "show more" than 20 unknown words
-        unknown_words = [word for word in unique_word_list if len(word) > 3][:20]
-        self.unknown_words = unknown_words
+        _, table, known = self._load_vocabulary()
+        analyzer = IncrementalAnalyzer(table, known)
+        analyzer.reset(stats.counts)
+        return analyzer, edit_count
+    
+    def _post_analysis_progress(self, cancel_event, processed, total):
+        self.scheduler.dispatcher.post(self._show_analysis_progress, cancel_event, processed, total,
+                                       key="reading.analyze_progress")
+    
+    def _show_analysis_progress(self, cancel_event, processed, total):
+        # Progress of a cancelled analysis can still be queued
+        if cancel_event is self.cancel_event:
+            self.view.show_analysis_progress(processed, total)
+    
+    def _on_analysis_done(self, result):
+        self.cancel_event = None
+        self.view.reset_analysis_progress()
+        if result is None:
+            return
         
-        self.view.update_unknown_words(unknown_words)
+        # Counts of a text edited since the analysis started would be stale,
+        # the live statistics already cover those edits
+        analyzer, edit_count = result
+        if edit_count == self.edit_count:
+            self.analyzer = analyzer
+        self.unknown_shown = 0
+        self._show_live_stats()
+    
+    def show_more_unknown_words(self):
+        """Show the next page of unknown words"""
+        shown = self.unknown_shown
+        self.unknown_words = self.analyzer.unknown_words(shown + UNKNOWN_WORDS_PAGE)
+        self.unknown_shown = len(self.unknown_words)
+        self.view.append_unknown_words(self.unknown_words[shown:],
+                                       self.analyzer.unknown_count() - self.unknown_shown)
+    
+    def _on_analysis_failed(self, error):
+        self.cancel_event = None
+        self.view.reset_analysis_progress()
+        messagebox.showerror("Error", f"Could not analyze text: {error}", parent=self.view)
     
     def add_all_unknown_words(self):
         """Add all unknown words to vocabulary"""
-        if not self.unknown_words or not self.db_manager:
+        if not self.analyzer.unknown_count() or not self.db_manager:
             return
         
-        for word in self.unknown_words:
-            self.db_manager.save_word(word, "English")
+        words = self.analyzer.unknown_words()
+        self.view.show_add_progress(0, len(words))
+        self.scheduler.submit(
+            "reading.add_all",
+            self.db_manager.save_words, words, self.language, self._post_add_progress,
+            on_done=self._on_words_added,
+            on_error=self._on_add_failed
+        )
+    
+    def _post_add_progress(self, processed, total):
+        # Runs on the worker thread, only the latest progress update reaches the UI
+        self.scheduler.dispatcher.post(self.view.show_add_progress, processed, total,
+                                       key="reading.add_progress")
+    
+    def _on_words_added(self, result):
+        self.view.reset_add_progress()
+        # They are saved words now, so no longer unknown
+        self._refresh_vocabulary()
+        messagebox.showinfo(
+            "Words Added",
+            f"Added {result['inserted']} words to your vocabulary "
+            f"({result['duplicates']} were already saved).",
+            parent=self.view
+        )
+    
+    def _on_add_failed(self, error):
+        self.view.reset_add_progress()
+        messagebox.showerror("Error", f"Could not add words: {error}", parent=self.view)
     
     def on_text_right_click(self, index, x, y):
         word = self._get_word_at_index(index)
@@ -24,6 +24,7 @@ class ReadingView(ttk.Frame):
         self.clear_button.config(command=self._on_clear)
         self.analyze_button.config(command=self._on_analyze)
         self.add_all_button.config(command=self._on_add_all)
+        self.show_more_button.config(command=self._on_show_more)
         
         self.reading_text.bind("<Button-3>", self._on_text_right_click)
     
@@ -60,6 +61,7 @@ class ReadingView(ttk.Frame):
             pady=10
         )
         self.reading_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._watch_text_edits()
         
         # Configure tags for highlighting
         self.reading_text.tag_configure("highlight", background="#FFEB3B")
@@ -102,9 +104,75 @@ class ReadingView(ttk.Frame):
         # Bind double-click on unknown words
         self.unknown_listbox.bind("<Double-Button-1>", self._on_unknown_word_double_click)
         
+        self.show_more_button = ttk.Button(unknown_frame, text="Show More")
+        
         self.add_all_button = ttk.Button(unknown_frame, text="Add All to Vocabulary")
         self.add_all_button.pack(fill=tk.X, padx=10, pady=(0, 10))
     
+    def _watch_text_edits(self):
+        """Route the Text widget command through _text_proxy to see every edit"""
+        widget = self.reading_text._w
+        self._text_command = widget + "_orig"
+        self.tk.call("rename", widget, self._text_command)
+        self.tk.createcommand(widget, self._text_proxy)
+    
+    def _text_proxy(self, *args):
+        """
+        Forward a Text widget command, reporting edits to the controller
+        
+        The lines an edit touches are read before and after it, so the
+        controller only re-tokenizes those paragraphs. Undo and redo change
+        the text inside Tk, so for them the whole text is compared.
+        
+        Tk's own bindings call the widget inside `catch`, e.g. to copy an empty
+        selection, but a TclError raised here would still be re-raised by
+        mainloop, so errors are swallowed like idlelib's WidgetRedirector does.
+        """
+        try:
+            if self.controller is None or not self._is_edit(args):
+                return self.tk.call(self._text_command, *args)
+            
+            start_line, end_line, line_count = self._edited_lines(args)
+            old_text = self._get_lines(start_line, end_line)
+            
+            result = self.tk.call(self._text_command, *args)
+        except tk.TclError:
+            return ""
+        
+        end_line += self._line_count() - line_count
+        self.controller.on_text_edited(old_text, self._get_lines(start_line, end_line))
+        return result
+    
+    def _is_edit(self, args):
+        return args[0] in ("insert", "delete", "replace") or args[:2] in (("edit", "undo"), ("edit", "redo"))
+    
+    def _edited_lines(self, args):
+        line_count = self._line_count()
+        if args[0] == "edit":
+            return 1, line_count, line_count
+        
+        # "end" is the line after the last one, edits there land on the last line
+        start_line = min(self._line_of(args[1]), line_count)
+        if args[0] == "insert":
+            end_line = start_line
+        elif args[0] == "replace":
+            end_line = self._line_of(args[2])
+        elif len(args) > 2:
+            end_line = max(self._line_of(index) for index in args[2:])
+        else:
+            # Deleting one character at the end of a line joins it with the next
+            end_line = start_line + 1
+        return start_line, min(max(end_line, start_line), line_count), line_count
+    
+    def _line_of(self, index):
+        return int(self.tk.call(self._text_command, "index", index).split(".")[0])
+    
+    def _line_count(self):
+        return self._line_of("end-1c")
+    
+    def _get_lines(self, start_line, end_line):
+        return self.tk.call(self._text_command, "get", f"{start_line}.0", f"{end_line}.0 lineend")
+    
     def get_text(self):
         """Get the current text content"""
         return self.reading_text.get("1.0", "end-1c")
@@ -120,11 +188,37 @@ class ReadingView(ttk.Frame):
         self.reading_stats["unique_words"].set(str(stats.get("unique_words", 0)))
         self.reading_stats["reading_level"].set(stats.get("reading_level", "N/A"))
     
-    def update_unknown_words(self, words):
+    def update_unknown_words(self, words, remaining=0):
         """Update the unknown words list"""
         self.unknown_listbox.delete(0, tk.END)
-        for word in words:
-            self.unknown_listbox.insert(tk.END, word)
+        self.append_unknown_words(words, remaining)
+    
+    def append_unknown_words(self, words, remaining=0):
+        """Add a page of unknown words, showing "Show More" while more remain"""
+        if words:
+            self.unknown_listbox.insert(tk.END, *words)
+        
+        if remaining:
+            self.show_more_button.config(text=f"Show More ({remaining} left)")
+            self.show_more_button.pack(fill=tk.X, padx=10, pady=(0, 5), before=self.add_all_button)
+        else:
+            self.show_more_button.pack_forget()
+    
+    def show_add_progress(self, processed, total):
+        """Show progress of adding words on the "Add All" button"""
+        progress = f"{processed}/{total}" if total else str(processed)
+        self.add_all_button.config(text=f"Adding... {progress}", state=tk.DISABLED)
+    
+    def reset_add_progress(self):
+        self.add_all_button.config(text="Add All to Vocabulary", state=tk.NORMAL)
+    
+    def show_analysis_progress(self, processed, total):
+        """Show analysis progress on the analyze button, which cancels while it runs"""
+        percent = int(processed * 100 / total) if total else 0
+        self.analyze_button.config(text=f"Cancel Analysis ({percent}%)")
+    
+    def reset_analysis_progress(self):
+        self.analyze_button.config(text="Analyze Text")
     
     def highlight_word(self, word, tag="highlight"):
         """Highlight all occurrences of a word"""
@@ -170,6 +264,11 @@ class ReadingView(ttk.Frame):
         if self.controller:
             self.controller.analyze_text()
     
+    def _on_show_more(self):
+        """Handle show more button click"""
+        if self.controller:
+            self.controller.show_more_unknown_words()
+    
     def _on_add_all(self):
         """Handle add all button click"""
         if self.controller:
@@ -1,20 +1,36 @@
 import tkinter as tk
 from tkinter import simpledialog, messagebox
+from GUI.pages.study_session.study_session_view import StudySessionInterface
+from util.services.vocabulary_service import VocabularyService
+
+PAGE_SIZE = 100
+STUDY_SESSION_SIZE = 20
+
+# Collections computed from saved_words rather than stored memberships
+SMART_COLLECTIONS = [
+    {'id': 'recent', 'name': 'Recently Added'},
+    {'id': 'favorites', 'name': 'Favorites'}
+]
 
 class VocabularyController:
-    def __init__(self, view, db_manager):
+    def __init__(self, view, db_manager, scheduler, dictionary_service=None):
         """
         Initialize the vocabulary controller
         
         Args:
             view: The vocabulary tab view
             db_manager: Database manager for vocabulary operations
+            scheduler: TaskScheduler used to load word pages in the background
+            dictionary_service: Used to show definitions during study sessions
         """
         self.view = view
         self.view.set_controller(self)
         self.db_manager = db_manager
+        self.scheduler = scheduler
+        self.dictionary_service = dictionary_service
+        self.vocabulary_service = VocabularyService(db_manager)
         self.current_collection_id = None
-        self.selected_word_ids = set()
+        self.next_cursor = None
         
         # Initial view type
         self.current_view_type = "cards"
@@ -23,42 +39,85 @@ class VocabularyController:
         self.load_collections()
     
     def load_collections(self):
-        """Load all collections from database"""
-        # This would fetch real data from your database
-        # For now, we'll use sample data
-        collections = [
-            {'id': 'recent', 'name': 'Recently Added', 'open': True},
-            {'id': 'favorites', 'name': 'Favorites'},
-            {'id': 'themes', 'name': 'By Theme'},
-            {'id': 'themes.travel', 'name': 'Travel', 'parent_id': 'themes'},
-            {'id': 'themes.academic', 'name': 'Academic', 'parent_id': 'themes'},
-            {'id': 'levels', 'name': 'By Level'},
-            {'id': 'levels.beginner', 'name': 'Beginner', 'parent_id': 'levels'},
-            {'id': 'levels.intermediate', 'name': 'Intermediate', 'parent_id': 'levels'},
-            {'id': 'levels.advanced', 'name': 'Advanced', 'parent_id': 'levels'}
-        ]
-        
+        """Load the top level of the collection tree, children load on expand"""
+        collections = SMART_COLLECTIONS + self._fetch_child_collections(None)
         self.view.populate_collections(collections)
     
+    def expand_collection(self, collection_id):
+        """Load the subcollections of an expanded collection"""
+        self.view.replace_children(collection_id, self._fetch_child_collections(int(collection_id)))
+    
+    def _fetch_child_collections(self, parent_id):
+        return [
+            {
+                'id': collection_id,
+                'name': name,
+                'word_count': word_count,
+                'has_children': child_count > 0
+            }
+            for collection_id, name, word_count, child_count in self.db_manager.get_child_collections(parent_id)
+        ]
+    
     def load_collection_words(self, collection_id):
-        """Load words for a specific collection"""
+        """Show the first page of a collection's words, later pages load on scroll"""
         self.current_collection_id = collection_id
+        self.next_cursor = None
+        
+        self.scheduler.submit(
+            "vocabulary.words",
+            self._fetch_words_page, collection_id, None,
+            on_done=self._show_first_page
+        )
+    
+    def load_more_words(self):
+        """Append the next page of the current collection"""
+        if self.current_collection_id is None or self.next_cursor is None:
+            return
+        
+        self.scheduler.submit(
+            "vocabulary.words",
+            self._fetch_words_page, self.current_collection_id, self.next_cursor,
+            on_done=self._show_next_page
+        )
+    
+    def _fetch_words_page(self, collection_id, cursor):
+        """Fetch a page of words, returns (words, cursor of the next page or None)"""
+        if collection_id == 'recent':
+            rows = self.db_manager.get_words_page(cursor, "older", PAGE_SIZE)
+            cursor_of = lambda row: (row[3], row[0])
+        elif collection_id == 'favorites':
+            rows = self.db_manager.get_favorites_page(cursor, PAGE_SIZE)
+            cursor_of = lambda row: (row[3], row[0])
+        else:
+            rows = self.db_manager.get_collection_words(int(collection_id), cursor, PAGE_SIZE)
+            cursor_of = lambda row: (row[5], row[0])
         
-        # This would fetch real data from your database
-        # For now, we'll use sample data
-        words_data = []
-        for i in range(1, 13):
-            words_data.append({
-                'id': f"{collection_id}.{i}",
-                'word': f"Word {i}",
-                'definition': f"This is a definition for word {i} in collection {collection_id}.",
-                'mastery': i % 6  # 0-5 mastery level
-            })
+        mastery = self.vocabulary_service.get_mastery(row[0] for row in rows)
+        words = [self._word_data(row, mastery.get(row[0], 0)) for row in rows]
+        next_cursor = cursor_of(rows[-1]) if len(rows) == PAGE_SIZE else None
+        return words, next_cursor
+    
+    def _word_data(self, row, mastery):
+        word_id, word, source_language, date_added = row[:4]
+        return {
+            'id': word_id,
+            'word': word,
+            'definition': f"{source_language}, added {str(date_added)[:10]}",
+            'mastery': mastery
+        }
+    
+    def _show_first_page(self, result):
+        words, self.next_cursor = result
+        has_more = self.next_cursor is not None
         
         if self.current_view_type == "cards":
-            self.view.display_words_as_cards(words_data)
+            self.view.display_words_as_cards(words, has_more)
         else:
-            self.view.display_words_as_list(words_data)
+            self.view.display_words_as_list(words, has_more)
+    
+    def _show_next_page(self, result):
+        words, self.next_cursor = result
+        self.view.append_words(words, self.next_cursor is not None)
     
     def change_view_type(self, view_type):
         """Change between cards and list view"""
@@ -68,81 +127,114 @@ class VocabularyController:
             if self.current_collection_id:
                 self.load_collection_words(self.current_collection_id)
     
+    def _is_smart_collection(self, collection_id):
+        return any(collection['id'] == collection_id for collection in SMART_COLLECTIONS)
+    
     def create_new_collection(self):
-        """Create a new word collection"""
+        """Create a new word collection inside the selected one, or at the top level"""
         collection_name = simpledialog.askstring(
-            "New Collection", 
+            "New Collection",
             "Enter collection name:",
             parent=self.view
         )
         
         if collection_name:
-            # This would save to your database
-            # For demo, we'll just refresh the collections
-            messagebox.showinfo(
-                "Collection Created",
-                f"Collection '{collection_name}' created successfully!"
-            )
-            self.load_collections()
+            parent_id = self.view.get_selected_collection_id()
+            if parent_id is None or self._is_smart_collection(parent_id):
+                self.db_manager.create_collection(collection_name)
+                self.load_collections()
+            else:
+                self.db_manager.create_collection(collection_name, int(parent_id))
+                self.expand_collection(parent_id)
+                self.view.collections_tree.item(parent_id, open=True)
     
     def edit_collection(self, collection_id):
         """Edit a collection name"""
-        # Get current name
-        for item_id in self.view.collections_tree.get_children():
-            if item_id == collection_id:
-                current_name = self.view.collections_tree.item(item_id, 'text')
-                break
-        else:
-            current_name = ""
+        if self._is_smart_collection(collection_id):
+            messagebox.showinfo("Edit Collection", "This collection can't be renamed", parent=self.view)
+            return
+        
+        current_name = self.view.get_collection_name(collection_id)
         
         new_name = simpledialog.askstring(
-            "Edit Collection", 
+            "Edit Collection",
             "Enter new collection name:",
             initialvalue=current_name,
             parent=self.view
         )
         
-        if new_name:
-            # This would update your database
-            # For demo, we'll just show a message
-            messagebox.showinfo(
-                "Collection Updated",
-                f"Collection renamed to '{new_name}'"
-            )
+        if new_name and new_name != current_name:
+            self.db_manager.rename_collection(int(collection_id), new_name)
+            self.view.rename_collection_node(collection_id, new_name)
     
     def delete_collection(self, collection_id):
         """Delete a collection"""
+        if self._is_smart_collection(collection_id):
+            messagebox.showinfo("Delete Collection", "This collection can't be deleted", parent=self.view)
+            return
+        
         confirm = messagebox.askyesno(
             "Confirm Delete",
-            "Are you sure you want to delete this collection?",
+            "Are you sure you want to delete this collection and its subcollections?",
             parent=self.view
         )
         
         if confirm:
-            # This would delete from your database
-            # For demo, we'll just refresh the collections
-            self.load_collections()
-    
-    def select_word(self, word_id):
-        """Select a word (toggle selection)"""
-        if word_id in self.selected_word_ids:
-            self.selected_word_ids.remove(word_id)
-        else:
-            self.selected_word_ids.add(word_id)
+            # Subcollections are deleted with it, so the shown one may be gone too
+            shown_deleted = self.current_collection_id is not None and \
+                self.view.is_in_subtree(self.current_collection_id, collection_id)
+            self.db_manager.delete_collection(int(collection_id))
+            self.view.remove_collection_node(collection_id)
+            
+            if shown_deleted:
+                self.scheduler.cancel("vocabulary.words")
+                self.current_collection_id = None
+                self.next_cursor = None
+                self.view.clear_words()
     
-    def start_study_session(self, word_ids):
-        """Start a study session with selected words"""
+    def get_collection_level(self, parent_id=None):
+        """Return the user collections directly under parent_id, None for the top level"""
+        return self._fetch_child_collections(parent_id)
+    
+    def add_selected_to_collection(self, collection_id):
+        """Add the selected words to a collection"""
+        word_ids = self.view.get_selected_word_ids()
         if not word_ids:
+            messagebox.showinfo("Add to Collection", "Select the words to add first", parent=self.view)
+            return
+        
+        added = self.db_manager.add_words_to_collection(collection_id, word_ids)
+        
+        node_id = str(collection_id)
+        word_count = self.view.get_collection_count(node_id)
+        if word_count is not None:
+            self.view.set_collection_count(node_id, word_count + added)
+        if self.current_collection_id == node_id and added:
+            self.load_collection_words(node_id)
+    
+    def start_study_session(self, word_ids=None):
+        """Study the selected words, or the cards that are due when none are selected"""
+        if word_ids:
+            cards = self.vocabulary_service.get_cards(int(word_id) for word_id in word_ids)
+        else:
+            cards = self.vocabulary_service.get_due_cards(STUDY_SESSION_SIZE)
+        
+        if not cards:
             messagebox.showinfo(
-                "No Words Selected",
-                "Please select words to study",
+                "Nothing to Study",
+                "No words are due for review",
                 parent=self.view
             )
             return
         
-        # This would launch your study session interface
-        messagebox.showinfo(
-            "Study Session",
-            f"Starting study session with {len(word_ids)} words",
-            parent=self.view
-        )
\ No newline at end of file
+        session = StudySessionInterface(
+            self.view, self.vocabulary_service, cards,
+            dictionary_service=self.dictionary_service,
+            scheduler=self.scheduler
+        )
+        session.bind("<Destroy>", self._on_study_session_closed, add="+")
+    
+    def _on_study_session_closed(self, event):
+        # Only the Toplevel itself, not its child widgets
+        if event.widget is event.widget.winfo_toplevel() and self.current_collection_id:
+            self.load_collection_words(self.current_collection_id)
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import StringVar, ttk
-from GUI.common.app_theme import AppTheme
+from GUI.common.virtual_grid import VirtualCardGrid, VirtualWordList
 
 class VocabularyView(ttk.Frame):
     def __init__(self, parent):
@@ -8,6 +8,8 @@ class VocabularyView(ttk.Frame):
         
         self.controller = None
         self.view_type_var = StringVar(value="cards")
+        self.collection_names = {}
+        self.collection_counts = {}
         
         self._create_collections_panel()
         self._create_word_display_panel()
@@ -18,10 +20,16 @@ class VocabularyView(ttk.Frame):
         
         # Connect event handlers
         self.collections_tree.bind("<<TreeviewSelect>>", self._on_collection_selected)
+        self.collections_tree.bind("<<TreeviewOpen>>", self._on_collection_opened)
+        self.cards_container.on_need_more = self._on_need_more_words
+        self.list_container.on_need_more = self._on_need_more_words
         self.new_collection_button.config(command=self._on_new_collection)
         self.edit_collection_button.config(command=self._on_edit_collection)
         self.delete_collection_button.config(command=self._on_delete_collection)
         self.study_button.config(command=self._on_study_selected)
+        self.add_to_collection_menu.config(
+            postcommand=lambda: self._fill_collection_menu(self.add_to_collection_menu)
+        )
         
         for rb in self.view_radio_buttons:
             rb.config(command=self._on_view_type_changed)
@@ -83,143 +91,136 @@ class VocabularyView(ttk.Frame):
         )
         self.study_button.pack(side=tk.RIGHT, padx=5)
         
-        self.cards_container = ttk.Frame(self.cards_frame)
-        self.cards_container.pack(fill=tk.BOTH, expand=True)
+        # Collection menu, rebuilt from the database each time it opens
+        self.add_to_collection_button = ttk.Menubutton(vocab_toolbar, text="Add to Collection")
+        self.add_to_collection_menu = tk.Menu(self.add_to_collection_button, tearoff=0)
+        self.add_to_collection_button.config(menu=self.add_to_collection_menu)
+        self.add_to_collection_button.pack(side=tk.RIGHT, padx=5)
         
-        for i in range(3):
-            self.cards_container.rowconfigure(i, weight=1)
-        for i in range(4):
-            self.cards_container.columnconfigure(i, weight=1)
+        # Both renderers only create widgets for the words in view
+        self.cards_container = VirtualCardGrid(self.cards_frame)
+        self.cards_container.pack(fill=tk.BOTH, expand=True)
 
-        self.list_container = ttk.Frame(self.cards_frame)
-        
-        list_columns = ("word", "definition", "mastery")
-        self.word_list = ttk.Treeview(
-            self.list_container, 
-            columns=list_columns,
-            show="headings",
-            selectmode="extended"
-        )
-        self.word_list.heading("word", text="Word")
-        self.word_list.heading("definition", text="Definition")
-        self.word_list.heading("mastery", text="Mastery")
-        
-        self.word_list.column("word", width=100)
-        self.word_list.column("definition", width=300)
-        self.word_list.column("mastery", width=80)
-        
-        self.word_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        list_scrollbar = ttk.Scrollbar(
-            self.list_container, 
-            orient="vertical", 
-            command=self.word_list.yview
-        )
-        list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.word_list.config(yscrollcommand=list_scrollbar.set)
+        self.list_container = VirtualWordList(self.cards_frame)
+        self.word_list = self.list_container.tree
     
     def populate_collections(self, collections_data):
         """Populate the collections tree with data"""
         for item in self.collections_tree.get_children():
             self.collections_tree.delete(item)
+        self.collection_names.clear()
+        self.collection_counts.clear()
+        
+        self.insert_collections("", collections_data)
+    
+    def insert_collections(self, parent_id, collections_data):
+        """
+        Insert collection nodes under a parent node
         
+        Nodes with 'has_children' get a placeholder child, so they show an
+        expand arrow before their children are loaded.
+        """
         for collection in collections_data:
-            if 'parent_id' in collection and collection['parent_id']:
-                self.collections_tree.insert(
-                    collection['parent_id'], 
-                    "end", 
-                    text=collection['name'],
-                    iid=collection['id'],
-                    open=collection.get('open', False)
-                )
-            else:
-                self.collections_tree.insert(
-                    "", 
-                    "end", 
-                    text=collection['name'],
-                    iid=collection['id'],
-                    open=collection.get('open', False)
-                )
+            iid = str(collection['id'])
+            self.collection_names[iid] = collection['name']
+            self.collection_counts[iid] = collection.get('word_count')
+            
+            self.collections_tree.insert(
+                collection.get('parent_id') or parent_id,
+                "end",
+                text=self._collection_label(collection['name'], collection.get('word_count')),
+                iid=iid,
+                open=collection.get('open', False)
+            )
+            if collection.get('has_children'):
+                self.collections_tree.insert(iid, "end", iid=f"{iid}.placeholder", text="Loading...")
     
-    def display_words_as_cards(self, words_data):
+    def replace_children(self, parent_id, collections_data):
+        """Replace the children of a node with freshly loaded collections"""
+        for item in self.collections_tree.get_children(parent_id):
+            self.collections_tree.delete(item)
+        self.insert_collections(parent_id, collections_data)
+    
+    def has_unloaded_children(self, collection_id):
+        return self.collections_tree.exists(f"{collection_id}.placeholder")
+    
+    def rename_collection_node(self, collection_id, name):
+        self.collection_names[collection_id] = name
+        self.collections_tree.item(
+            collection_id, text=self._collection_label(name, self.collection_counts.get(collection_id))
+        )
+    
+    def set_collection_count(self, collection_id, word_count):
+        if not self.collections_tree.exists(collection_id):
+            return
+        self.collection_counts[collection_id] = word_count
+        self.collections_tree.item(
+            collection_id, text=self._collection_label(self.collection_names.get(collection_id, ""), word_count)
+        )
+    
+    def get_collection_count(self, collection_id):
+        return self.collection_counts.get(collection_id)
+    
+    def is_in_subtree(self, collection_id, ancestor_id):
+        """Whether a collection node is ancestor_id or lies below it in the tree"""
+        node = str(collection_id)
+        while node:
+            if node == str(ancestor_id):
+                return True
+            if not self.collections_tree.exists(node):
+                return False
+            node = self.collections_tree.parent(node)
+        return False
+    
+    def remove_collection_node(self, collection_id):
+        if self.collections_tree.exists(collection_id):
+            self.collections_tree.delete(collection_id)
+        self.collection_names.pop(collection_id, None)
+        self.collection_counts.pop(collection_id, None)
+    
+    def get_collection_name(self, collection_id):
+        return self.collection_names.get(collection_id, "")
+    
+    def _collection_label(self, name, word_count):
+        if word_count is None:
+            return name
+        return f"{name} ({word_count})"
+    
+    def display_words_as_cards(self, words_data, has_more=False):
         """Display words as cards"""
         self.list_container.pack_forget()
         self.cards_container.pack(fill=tk.BOTH, expand=True)
-        
-        for widget in self.cards_container.winfo_children():
-            widget.destroy()
-        
-        for i, word_data in enumerate(words_data):
-            row, col = i // 4, i % 4
-            
-            card_frame = ttk.Frame(self.cards_container, borderwidth=1, relief="solid")
-            card_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-            
-            word_label = ttk.Label(
-                card_frame, 
-                text=word_data['word'], 
-                font=AppTheme.HEADING_FONT
-            )
-            word_label.pack(pady=(10, 5))
-            
-            def_label = ttk.Label(
-                card_frame, 
-                text=word_data['definition'][:50] + ('...' if len(word_data['definition']) > 50 else '')
-            )
-            def_label.pack(pady=5)
-            
-            mastery_label = ttk.Label(
-                card_frame, 
-                text=self._get_star_rating(word_data['mastery']),
-                foreground=AppTheme.ACCENT
-            )
-            mastery_label.pack(pady=5)
-            
-            card_frame.word_id = word_data['id']
-            
-            card_frame.bind("<Button-1>", lambda e, id=word_data['id']: self._on_card_click(id))
+        self.cards_container.set_items(words_data, has_more)
     
-    def display_words_as_list(self, words_data):
+    def display_words_as_list(self, words_data, has_more=False):
         """Display words as a list"""
         self.cards_container.pack_forget()
         self.list_container.pack(fill=tk.BOTH, expand=True)
-        
-        for item in self.word_list.get_children():
-            self.word_list.delete(item)
-
-        for word_data in words_data:
-            self.word_list.insert(
-                "",
-                "end",
-                values=(
-                    word_data['word'],
-                    word_data['definition'][:50] + ('...' if len(word_data['definition']) > 50 else ''),
-                    self._get_star_rating(word_data['mastery'])
-                ),
-                tags=(str(word_data['id']),)
-            )
+        self.list_container.set_items(words_data, has_more)
     
-    def _get_star_rating(self, mastery_level):
-        """Convert mastery level (0-5) to stars"""
-        return "★" * mastery_level + "☆" * (5 - mastery_level)
+    def append_words(self, words_data, has_more=False):
+        """Add the next page of words to the current display"""
+        self.active_word_display().append_items(words_data, has_more)
+    
+    def clear_words(self):
+        self.active_word_display().set_items([])
+    
+    def active_word_display(self):
+        """Return the renderer for the current view type"""
+        if self.view_type_var.get() == "cards":
+            return self.cards_container
+        return self.list_container
     
     def get_selected_collection_id(self):
         """Get the ID of the selected collection"""
         selection = self.collections_tree.selection()
-        if selection:
+        if selection and not selection[0].endswith(".placeholder"):
             return selection[0]
         return None
     
     def get_selected_word_ids(self):
         """Get IDs of selected words"""
-        if self.view_type_var.get() == "cards":
-            # In cards view, we'd need to track selected cards
-            # For simplicity, let's assume we store selected card IDs in a list
-            return self.selected_card_ids if hasattr(self, 'selected_card_ids') else []
-        else:
-            # In list view, get selected items from treeview
-            selection = self.word_list.selection()
-            return [self.word_list.item(item, "tags")[0] for item in selection]
+        return self.active_word_display().get_selected_ids()
     
     def _on_collection_selected(self, event):
         """Handle collection selection"""
@@ -228,6 +229,17 @@ class VocabularyView(ttk.Frame):
             if collection_id:
                 self.controller.load_collection_words(collection_id)
     
+    def _on_collection_opened(self, event):
+        """Load the children of a collection the first time it is expanded"""
+        if self.controller:
+            collection_id = self.collections_tree.focus()
+            if collection_id and self.has_unloaded_children(collection_id):
+                self.controller.expand_collection(collection_id)
+    
+    def _on_need_more_words(self):
+        if self.controller:
+            self.controller.load_more_words()
+    
     def _on_new_collection(self):
         """Handle new collection button"""
         if self.controller:
@@ -250,17 +262,43 @@ class VocabularyView(ttk.Frame):
     def _on_study_selected(self):
         """Handle study selected button"""
         if self.controller:
-            word_ids = self.get_selected_word_ids()
-            if word_ids:
-                self.controller.start_study_session(word_ids)
+            self.controller.start_study_session(self.get_selected_word_ids())
+    
+    def _fill_collection_menu(self, menu, parent=None):
+        """
+        Fill a collection menu with one level of collections as it opens
+        
+        Collections with children get a submenu that loads its own level when
+        it opens, so only the levels the user browses are queried.
+        """
+        for submenu in menu.winfo_children():
+            submenu.destroy()
+        menu.delete(0, tk.END)
+        if self.controller is None:
+            return
+        
+        if parent is not None:
+            menu.add_command(label=parent['name'], command=self._add_to_collection_command(parent['id']))
+            menu.add_separator()
+        
+        collections = self.controller.get_collection_level(parent['id'] if parent else None)
+        for collection in collections:
+            if collection['has_children']:
+                submenu = tk.Menu(menu, tearoff=0)
+                submenu.config(postcommand=lambda m=submenu, c=collection: self._fill_collection_menu(m, c))
+                menu.add_cascade(label=collection['name'], menu=submenu)
+            else:
+                menu.add_command(label=collection['name'],
+                                 command=self._add_to_collection_command(collection['id']))
+        
+        if parent is None and not collections:
+            menu.add_command(label="No collections", state="disabled")
+    
+    def _add_to_collection_command(self, collection_id):
+        return lambda: self.controller.add_selected_to_collection(collection_id)
     
     def _on_view_type_changed(self):
         """Handle view type change"""
         if self.controller:
             view_type = self.view_type_var.get()
             self.controller.change_view_type(view_type)
-    
-    def _on_card_click(self, word_id):
-        """Handle click on a word card"""
-        if self.controller:
-            self.controller.select_word(word_id)
\ No newline at end of file
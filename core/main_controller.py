@@ -7,6 +7,7 @@ from GUI.pages.word_browser.browser_view import BrowserInterface
 from GUI.pages.settings.settings_controller import SettingsController
 from GUI.pages.word_info.word_info_controller import WordInfoController
 from core.main_view import MainView    
+from core.task_scheduler import TaskScheduler
 
 # Controller imports
 from GUI.tabs.dashboard.dashboard_controller import DashboardController
@@ -19,8 +20,17 @@ from GUI.tabs.explorer.explorer_controller import ExplorerController
 from data.config_model import ConfigModel
 from data.database_manager import WordDatabase
 from util.services.wiktionary_service import WiktionaryService
+from util.services.lookup_cache import LookupCache
+from util.services.dictionary_service import DictionaryService
+from util.services.autocomplete import PrefixIndex
+from util.services.frequency_service import FrequencyService
+from util.services.http_session import configure_session, close_session
 
 # Util imports
+from util.image_preprocess import preprocess
+from util.ocr_cache import OcrCache
+from util.ocr_pipeline import OcrPipeline
+from util.region_watcher import RegionWatcher, ScreenRegionSource
 from util.selection_tool import GlobalSelectionApp
 from util.utils import TrayIconHandler, ShortcutsHandler, ClipboardHandler
 
@@ -34,6 +44,7 @@ class MainController:
         
         self.config_model = ConfigModel()
         self.view = MainView()
+        self.scheduler = TaskScheduler(self.view, self.view.dispatcher)
         
         try:
             self.db = WordDatabase()
@@ -57,14 +68,20 @@ class MainController:
         self.logger.info("Application initialized successfully")
 
     def setup_tab_controllers(self):
-        dict_service = WiktionaryService()
+        configure_session(**self.config_model.get_network_settings())
+        self.lookup_cache = LookupCache()
+        self.dict_service = self.create_dictionary_service()
+        self.autocomplete = self.create_autocomplete_index()
+        self.frequency_service = FrequencyService(self.config_model.get_frequency_lists())
         
         self.controllers = [
-            DictionaryController(self.view.dictionary_tab, dict_service, self.db),
-            ReadingController(self.view.reading_tab, None, self.db),  # We'll set this after
-            VocabularyController(self.view.vocabulary_tab, self.db),
-            ExplorerController(self.view.explorer_tab, self.db),
-            DashboardController(self.view.dashboard_tab, self.db)
+            DictionaryController(self.view.dictionary_tab, self.dict_service, self.db, self.scheduler,
+                                 self.autocomplete),
+            ReadingController(self.view.reading_tab, None, self.db, self.scheduler,  # We'll set this after
+                              self.frequency_service),
+            VocabularyController(self.view.vocabulary_tab, self.db, self.scheduler, self.dict_service),
+            ExplorerController(self.view.explorer_tab, self.db, self.scheduler),
+            DashboardController(self.view.dashboard_tab, self.db, self.scheduler)
         ]
         
         self.dictionary_controller, self.reading_controller, self.vocabulary_controller, \
@@ -72,6 +89,43 @@ class MainController:
         
         # Now set the dictionary controller for the reading controller
         self.reading_controller.dictionary_controller = self.dictionary_controller
+        
+        preprocess_options = self.config_model.get_ocr_preprocess_options()
+        self.region_watcher = None
+        self.ocr_cache = self.create_ocr_cache()
+        self.ocr_pipeline = OcrPipeline(self.view.dispatcher.post, self.on_captured_text,
+                                        preprocess=lambda image: preprocess(image, preprocess_options),
+                                        cache=self.ocr_cache,
+                                        **self.config_model.get_ocr_settings())
+    
+    def create_dictionary_service(self):
+        """Use the offline dictionary when one is configured, Wiktionary otherwise"""
+        offline_path = self.config_model.get_offline_dictionary()
+        if DictionaryService.exists(offline_path):
+            try:
+                return DictionaryService(offline_path)
+            except Exception as e:
+                self.logger.error(f"Could not open offline dictionary {offline_path}: {e}")
+        return WiktionaryService(self.lookup_cache)
+    
+    def create_ocr_cache(self):
+        settings = self.config_model.get_ocr_cache_settings()
+        if not settings.pop("enabled", True):
+            return None
+        try:
+            return OcrCache(**settings)
+        except Exception as e:
+            self.logger.error(f"Could not open OCR cache: {e}")
+            return None
+    
+    def create_autocomplete_index(self):
+        """Build the local suggestion index from the word list, past lookups and saved words"""
+        index = PrefixIndex()
+        index.load_word_list(self.config_model.get_autocomplete_word_list())
+        index.add_many(self.lookup_cache.words(), weight=2)
+        if self.db:
+            index.add_many(self.db.get_word_list(), weight=3)
+        return index
     
     def on_tab_changed(self, event):
         tab_id = self.view.notebook.index("current")
@@ -103,6 +157,8 @@ class MainController:
     def setup_shortcuts(self):
         self.shortcuts_controller.register_shortcut("ctrl+q", self.show_word_info)
         self.shortcuts_controller.register_shortcut("ctrl+e", self.start_selection)
+        self.shortcuts_controller.register_shortcut(self.config_model.get_hotkey("watch") or "ctrl+shift+e",
+            lambda: self.view.dispatcher.post(self.toggle_region_watch))
         self.shortcuts_controller.register_shortcut("ctrl+d", 
             lambda: self.dictionary_controller.perform_lookup())
     
@@ -113,7 +169,8 @@ class MainController:
         self.clipboard_controller.copy_selection_to_clipboard()
         clipboard_content = self.clipboard_controller.get_clipboard_text()
         if clipboard_content:
-            WordInfoController(self.view, clipboard_content)
+            WordInfoController(self.view, clipboard_content, dictionary_service=self.dict_service,
+                               scheduler=self.scheduler)
     
     def save_word_to_db(self, word):
         if not word or not self.db:
@@ -126,6 +183,7 @@ class MainController:
             messagebox.showinfo("Word Already Saved", f"The word '{word}' is already saved.")
         elif result:
             messagebox.showinfo("Success", f"Word '{word}' saved successfully!")
+            self.autocomplete.record_use(word)
             if hasattr(self.vocabulary_controller, 'refresh'):
                 self.vocabulary_controller.refresh()
             return True
@@ -144,10 +202,25 @@ class MainController:
     def exit_application(self):
         self.logger.info("Application shutting down")
         self.shortcuts_controller.unregister_all()
+        self.stop_region_watch()
+        self.logger.info(f"OCR pipeline stats: {self.ocr_pipeline.stats()}")
+        self.ocr_pipeline.shutdown()
+        if self.ocr_cache:
+            self.logger.info(f"OCR cache stats: {self.ocr_cache.stats()}")
+            self.ocr_cache.close()
+        self.scheduler.shutdown()
+        self.logger.info(f"UI dispatcher stats: {self.view.dispatcher.stats()}")
+        self.view.dispatcher.stop()
         
         if self.db:
             self.db.close()
         
+        self.logger.info(f"Lookup cache stats: {self.lookup_cache.stats()}")
+        self.dict_service.shutdown()
+        self.lookup_cache.close()
+        self.frequency_service.close()
+        close_session()
+        
         self.tray_icon_handler.stop()
         self.view.destroy()
     
@@ -159,20 +232,54 @@ class MainController:
         SavedWordsInterface(self.view, self.db)
     
     def on_browse_words(self):
-        BrowserInterface(self.view, "")
+        BrowserInterface(self.view, "", self.dict_service, self.scheduler)
     
     def on_settings(self):
         SettingsController(self.view, self.config_model)
     
-    def start_selection(self):
+    def start_selection(self, on_region=None):
         try:
             if not hasattr(self, "selection_app") or self.selection_app is None:
-                self.selection_app = GlobalSelectionApp(self.view)
-            self.selection_app.on_ctrl_e()
+                self.selection_app = GlobalSelectionApp(self.view, self.ocr_pipeline)
+            self.selection_app.on_ctrl_e(on_region)
         except Exception as e:
             self.logger.error(f"Error in screen selection: {e}")
             messagebox.showerror("Selection Error", f"Could not start selection: {e}")
     
+    def toggle_region_watch(self):
+        """Select a region to OCR whenever its content changes, or stop watching"""
+        if self.region_watcher is not None:
+            self.stop_region_watch()
+            self.view.show_status("Stopped watching the screen region")
+        else:
+            self.start_selection(on_region=self.watch_region)
+    
+    def watch_region(self, region):
+        self.region_watcher = RegionWatcher(
+            ScreenRegionSource(region),
+            lambda frame: self.ocr_pipeline.submit(lambda: frame),
+            **self.config_model.get_ocr_watch_settings()
+        )
+        self.region_watcher.start()
+        self.view.show_status("Watching the screen region, press the watch shortcut again to stop")
+    
+    def stop_region_watch(self):
+        if self.region_watcher is not None:
+            self.logger.info(f"Region watcher stats: {self.region_watcher.stats()}")
+            self.region_watcher.stop()
+            self.region_watcher = None
+    
+    def on_captured_text(self, text, timings):
+        """Show the text recognized in a screen selection in the reading tab"""
+        self.logger.info("OCR timings: " + ", ".join(f"{stage} {ms:.0f} ms" for stage, ms in timings.items()))
+        if not text.strip():
+            self.view.show_status("No text found in the selection")
+            return
+        
+        self.view.reading_tab.set_text(text)
+        self.view.notebook.select(self.view.reading_tab)
+        self.view.show_status(f"Captured text in {sum(timings.values()):.0f} ms")
+    
     def save_word(self):
         messagebox.showinfo("Not Implemented", 
                           "Word selection is not fully implemented yet.")
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import StringVar, ttk
 from GUI.common.app_theme import IconManager, AppTheme, ToolTip
+from core.ui_dispatcher import UIDispatcher
 from GUI.tabs.dictionary.dict_view import DictionaryView
 from GUI.tabs.reading.reading_view import ReadingView
 from GUI.tabs.vocabulary.vocabulary_view import VocabularyView
@@ -36,6 +37,10 @@ class MainView(tk.Tk):
         
         self._create_status_bar()
         
+        # Background threads hand UI updates to this queue instead of calling after() themselves
+        self.dispatcher = UIDispatcher(self)
+        self.dispatcher.start()
+        
     def _create_header(self):
         header = ttk.Frame(self, style='Header.TFrame')
         header.grid(row=0, column=0, sticky="ew")
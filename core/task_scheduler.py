@@ -0,0 +1,119 @@
+import itertools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskScheduler:
+    """Runs background work on a bounded worker pool and returns results to the Tk thread
+
+    Tasks are grouped by key. Results are posted to the UIDispatcher keyed by
+    task, so a burst of results for the same key costs one UI update.
+    Submitting a task supersedes any earlier task with the same key: a
+    pending debounce timer is cancelled, a queued task is dropped, and the
+    result of a task that already started is discarded. submit, cancel and
+    shutdown must be called from the Tk thread.
+    """
+    _ANONYMOUS = object()
+
+    def __init__(self, root, dispatcher, max_workers=4):
+        self.root = root
+        self.dispatcher = dispatcher
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task")
+        self._lock = threading.Lock()
+        self._generations = {}
+        self._timers = {}
+        self._futures = {}
+        self._anonymous_keys = itertools.count()
+
+    def submit(self, key, fn, *args, on_done=None, on_error=None, delay_ms=0):
+        """
+        Run fn(*args) in the background
+
+        Args:
+            key: Task key, newer tasks supersede older ones with the same key.
+                 None runs the task without superseding anything.
+            fn: Callable run on a worker thread
+            on_done: Called on the Tk thread with the result
+            on_error: Called on the Tk thread with the raised exception
+            delay_ms: Debounce delay, restarted by every submit with the same key
+        """
+        if key is None:
+            key = self._ANONYMOUS, next(self._anonymous_keys)
+
+        generation = self._supersede(key)
+        if delay_ms:
+            self._timers[key] = self.root.after(
+                delay_ms, self._start, key, generation, fn, args, on_done, on_error
+            )
+        else:
+            self._start(key, generation, fn, args, on_done, on_error)
+
+    def cancel(self, key):
+        """Cancel the task with the given key and ignore its result"""
+        self._supersede(key)
+
+    def discard(self, key):
+        """Cancel the task with the given key and forget the key, for keys owned by a closed window"""
+        self._supersede(key)
+        with self._lock:
+            self._generations.pop(key, None)
+
+    def is_current(self, key, generation):
+        with self._lock:
+            return self._generations.get(key) == generation
+
+    def shutdown(self):
+        for key in list(self._timers):
+            self.cancel(key)
+        self._executor.shutdown(wait=False)
+
+    def _supersede(self, key):
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            future = self._futures.pop(key, None)
+
+        timer = self._timers.pop(key, None)
+        if timer:
+            self.root.after_cancel(timer)
+        if future:
+            future.cancel()
+        return generation
+
+    def _start(self, key, generation, fn, args, on_done, on_error):
+        self._timers.pop(key, None)
+        future = self._executor.submit(self._run, key, generation, fn, args, on_done, on_error)
+        with self._lock:
+            if self._generations.get(key) == generation:
+                self._futures[key] = future
+
+    def _run(self, key, generation, fn, args, on_done, on_error):
+        try:
+            result = fn(*args)
+        except Exception as e:
+            if on_error is None:
+                self.logger.error(f"Background task {key} failed: {e}")
+            callback, value = on_error, e
+        else:
+            callback, value = on_done, result
+
+        with self._lock:
+            current = self._generations.get(key) == generation
+            if current:
+                self._futures.pop(key, None)
+                if self._is_anonymous(key):
+                    del self._generations[key]
+
+        if callback is not None and current:
+            self.dispatcher.post(self._finish, key, generation, callback, value, key=("task", key))
+
+    def _finish(self, key, generation, callback, value):
+        # Checked again on the Tk thread, a newer task may have been submitted meanwhile
+        if self._is_anonymous(key) or self.is_current(key, generation):
+            callback(value)
+
+    @classmethod
+    def _is_anonymous(cls, key):
+        return isinstance(key, tuple) and key[0] is cls._ANONYMOUS
@@ -0,0 +1,104 @@
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+
+class UIDispatcher:
+    """Thread-safe queue of UI updates drained on the Tk thread within a frame budget
+
+    Any thread may post callbacks. Every `interval_ms` the Tk thread runs queued
+    callbacks in order until the queue is empty or `frame_budget_ms` is used up,
+    leaving the rest for the next tick. Callbacks posted with the same key
+    coalesce: only the latest one runs, in the position of the first.
+    """
+    _ANONYMOUS = object()
+
+    def __init__(self, root, frame_budget_ms=8, interval_ms=16):
+        self.root = root
+        self.frame_budget = frame_budget_ms / 1000
+        self.interval_ms = interval_ms
+        self.logger = logging.getLogger(__name__)
+
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._anonymous_keys = itertools.count()
+        self._after_id = None
+
+        self._stats = {
+            "posted": 0,
+            "coalesced": 0,
+            "executed": 0,
+            "ticks": 0,
+            "max_depth": 0,
+            "last_drain_ms": 0.0,
+            "max_drain_ms": 0.0
+        }
+
+    def start(self):
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def post(self, callback, *args, key=None):
+        """Queue callback(*args) to run on the Tk thread
+
+        Args:
+            callback: Callable to run
+            key: Update target, a newer post with the same key replaces a queued one
+        """
+        with self._lock:
+            if key is None:
+                key = self._ANONYMOUS, next(self._anonymous_keys)
+            elif key in self._pending:
+                self._stats["coalesced"] += 1
+
+            self._pending[key] = (callback, args)
+            self._stats["posted"] += 1
+            self._stats["max_depth"] = max(self._stats["max_depth"], len(self._pending))
+
+    def stats(self):
+        """Return queue depth, drain times and counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["depth"] = len(self._pending)
+        return stats
+
+    def _tick(self):
+        start = time.perf_counter()
+        deadline = start + self.frame_budget
+        executed = 0
+
+        while True:
+            with self._lock:
+                if not self._pending:
+                    break
+                _, (callback, args) = self._pending.popitem(last=False)
+
+            try:
+                callback(*args)
+            except Exception as e:
+                self.logger.error(f"UI update failed: {e}")
+            executed += 1
+
+            if time.perf_counter() >= deadline:
+                break
+
+        if executed:
+            drain_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._stats["executed"] += executed
+                self._stats["ticks"] += 1
+                self._stats["last_drain_ms"] = drain_ms
+                self._stats["max_drain_ms"] = max(self._stats["max_drain_ms"], drain_ms)
+                depth = len(self._pending)
+            if depth:
+                self.logger.debug(f"UI dispatcher over budget: ran {executed} updates in {drain_ms:.1f} ms, "
+                                  f"{depth} left")
+
+        self._after_id = self.root.after(self.interval_ms, self._tick)
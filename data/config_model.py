@@ -12,9 +12,40 @@ class ConfigModel:
             "default_translated": "Spanish",
             "theme": "Light",
             "font_size": "12",
+            "offline_dictionary": "",
+            "autocomplete_word_list": "",
+            "frequency_lists": {},
             "hotkeys": {
                 "selection": "ctrl+e",
+                "watch": "ctrl+shift+e",
                 "save": "ctrl+s"
+            },
+            "ocr": {
+                "backend": "auto",
+                "tesseract_cmd": "",
+                "language": "eng",
+                "workers": 2,
+                "max_pending": 2
+            },
+            "ocr_preprocess": {},
+            "ocr_cache": {
+                "enabled": True,
+                "db_path": "ocr_cache.db",
+                "memory_entries": 512,
+                "max_entries": 5000,
+                "max_distance": 8
+            },
+            "ocr_watch": {
+                "fps": 2,
+                "change_threshold": 0.01,
+                "settle_frames": 1
+            },
+            "network": {
+                "pool_size": 10,
+                "timeout": [3.05, 10],
+                "retries": 3,
+                "backoff_factor": 0.3,
+                "requests_per_second": 10
             }
         }
         
@@ -67,4 +98,34 @@ class ConfigModel:
     def set_hotkey(self, action, key_combo):
         if "hotkeys" not in self.config:
             self.config["hotkeys"] = {}
-        self.config["hotkeys"][action] = key_combo
\ No newline at end of file
+        self.config["hotkeys"][action] = key_combo
+    
+    def get_offline_dictionary(self):
+        return self.config.get("offline_dictionary", "")
+    
+    def get_autocomplete_word_list(self):
+        return self.config.get("autocomplete_word_list", "")
+    
+    def get_frequency_lists(self):
+        """Return {language: path of a frequency ordered word list}"""
+        return self.config.get("frequency_lists", {})
+    
+    def get_ocr_settings(self):
+        return dict(self.config.get("ocr", {}))
+    
+    def get_ocr_preprocess_options(self):
+        """Return overrides of util.image_preprocess.DEFAULT_OPTIONS"""
+        return dict(self.config.get("ocr_preprocess", {}))
+    
+    def get_ocr_cache_settings(self):
+        return dict(self.config.get("ocr_cache", {}))
+    
+    def get_ocr_watch_settings(self):
+        """Return RegionWatcher options for watching a pinned region"""
+        return dict(self.config.get("ocr_watch", {}))
+    
+    def get_network_settings(self):
+        settings = dict(self.config.get("network", {}))
+        if "timeout" in settings:
+            settings["timeout"] = tuple(settings["timeout"])
+        return settings
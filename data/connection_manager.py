@@ -0,0 +1,69 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class ConnectionManager:
+    """Hands out one read connection per thread and a single serialized writer
+
+    With WAL journaling readers never block the writer or each other, so the Tk
+    thread, background statistics and batch imports can all use the database
+    at once. Writes from every thread go through the same connection, one
+    transaction at a time.
+    """
+    def __init__(self, db_path, pragmas=()):
+        self.db_path = db_path
+        self.pragmas = pragmas
+
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+
+        self._write_lock = threading.RLock()
+        self._writer = self._connect()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        for pragma in self.pragmas:
+            conn.execute(pragma)
+        return conn
+
+    def reader(self):
+        """Return the calling thread's read connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    @contextmanager
+    def writer(self):
+        """Run a write transaction on the shared writer connection
+
+        Commits when the block exits and rolls back if it raises. Nested use on
+        the same thread joins the outer transaction.
+        """
+        with self._write_lock:
+            if self._writer.in_transaction:
+                yield self._writer
+                return
+            try:
+                yield self._writer
+                self._writer.commit()
+            except BaseException:
+                self._writer.rollback()
+                raise
+
+    def close(self):
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
+
+        with self._write_lock:
+            if self._writer:
+                self._writer.execute("PRAGMA optimize")
+                self._writer.close()
+                self._writer = None
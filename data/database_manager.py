@@ -1,95 +1,888 @@
 import sqlite3
 import os
+from data.connection_manager import ConnectionManager
+
+# Applied to every connection: WAL lets readers run alongside the writer, and
+# synchronous=NORMAL is safe with WAL while avoiding an fsync per commit
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON"
+)
+
+# Hot queries are kept as constants so sqlite3's statement cache reuses the prepared statements
+SELECT_RECENT_WORDS = '''
+SELECT * FROM saved_words
+ORDER BY date_added DESC, id DESC
+LIMIT ? OFFSET ?
+'''
+
+# Keyset pages over (date_added, id), newest first. The cursor is the boundary
+# row's (date_added, id), so page cost does not grow with the position.
+SELECT_OLDER_WORDS = '''
+SELECT * FROM saved_words
+WHERE (date_added, id) < (?, ?)
+ORDER BY date_added DESC, id DESC
+LIMIT ?
+'''
+
+SELECT_NEWER_WORDS = '''
+SELECT * FROM saved_words
+WHERE (date_added, id) > (?, ?)
+ORDER BY date_added ASC, id ASC
+LIMIT ?
+'''
+
+SELECT_FAVORITES = '''
+SELECT * FROM saved_words
+WHERE favorite = 1
+ORDER BY date_added DESC, id DESC
+'''
+
+SELECT_FAVORITES_PAGE = '''
+SELECT * FROM saved_words
+WHERE favorite = 1
+ORDER BY date_added DESC, id DESC
+LIMIT ?
+'''
+
+SELECT_OLDER_FAVORITES = '''
+SELECT * FROM saved_words
+WHERE favorite = 1 AND (date_added, id) < (?, ?)
+ORDER BY date_added DESC, id DESC
+LIMIT ?
+'''
+
+SELECT_CHILD_COLLECTIONS = '''
+SELECT id, name, word_count, child_count FROM collections
+WHERE parent_id IS ?
+ORDER BY name
+'''
+
+# Collection members newest first, keyset paged by (added, word_id)
+SELECT_COLLECTION_WORDS = '''
+SELECT s.id, s.word, s.source_language, s.date_added, s.favorite, cw.added
+FROM collection_words cw JOIN saved_words s ON s.id = cw.word_id
+WHERE cw.collection_id = ?
+ORDER BY cw.added DESC, cw.word_id DESC
+LIMIT ?
+'''
+
+SELECT_OLDER_COLLECTION_WORDS = '''
+SELECT s.id, s.word, s.source_language, s.date_added, s.favorite, cw.added
+FROM collection_words cw JOIN saved_words s ON s.id = cw.word_id
+WHERE cw.collection_id = ? AND (cw.added, cw.word_id) < (?, ?)
+ORDER BY cw.added DESC, cw.word_id DESC
+LIMIT ?
+'''
+
+INSERT_COLLECTION_WORD = '''
+INSERT OR IGNORE INTO collection_words (collection_id, word_id) VALUES (?, ?)
+'''
+
+SELECT_WORD_ID = 'SELECT id FROM saved_words WHERE word = ?'
+
+INSERT_WORD_IGNORE = 'INSERT OR IGNORE INTO saved_words (word, source_language) VALUES (?, ?)'
+
+SEARCH_FTS = '''
+SELECT s.* FROM saved_words_fts f
+JOIN saved_words s ON s.id = f.rowid
+WHERE saved_words_fts MATCH ?
+ORDER BY f.rank
+LIMIT ? OFFSET ?
+'''
+
+# Case-insensitive prefix range, served by idx_saved_words_word_nocase
+SEARCH_PREFIX = '''
+SELECT * FROM saved_words
+WHERE word >= ? COLLATE NOCASE AND word < ? COLLATE NOCASE
+ORDER BY word COLLATE NOCASE
+LIMIT ? OFFSET ?
+'''
+
+SEARCH_LIKE = '''
+SELECT * FROM saved_words
+WHERE word LIKE ?
+ORDER BY date_added DESC
+LIMIT ? OFFSET ?
+'''
+
+COUNT_FTS = 'SELECT COUNT(*) FROM saved_words_fts WHERE saved_words_fts MATCH ?'
+
+COUNT_PREFIX = 'SELECT COUNT(*) FROM saved_words WHERE word >= ? COLLATE NOCASE AND word < ? COLLATE NOCASE'
+
+COUNT_LIKE = 'SELECT COUNT(*) FROM saved_words WHERE word LIKE ?'
+
+# External-content FTS5 index over saved_words.word, kept in sync by triggers.
+# The trigram tokenizer matches any substring of three or more characters.
+FTS_SCHEMA = (
+    '''
+    CREATE VIRTUAL TABLE saved_words_fts USING fts5(
+        word, content='saved_words', content_rowid='id', tokenize='trigram'
+    )
+    ''',
+    '''
+    CREATE TRIGGER saved_words_fts_insert AFTER INSERT ON saved_words BEGIN
+        INSERT INTO saved_words_fts (rowid, word) VALUES (new.id, new.word);
+    END
+    ''',
+    '''
+    CREATE TRIGGER saved_words_fts_delete AFTER DELETE ON saved_words BEGIN
+        INSERT INTO saved_words_fts (saved_words_fts, rowid, word) VALUES ('delete', old.id, old.word);
+    END
+    ''',
+    '''
+    CREATE TRIGGER saved_words_fts_update AFTER UPDATE OF word ON saved_words BEGIN
+        INSERT INTO saved_words_fts (saved_words_fts, rowid, word) VALUES ('delete', old.id, old.word);
+        INSERT INTO saved_words_fts (rowid, word) VALUES (new.id, new.word);
+    END
+    ''',
+    "INSERT INTO saved_words_fts (saved_words_fts) VALUES ('rebuild')"
+)
+
+# Collections form a tree through parent_id. word_count and child_count are
+# kept by triggers so listing a level never has to count memberships, and the
+# cascading deletes (collection, parent or saved word) fire the same triggers.
+COLLECTIONS_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS collections (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        parent_id INTEGER REFERENCES collections (id) ON DELETE CASCADE,
+        word_count INTEGER NOT NULL DEFAULT 0,
+        child_count INTEGER NOT NULL DEFAULT 0,
+        date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS collection_words (
+        collection_id INTEGER NOT NULL REFERENCES collections (id) ON DELETE CASCADE,
+        word_id INTEGER NOT NULL REFERENCES saved_words (id) ON DELETE CASCADE,
+        added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (collection_id, word_id)
+    ) WITHOUT ROWID
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_collections_parent ON collections (parent_id, name)',
+    'CREATE INDEX IF NOT EXISTS idx_collection_words_added ON collection_words (collection_id, added, word_id)',
+    'CREATE INDEX IF NOT EXISTS idx_collection_words_word ON collection_words (word_id)',
+    '''
+    CREATE TRIGGER IF NOT EXISTS collection_words_count_insert AFTER INSERT ON collection_words BEGIN
+        UPDATE collections SET word_count = word_count + 1 WHERE id = new.collection_id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS collection_words_count_delete AFTER DELETE ON collection_words BEGIN
+        UPDATE collections SET word_count = word_count - 1 WHERE id = old.collection_id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS collections_child_insert AFTER INSERT ON collections
+    WHEN new.parent_id IS NOT NULL BEGIN
+        UPDATE collections SET child_count = child_count + 1 WHERE id = new.parent_id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS collections_child_delete AFTER DELETE ON collections
+    WHEN old.parent_id IS NOT NULL BEGIN
+        UPDATE collections SET child_count = child_count - 1 WHERE id = old.parent_id;
+    END
+    '''
+)
+
+# Spaced repetition state, one row per saved word. due is a unix timestamp and
+# (due, word_id) is indexed so the next due cards are an index range scan.
+REVIEW_SCHEMA = (
+    '''
+    CREATE TABLE review_state (
+        word_id INTEGER PRIMARY KEY REFERENCES saved_words (id) ON DELETE CASCADE,
+        ease REAL NOT NULL DEFAULT 2.5,
+        interval REAL NOT NULL DEFAULT 0,
+        repetitions INTEGER NOT NULL DEFAULT 0,
+        lapses INTEGER NOT NULL DEFAULT 0,
+        due INTEGER NOT NULL,
+        last_review INTEGER
+    )
+    ''',
+    'CREATE INDEX idx_review_state_due ON review_state (due, word_id)',
+    '''
+    CREATE TRIGGER saved_words_review_insert AFTER INSERT ON saved_words BEGIN
+        INSERT INTO review_state (word_id, due) VALUES (new.id, CAST(strftime('%s', 'now') AS INTEGER));
+    END
+    ''',
+    # New cards for words saved before the table existed are due from when they were saved
+    '''
+    INSERT INTO review_state (word_id, due)
+    SELECT id, CAST(coalesce(strftime('%s', date_added), strftime('%s', 'now')) AS INTEGER) FROM saved_words
+    '''
+)
+
+SELECT_DUE_CARDS = '''
+SELECT r.word_id, s.word, s.source_language, r.ease, r.interval, r.repetitions, r.lapses, r.due
+FROM review_state r JOIN saved_words s ON s.id = r.word_id
+WHERE r.due <= ?
+ORDER BY r.due, r.word_id
+LIMIT ?
+'''
+
+UPDATE_REVIEW_STATE = '''
+UPDATE review_state
+SET ease = ?, interval = ?, repetitions = ?, lapses = ?, due = ?, last_review = ?
+WHERE word_id = ?
+'''
+
+# A review interval of at least this many days counts as mastered
+MASTERED_INTERVAL_DAYS = 21
+
+# Due counts are shown as "999+" past this, so counting stays a short index scan
+REVIEW_DUE_CAP = 999
+
+# Aggregates for the dashboard, kept current by triggers so reading them is a
+# single-row lookup. daily_activity holds one row per local day with activity,
+# and its insert trigger extends or restarts the streak.
+STATS_SCHEMA = (
+    '''
+    CREATE TABLE vocab_stats (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        total_words INTEGER NOT NULL DEFAULT 0,
+        favorites INTEGER NOT NULL DEFAULT 0,
+        new_words INTEGER NOT NULL DEFAULT 0,
+        mastered INTEGER NOT NULL DEFAULT 0,
+        reviews INTEGER NOT NULL DEFAULT 0,
+        streak INTEGER NOT NULL DEFAULT 0,
+        last_active_day TEXT,
+        last_activity TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE daily_activity (
+        day TEXT PRIMARY KEY,
+        words_added INTEGER NOT NULL DEFAULT 0,
+        reviews INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TRIGGER daily_activity_streak AFTER INSERT ON daily_activity BEGIN
+        UPDATE vocab_stats
+        SET streak = CASE WHEN last_active_day = date(new.day, '-1 day') THEN streak + 1 ELSE 1 END,
+            last_active_day = new.day
+        WHERE id = 1 AND (last_active_day IS NULL OR new.day > last_active_day);
+    END
+    ''',
+    '''
+    CREATE TRIGGER saved_words_stats_insert AFTER INSERT ON saved_words BEGIN
+        UPDATE vocab_stats
+        SET total_words = total_words + 1, favorites = favorites + (new.favorite = 1),
+            last_activity = CURRENT_TIMESTAMP
+        WHERE id = 1;
+        INSERT INTO daily_activity (day, words_added) VALUES (date('now', 'localtime'), 1)
+        ON CONFLICT (day) DO UPDATE SET words_added = words_added + 1;
+    END
+    ''',
+    '''
+    CREATE TRIGGER saved_words_stats_delete AFTER DELETE ON saved_words BEGIN
+        UPDATE vocab_stats
+        SET total_words = total_words - 1, favorites = favorites - (old.favorite = 1)
+        WHERE id = 1;
+    END
+    ''',
+    '''
+    CREATE TRIGGER saved_words_stats_favorite AFTER UPDATE OF favorite ON saved_words BEGIN
+        UPDATE vocab_stats SET favorites = favorites + (new.favorite = 1) - (old.favorite = 1) WHERE id = 1;
+    END
+    ''',
+    f'''
+    CREATE TRIGGER review_state_stats_insert AFTER INSERT ON review_state BEGIN
+        UPDATE vocab_stats
+        SET new_words = new_words + (new.repetitions = 0),
+            mastered = mastered + (new.interval >= {MASTERED_INTERVAL_DAYS})
+        WHERE id = 1;
+    END
+    ''',
+    f'''
+    CREATE TRIGGER review_state_stats_delete AFTER DELETE ON review_state BEGIN
+        UPDATE vocab_stats
+        SET new_words = new_words - (old.repetitions = 0),
+            mastered = mastered - (old.interval >= {MASTERED_INTERVAL_DAYS})
+        WHERE id = 1;
+    END
+    ''',
+    f'''
+    CREATE TRIGGER review_state_stats_update AFTER UPDATE ON review_state BEGIN
+        UPDATE vocab_stats
+        SET new_words = new_words + (new.repetitions = 0) - (old.repetitions = 0),
+            mastered = mastered + (new.interval >= {MASTERED_INTERVAL_DAYS})
+                                - (old.interval >= {MASTERED_INTERVAL_DAYS})
+        WHERE id = 1;
+    END
+    ''',
+    '''
+    CREATE TRIGGER review_state_stats_review AFTER UPDATE OF last_review ON review_state
+    WHEN new.last_review IS NOT NULL BEGIN
+        UPDATE vocab_stats
+        SET reviews = reviews + 1, last_activity = datetime(new.last_review, 'unixepoch')
+        WHERE id = 1;
+        INSERT INTO daily_activity (day, reviews) VALUES (date(new.last_review, 'unixepoch', 'localtime'), 1)
+        ON CONFLICT (day) DO UPDATE SET reviews = reviews + 1;
+    END
+    '''
+)
+
+# Fills the counters from existing data when the stats tables are first created
+STATS_BACKFILL = (
+    '''
+    INSERT INTO daily_activity (day, words_added)
+    SELECT date(date_added, 'localtime'), COUNT(*) FROM saved_words WHERE date_added IS NOT NULL GROUP BY 1
+    ''',
+    '''
+    INSERT INTO daily_activity (day, reviews)
+    SELECT date(last_review, 'unixepoch', 'localtime'), COUNT(*) FROM review_state
+    WHERE last_review IS NOT NULL GROUP BY 1
+    ON CONFLICT (day) DO UPDATE SET reviews = excluded.reviews
+    ''',
+    f'''
+    INSERT INTO vocab_stats (id, total_words, favorites, new_words, mastered, reviews, last_activity)
+    SELECT 1,
+        (SELECT COUNT(*) FROM saved_words),
+        (SELECT COUNT(*) FROM saved_words WHERE favorite = 1),
+        (SELECT COUNT(*) FROM review_state WHERE repetitions = 0),
+        (SELECT COUNT(*) FROM review_state WHERE interval >= {MASTERED_INTERVAL_DAYS}),
+        (SELECT COUNT(*) FROM review_state WHERE last_review IS NOT NULL),
+        nullif(max(coalesce((SELECT max(date_added) FROM saved_words), ''),
+                   coalesce((SELECT datetime(max(last_review), 'unixepoch') FROM review_state), '')), '')
+    '''
+)
+
+SELECT_STATS = '''
+SELECT total_words, favorites, new_words, mastered, reviews, streak, last_active_day, last_activity
+FROM vocab_stats WHERE id = 1
+'''
+
+COUNT_DUE = '''
+SELECT COUNT(*) FROM (SELECT 1 FROM review_state WHERE due <= ? LIMIT ?)
+'''
 
 class WordDatabase:
-    """Manages the SQLite database for saved words"""
+    """Manages the SQLite database for saved words
+    
+    Safe to use from any thread: reads go through a per-thread connection and
+    writes are serialized on a single writer connection.
+    """
     def __init__(self, db_path="saved_words.db"):
         db_dir = os.path.dirname(os.path.abspath(db_path))
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir, exist_ok=True)
         
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
+        self.connections = ConnectionManager(db_path, CONNECTION_PRAGMAS)
+        
+        # Bumped whenever saved words are added or removed, so callers can cache word sets
+        self.words_version = 0
         
         self.create_tables()
     
+    def _read(self, sql, params=()):
+        return self.connections.reader().execute(sql, params)
+    
     def create_tables(self):
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS saved_words (
-            id INTEGER PRIMARY KEY,
-            word TEXT UNIQUE,
-            source_language TEXT,
-            date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            favorite BOOLEAN DEFAULT 0
-        )
-        ''')
+        with self.connections.writer() as conn:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS saved_words (
+                id INTEGER PRIMARY KEY,
+                word TEXT UNIQUE,
+                source_language TEXT,
+                date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                favorite BOOLEAN DEFAULT 0
+            )
+            ''')
+            
+            # Covering indexes (id is the rowid, so every index includes it) let the
+            # listing queries walk the index in date order without touching the table.
+            # id follows date_added so words saved in the same second have a stable order.
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_saved_words_date
+            ON saved_words (date_added, id, word, source_language, favorite)
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_saved_words_favorite_date
+            ON saved_words (date_added, id, word, source_language, favorite) WHERE favorite = 1
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_saved_words_word_nocase
+            ON saved_words (word COLLATE NOCASE)
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_saved_words_language_date
+            ON saved_words (source_language, date_added)
+            ''')
+            
+            for statement in COLLECTIONS_SCHEMA:
+                conn.execute(statement)
+            
+            if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'review_state'").fetchone():
+                for statement in REVIEW_SCHEMA:
+                    conn.execute(statement)
+            
+            if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'vocab_stats'").fetchone():
+                self.create_statistics(conn)
         
-        self.conn.commit()
+        self.fts_enabled = self.create_search_index()
+    
+    def create_statistics(self, conn):
+        """Create the statistics tables and triggers, filling them from existing data"""
+        for statement in STATS_SCHEMA:
+            conn.execute(statement)
+        for statement in STATS_BACKFILL:
+            conn.execute(statement)
+        
+        # Walk back from the latest active day to find the current streak
+        days = [row[0] for row in conn.execute('SELECT day FROM daily_activity ORDER BY day DESC')]
+        streak = 1 if days else 0
+        for later, earlier in zip(days, days[1:]):
+            if conn.execute("SELECT date(?, '-1 day')", (later,)).fetchone()[0] != earlier:
+                break
+            streak += 1
+        conn.execute('UPDATE vocab_stats SET streak = ?, last_active_day = ? WHERE id = 1',
+                     (streak, days[0] if days else None))
+    
+    def create_search_index(self):
+        """Create the FTS5 trigram index, returns False if this SQLite build lacks FTS5"""
+        if self._read("SELECT 1 FROM sqlite_master WHERE name = 'saved_words_fts'").fetchone():
+            return True
+        
+        try:
+            with self.connections.writer() as conn:
+                for statement in FTS_SCHEMA:
+                    conn.execute(statement)
+            return True
+        except sqlite3.OperationalError:
+            return False
     
     def save_word(self, word, source_lang):
         try:
-            self.cursor.execute('''
-            INSERT INTO saved_words (word, source_language)
-            VALUES (?, ?)
-            ''', (word, source_lang))
-            
-            word_id = self.cursor.lastrowid
-            self.conn.commit()
-            return word_id
+            with self.connections.writer() as conn:
+                cursor = conn.execute('''
+                INSERT INTO saved_words (word, source_language)
+                VALUES (?, ?)
+                ''', (word, source_lang))
         except sqlite3.IntegrityError:
             # Word already exists due to UNIQUE constraint
             return None
+        # Bumped after the commit, so a reader never caches the old word set under the new version
+        self.words_version += 1
+        return cursor.lastrowid
+    
+    def save_words(self, words, source_lang, progress_callback=None, chunk_size=1000):
+        """
+        Save many words in a single transaction
+        
+        Args:
+            words: Iterable of words
+            source_lang: Language stored with every word
+            progress_callback: Called as progress_callback(processed, total) after each
+                chunk, total is None when words has no length
+            chunk_size: Number of rows per executemany call
+            
+        Returns:
+            Dict with the number of "inserted" words and "duplicates" already saved
+        """
+        total = len(words) if hasattr(words, "__len__") else None
+        processed = inserted = 0
+        chunk = []
+        
+        with self.connections.writer() as conn:
+            for word in words:
+                chunk.append((word, source_lang))
+                if len(chunk) >= chunk_size:
+                    inserted += conn.executemany(INSERT_WORD_IGNORE, chunk).rowcount
+                    processed += len(chunk)
+                    chunk = []
+                    if progress_callback:
+                        progress_callback(processed, total)
+            
+            if chunk:
+                inserted += conn.executemany(INSERT_WORD_IGNORE, chunk).rowcount
+                processed += len(chunk)
+                if progress_callback:
+                    progress_callback(processed, total)
+        
+        if inserted:
+            self.words_version += 1
+        return {"inserted": inserted, "duplicates": processed - inserted}
     
     def get_saved_words(self, limit=100, offset=0):
-        self.cursor.execute('''
-        SELECT * FROM saved_words
-        ORDER BY date_added DESC
-        LIMIT ? OFFSET ?
-        ''', (limit, offset))
+        return self._read(SELECT_RECENT_WORDS, (limit, offset)).fetchall()
+    
+    def get_words_page(self, cursor=None, direction="older", limit=100):
+        """
+        Return a page of saved words, newest first, using keyset pagination
+        
+        Args:
+            cursor: (date_added, id) of the row to page from, None for the newest page
+            direction: "older" for rows after the cursor, "newer" for rows before it
+            limit: Page size
+            
+        Returns:
+            Rows in newest-first order. The cursor of a row is (row[3], row[0]).
+        """
+        if cursor is None:
+            return self.get_saved_words(limit)
+        
+        if direction == "older":
+            return self._read(SELECT_OLDER_WORDS, (cursor[0], cursor[1], limit)).fetchall()
         
-        return self.cursor.fetchall()
+        rows = self._read(SELECT_NEWER_WORDS, (cursor[0], cursor[1], limit)).fetchall()
+        rows.reverse()
+        return rows
     
-    def search_words(self, query):
-        query = f"%{query}%"
-        self.cursor.execute('''
-        SELECT * FROM saved_words
-        WHERE word LIKE ?
-        ORDER BY date_added DESC
-        ''', (query,))
+    def search_words(self, query, limit=100, offset=0):
+        """
+        Search saved words, best matches first
         
-        return self.cursor.fetchall()
+        Queries of three or more characters match anywhere in the word through the
+        trigram index. If nothing contains the query, words sharing the most
+        trigrams with it are returned instead, which tolerates typos. Shorter
+        queries match word prefixes, ignoring case.
+        """
+        query = query.strip()
+        if not query:
+            return self.get_saved_words(limit, offset)
+        
+        search_sql, count_sql, params = self._search_query(query)
+        return self._read(search_sql, params + (limit, offset)).fetchall()
+    
+    def count_search_results(self, query):
+        """Count the rows search_words can return for a query"""
+        query = query.strip()
+        if not query:
+            return self.count_words()
+        
+        search_sql, count_sql, params = self._search_query(query)
+        return self._read(count_sql, params).fetchone()[0]
+    
+    def _search_query(self, query):
+        """Return (search sql, count sql, params) for a non-empty query"""
+        if not self.fts_enabled:
+            return SEARCH_LIKE, COUNT_LIKE, (f"%{query}%",)
+        
+        if len(query) < 3:
+            return SEARCH_PREFIX, COUNT_PREFIX, (query, query + "\U0010ffff")
+        
+        match = self._fts_phrase(query)
+        exists = self._read("SELECT 1 FROM saved_words_fts WHERE saved_words_fts MATCH ? LIMIT 1", (match,))
+        if exists.fetchone() is None and len(query) > 3:
+            trigrams = dict.fromkeys(query[i:i + 3] for i in range(len(query) - 2))
+            match = " OR ".join(self._fts_phrase(trigram) for trigram in trigrams)
+        
+        return SEARCH_FTS, COUNT_FTS, (match,)
+    
+    @staticmethod
+    def _fts_phrase(text):
+        return '"' + text.replace('"', '""') + '"'
     
     def delete_word(self, word_id):
-        self.cursor.execute('DELETE FROM saved_words WHERE id = ?', (word_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self.connections.writer() as conn:
+            cursor = conn.execute('DELETE FROM saved_words WHERE id = ?', (word_id,))
+        if cursor.rowcount:
+            self.words_version += 1
+        return cursor.rowcount > 0
     
     def toggle_favorite(self, word_id):
-        self.cursor.execute('SELECT favorite FROM saved_words WHERE id = ?', (word_id,))
-        result = self.cursor.fetchone()
-        if not result:
-            return False
+        with self.connections.writer() as conn:
+            result = conn.execute('SELECT favorite FROM saved_words WHERE id = ?', (word_id,)).fetchone()
+            if not result:
+                return False
             
-        current_status = result[0]
-        new_status = 0 if current_status else 1
-        
-        self.cursor.execute('UPDATE saved_words SET favorite = ? WHERE id = ?', (new_status, word_id))
-        self.conn.commit()
-        return new_status
+            current_status = result[0]
+            new_status = 0 if current_status else 1
+            
+            conn.execute('UPDATE saved_words SET favorite = ? WHERE id = ?', (new_status, word_id))
+            return new_status
     
     def get_favorites(self):
-        self.cursor.execute('''
-        SELECT * FROM saved_words
-        WHERE favorite = 1
-        ORDER BY date_added DESC
-        ''')
+        return self._read(SELECT_FAVORITES).fetchall()
+    
+    def get_favorites_page(self, cursor=None, limit=100):
+        """Return a page of favorite words older than the (date_added, id) cursor"""
+        if cursor is None:
+            return self._read(SELECT_FAVORITES_PAGE, (limit,)).fetchall()
+        return self._read(SELECT_OLDER_FAVORITES, (cursor[0], cursor[1], limit)).fetchall()
+    
+    def create_collection(self, name, parent_id=None):
+        with self.connections.writer() as conn:
+            cursor = conn.execute(
+                'INSERT INTO collections (name, parent_id) VALUES (?, ?)', (name, parent_id)
+            )
+            return cursor.lastrowid
+    
+    def rename_collection(self, collection_id, name):
+        with self.connections.writer() as conn:
+            cursor = conn.execute('UPDATE collections SET name = ? WHERE id = ?', (name, collection_id))
+            return cursor.rowcount > 0
+    
+    def delete_collection(self, collection_id):
+        """Delete a collection with its subcollections and memberships"""
+        with self.connections.writer() as conn:
+            cursor = conn.execute('DELETE FROM collections WHERE id = ?', (collection_id,))
+            return cursor.rowcount > 0
+    
+    def get_child_collections(self, parent_id=None):
+        """
+        Return one level of the collection tree
+        
+        Args:
+            parent_id: Parent collection id, None for the top level
+            
+        Returns:
+            List of (id, name, word_count, child_count) tuples sorted by name
+        """
+        return self._read(SELECT_CHILD_COLLECTIONS, (parent_id,)).fetchall()
+    
+    def add_words_to_collection(self, collection_id, word_ids):
+        """Add saved words to a collection, returns the number of new memberships"""
+        with self.connections.writer() as conn:
+            cursor = conn.executemany(
+                INSERT_COLLECTION_WORD, ((collection_id, word_id) for word_id in word_ids)
+            )
+            return cursor.rowcount
+    
+    def remove_words_from_collection(self, collection_id, word_ids):
+        with self.connections.writer() as conn:
+            cursor = conn.executemany(
+                'DELETE FROM collection_words WHERE collection_id = ? AND word_id = ?',
+                ((collection_id, word_id) for word_id in word_ids)
+            )
+            return cursor.rowcount
+    
+    def get_collection_words(self, collection_id, cursor=None, limit=100):
+        """
+        Return a page of a collection's words, most recently added first
+        
+        Args:
+            collection_id: Collection id
+            cursor: (added, word_id) of the last row of the previous page
+            limit: Page size
+            
+        Returns:
+            Rows of (id, word, source_language, date_added, favorite, added). The
+            cursor of a row is (row[5], row[0]).
+        """
+        if cursor is None:
+            return self._read(SELECT_COLLECTION_WORDS, (collection_id, limit)).fetchall()
+        return self._read(SELECT_OLDER_COLLECTION_WORDS,
+                          (collection_id, cursor[0], cursor[1], limit)).fetchall()
+    
+    def get_due_cards(self, now, limit=20):
+        """
+        Return the cards due at `now`, most overdue first
+        
+        Returns:
+            Rows of (word_id, word, source_language, ease, interval, repetitions, lapses, due)
+        """
+        return self._read(SELECT_DUE_CARDS, (int(now), limit)).fetchall()
+    
+    def get_review_states(self, word_ids):
+        """Return the review state rows of the given words, in the same layout as get_due_cards"""
+        word_ids = list(word_ids)
+        rows = []
+        # Stay well below SQLite's host parameter limit
+        for start in range(0, len(word_ids), 500):
+            chunk = word_ids[start:start + 500]
+            rows.extend(self._read(f'''
+            SELECT r.word_id, s.word, s.source_language, r.ease, r.interval, r.repetitions, r.lapses, r.due
+            FROM review_state r JOIN saved_words s ON s.id = r.word_id
+            WHERE r.word_id IN ({",".join("?" * len(chunk))})
+            ''', chunk).fetchall())
+        return rows
+    
+    def update_review_states(self, states):
+        """
+        Store review results
         
-        return self.cursor.fetchall()
+        Args:
+            states: Iterable of (ease, interval, repetitions, lapses, due, last_review, word_id)
+        """
+        with self.connections.writer() as conn:
+            return conn.executemany(UPDATE_REVIEW_STATE, states).rowcount
+    
+    def count_words(self):
+        return self._read('SELECT total_words FROM vocab_stats WHERE id = 1').fetchone()[0]
+    
+    def count_due(self, now, cap=REVIEW_DUE_CAP):
+        """Count due cards, stopping at cap + 1"""
+        return self._read(COUNT_DUE, (int(now), cap + 1)).fetchone()[0]
+    
+    def get_statistics(self, now):
+        """
+        Return the dashboard statistics
+        
+        Everything except the due count is read from the vocab_stats row. The
+        streak counts as broken when the last active day is before yesterday.
+        """
+        total_words, favorites, new_words, mastered, reviews, streak, last_active_day, last_activity = \
+            self._read(SELECT_STATS).fetchone()
+        
+        today, yesterday = self._read(
+            "SELECT date(?, 'unixepoch', 'localtime'), date(?, 'unixepoch', 'localtime', '-1 day')",
+            (int(now), int(now))
+        ).fetchone()
+        if last_active_day not in (today, yesterday):
+            streak = 0
+        
+        return {
+            "total_words": total_words,
+            "favorites": favorites,
+            "new_words": new_words,
+            "mastered": mastered,
+            "reviews": reviews,
+            "streak": streak,
+            "review_due": self.count_due(now),
+            "last_activity": last_activity
+        }
+    
+    def get_daily_activity(self, days=30):
+        """Return (day, words_added, reviews) rows for the most recent active days, newest first"""
+        return self._read(
+            'SELECT day, words_added, reviews FROM daily_activity ORDER BY day DESC LIMIT ?', (days,)
+        ).fetchall()
+    
+    def get_word_list(self):
+        return [row[0] for row in self._read('SELECT word FROM saved_words')]
     
     def word_exists(self, word):
-        self.cursor.execute('SELECT id FROM saved_words WHERE word = ?', (word,))
-        return self.cursor.fetchone() is not None
+        return self._read(SELECT_WORD_ID, (word,)).fetchone() is not None
     
     def close(self):
-        if self.conn:
-            self.conn.close()
\ No newline at end of file
+        self.connections.close()
+
+
+# Run to seed a scratch database and time the public methods:
+#   python -m data.database_manager [word_count]
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+    
+    word_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    db = WordDatabase(db_path)
+    
+    start = time.perf_counter()
+    with db.connections.writer() as conn:
+        conn.executemany(
+            "INSERT INTO saved_words (word, source_language, date_added, favorite) "
+            "VALUES (?, ?, datetime('2020-01-01', ? || ' seconds'), ?)",
+            ((f"word{i}", ("English", "Spanish")[i % 2], i, int(i % 50 == 0)) for i in range(word_count))
+        )
+    print(f"Seeded {word_count} words in {time.perf_counter() - start:.2f} s")
+    
+    def bench(name, fn, rounds=50):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        print(f"{name:<28}{(time.perf_counter() - start) / rounds * 1000:8.3f} ms")
+    
+    bench("get_saved_words()", db.get_saved_words)
+    bench("get_saved_words(offset=10k)", lambda: db.get_saved_words(offset=10000))
+    deep_row = db.get_saved_words(limit=1, offset=word_count - 200)[0]
+    bench("get_words_page(deep cursor)", lambda: db.get_words_page((deep_row[3], deep_row[0])))
+    bench("get_words_page(newer)", lambda: db.get_words_page((deep_row[3], deep_row[0]), "newer"))
+    bench("get_favorites()", db.get_favorites)
+    bench("get_favorites_page()", db.get_favorites_page)
+    bench("search_words('rd123')", lambda: db.search_words("rd123"))
+    bench("search_words('wrod1234')", lambda: db.search_words("wrod1234"))
+    bench("search_words('wo')", lambda: db.search_words("wo"))
+    bench("count_search_results('wo')", lambda: db.count_search_results("wo"))
+    bench("word_exists()", lambda: db.word_exists(f"word{word_count // 2}"))
+    bench("get_word_list()", db.get_word_list, rounds=5)
+    bench("toggle_favorite()", lambda: db.toggle_favorite(word_count // 3))
+    bench("save_word() + delete_word()", lambda: db.delete_word(db.save_word("benchmark", "English")))
+    
+    batch = [f"batch{i}" for i in range(10000)]
+    start = time.perf_counter()
+    for word in batch:
+        db.save_word(word, "English")
+    print(f"{'10k x save_word()':<28}{(time.perf_counter() - start) * 1000:8.1f} ms")
+    
+    batch = [f"bulk{i}" for i in range(10000)]
+    start = time.perf_counter()
+    db.save_words(batch, "English")
+    print(f"{'save_words(10k)':<28}{(time.perf_counter() - start) * 1000:8.1f} ms")
+    
+    now = time.time() + 86400
+    bench("get_due_cards(20)", lambda: db.get_due_cards(now))
+    bench("get_review_states(100)", lambda: db.get_review_states(range(1000, 1100)))
+    bench("count_words()", db.count_words)
+    bench("get_statistics()", lambda: db.get_statistics(now))
+    
+    # Collections: 1,000 collections in a two level tree, ~1M memberships
+    start = time.perf_counter()
+    parents = [db.create_collection(f"Group {i}") for i in range(50)]
+    collections = [db.create_collection(f"Collection {i}", parents[i % 50]) for i in range(950)]
+    membership_words = min(word_count, 1000)
+    with db.connections.writer() as conn:
+        conn.executemany(
+            INSERT_COLLECTION_WORD,
+            ((collection_id, word_id) for collection_id in collections
+             for word_id in range(1, membership_words + 1))
+        )
+    print(f"{'Seeded collections':<28}{(time.perf_counter() - start) * 1000:8.1f} ms "
+          f"({len(collections) * membership_words} memberships)")
+    
+    bench("get_child_collections()", db.get_child_collections)
+    bench("get_child_collections(p)", lambda: db.get_child_collections(parents[7]))
+    page = db.get_collection_words(collections[500])
+    bench("get_collection_words()", lambda: db.get_collection_words(collections[500]))
+    bench("get_collection_words(cur)", lambda: db.get_collection_words(
+        collections[500], (page[-1][5], page[-1][0])))
+    bench("add + remove 100 members", lambda: (
+        db.add_words_to_collection(collections[3], range(2000, 2100)),
+        db.remove_words_from_collection(collections[3], range(2000, 2100))
+    ), rounds=10)
+    
+    start = time.perf_counter()
+    db.delete_collection(parents[0])
+    print(f"{'delete_collection(tree)':<28}{(time.perf_counter() - start) * 1000:8.1f} ms")
+    
+    # Stress: readers on several threads while writers insert, toggle and delete
+    import threading
+    
+    errors = []
+    counts = {"reads": 0, "writes": 0}
+    stop = threading.Event()
+    
+    def reader():
+        while not stop.is_set():
+            try:
+                db.get_saved_words()
+                db.search_words("rd12")
+                db.word_exists("word1")
+                counts["reads"] += 3
+            except Exception as e:
+                errors.append(e)
+    
+    def writer(n):
+        i = 0
+        while not stop.is_set():
+            try:
+                word_id = db.save_word(f"stress{n}-{i}", "English")
+                db.toggle_favorite(word_id)
+                db.save_words([f"stressbatch{n}-{i}-{j}" for j in range(20)], "English")
+                db.delete_word(word_id)
+                counts["writes"] += 4
+                i += 1
+            except Exception as e:
+                errors.append(e)
+    
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(3)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    print(f"Stress (4 readers, 2 writers, 3 s): {counts['reads']} reads, {counts['writes']} writes, "
+          f"{len(errors)} errors{': ' + repr(errors[0]) if errors else ''}")
+    db.close()
\ No newline at end of file
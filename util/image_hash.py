@@ -0,0 +1,34 @@
+import numpy as np
+from PIL import Image
+
+THUMBNAIL_SIZE = (64, 32)
+HASH_SIZE = 8
+
+
+def thumbnail(image, size=THUMBNAIL_SIZE):
+    """Grayscale box-filtered thumbnail as a float array in 0-1, cheap to compare"""
+    return np.asarray(image.convert("L").resize(size, Image.BOX), dtype=np.float32) / 255
+
+
+def changed_share(a, b, pixel_threshold=0.04):
+    """Share of thumbnail cells whose brightness differs by more than `pixel_threshold`"""
+    return float(np.mean(np.abs(a - b) > pixel_threshold))
+
+
+def dhash(image, width=HASH_SIZE, height=None):
+    """
+    Difference hash of an image as an int of width * height bits
+
+    Each bit tells whether a cell of a downscaled grayscale copy is brighter
+    than its right neighbour, so small shifts in brightness or noise leave
+    most bits unchanged. Wide hashes suit lines of text.
+    """
+    height = height or width
+    cells = np.asarray(image.convert("L").resize((width + 1, height), Image.BOX), dtype=np.int16)
+    bits = np.packbits(cells[:, 1:] > cells[:, :-1])
+    return int.from_bytes(bits.tobytes(), "big")
+
+
+def hamming(a, b):
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count("1")
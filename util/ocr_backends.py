@@ -0,0 +1,145 @@
+import importlib.util
+import io
+import shutil
+import subprocess
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+class PytesseractBackend:
+    """pytesseract.image_to_string, one tesseract process and temp files per call"""
+    name = "pytesseract"
+
+    def __init__(self, language="eng", tesseract_cmd=""):
+        # Imported here so the other backends work without pytesseract installed
+        import pytesseract
+        self.pytesseract = pytesseract
+        self.language = language
+        if tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+    def recognize(self, image):
+        return self.pytesseract.image_to_string(image, lang=self.language)
+
+    def close(self):
+        pass
+
+
+class TesseractCliBackend:
+    """The tesseract executable fed a PNG on stdin, text read from stdout, no temp files"""
+    name = "cli"
+
+    def __init__(self, language="eng", tesseract_cmd=""):
+        self.command = [tesseract_cmd or shutil.which("tesseract") or "tesseract",
+                        "stdin", "stdout", "-l", language]
+
+    def recognize(self, image):
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        result = subprocess.run(self.command, input=buffer.getvalue(), capture_output=True, check=True)
+        return result.stdout.decode("utf-8", errors="replace")
+
+    def close(self):
+        pass
+
+
+class TesserocrBackend:
+    """A long-lived Tesseract API from tesserocr, the language model is loaded once"""
+    name = "tesserocr"
+
+    def __init__(self, language="eng", tesseract_cmd=""):
+        self.api = tesserocr.PyTessBaseAPI(lang=language)
+
+    def recognize(self, image):
+        self.api.SetImage(image)
+        return self.api.GetUTF8Text()
+
+    def close(self):
+        self.api.End()
+
+
+BACKENDS = {
+    backend.name: backend for backend in (TesserocrBackend, TesseractCliBackend, PytesseractBackend)
+}
+
+
+def available_backends():
+    """Names of the backends usable here, fastest first"""
+    names = []
+    if tesserocr is not None:
+        names.append(TesserocrBackend.name)
+    names.append(TesseractCliBackend.name)
+    if importlib.util.find_spec("pytesseract") is not None:
+        names.append(PytesseractBackend.name)
+    return names
+
+
+def create_backend(name="auto", language="eng", tesseract_cmd=""):
+    """
+    Create an OCR backend
+
+    Args:
+        name: "tesserocr", "cli", "pytesseract", or "auto" for tesserocr when
+            installed, then pytesseract, then the tesseract executable
+        language: Tesseract language code
+        tesseract_cmd: Path of the tesseract executable, empty to use PATH
+    """
+    if name == "auto":
+        if tesserocr is not None:
+            return TesserocrBackend(language, tesseract_cmd)
+        try:
+            return PytesseractBackend(language, tesseract_cmd)
+        except ImportError:
+            return TesseractCliBackend(language, tesseract_cmd)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown OCR backend: {name}")
+    if name == TesserocrBackend.name and tesserocr is None:
+        raise ValueError("The tesserocr backend needs the tesserocr package")
+    return BACKENDS[name](language, tesseract_cmd)
+
+
+# Run to measure per-call latency on small regions:
+#   python -m util.ocr_backends [backend ...] [--calls N]
+if __name__ == "__main__":
+    import statistics
+    import sys
+    import time
+    from util.image_preprocess import preprocess, render_sample
+
+    args = sys.argv[1:]
+    calls = 20
+    if "--calls" in args:
+        position = args.index("--calls")
+        calls = int(args[position + 1])
+        del args[position:position + 2]
+    names = args or available_backends()
+
+    text = "Press E to talk to the innkeeper"
+    image = preprocess(render_sample(text, size=12))
+    print(f"Region of {image.width}x{image.height} px, {calls} calls per backend")
+
+    for name in names:
+        try:
+            start = time.perf_counter()
+            backend = create_backend(name)
+            first = backend.recognize(image)
+            cold = time.perf_counter() - start
+        except Exception as e:
+            print(f"  {name:>12}: unavailable ({e})")
+            continue
+
+        latencies = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            backend.recognize(image)
+            latencies.append(time.perf_counter() - start)
+        backend.close()
+
+        latencies.sort()
+        print(f"  {name:>12}: first call {cold * 1000:7.1f} ms, "
+              f"median {statistics.median(latencies) * 1000:7.1f} ms, "
+              f"p95 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000:7.1f} ms, "
+              f"read {' '.join(first.split())!r}")
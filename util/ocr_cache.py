@@ -0,0 +1,241 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from util.image_hash import dhash, hamming
+
+# 32x16 difference hash, wide like a line of text
+HASH_WIDTH = 32
+HASH_HEIGHT = 16
+
+
+def image_key(image):
+    """Perceptual hash of a preprocessed capture"""
+    return dhash(image, HASH_WIDTH, HASH_HEIGHT)
+
+
+class OcrCache:
+    """OCR results keyed by a perceptual hash of the preprocessed capture
+
+    A bounded in-memory LRU answers exact and near matches: any entry within
+    `max_distance` differing bits of the hash counts as the same capture, so
+    capture noise still hits. When `db_path` is given, results are also
+    stored in SQLite and the most recently used ones are loaded back into
+    memory on start. Only the memory LRU is searched for near matches, the
+    disk store answers exact matches.
+    """
+    def __init__(self, db_path=None, memory_entries=512, max_entries=5000, max_distance=8):
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+        self._memory = OrderedDict()    # (hash, language) -> (text, ocr seconds)
+        self._lock = threading.Lock()
+
+        self.conn = None
+        if db_path:
+            db_dir = os.path.dirname(os.path.abspath(db_path))
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir, exist_ok=True)
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.create_tables()
+            self._load_recent()
+
+    def create_tables(self):
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS ocr_cache (
+            image_hash TEXT NOT NULL,
+            language TEXT NOT NULL,
+            text TEXT NOT NULL,
+            ocr_seconds REAL NOT NULL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (image_hash, language)
+        ) WITHOUT ROWID
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_ocr_cache_access ON ocr_cache (last_access)')
+        self.conn.commit()
+
+    def _load_recent(self):
+        rows = self.conn.execute('''
+        SELECT image_hash, language, text, ocr_seconds FROM ocr_cache
+        ORDER BY last_access DESC LIMIT ?
+        ''', (self.memory_entries,)).fetchall()
+        for image_hash, language, text, ocr_seconds in reversed(rows):
+            self._memory[(int(image_hash, 16), language)] = (text, ocr_seconds)
+
+    def get(self, image_hash, language):
+        """Return the text of a matching capture, or None on a miss"""
+        with self._lock:
+            key = (image_hash, language)
+            entry = self._memory.get(key)
+            if entry is None:
+                key, entry = self._nearest(image_hash, language)
+                if entry is not None:
+                    self.near_hits += 1
+            if entry is None and self.conn is not None:
+                entry = self._load(image_hash, language)
+                key = (image_hash, language)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._remember(key, entry)
+            self.hits += 1
+            self.saved_seconds += entry[1]
+            return entry[0]
+
+    def put(self, image_hash, language, text, ocr_seconds=0.0):
+        """Store the OCR result of a capture, with the time OCR took for the saved-time stats"""
+        with self._lock:
+            self._remember((image_hash, language), (text, ocr_seconds))
+            if self.conn is None:
+                return
+            self.conn.execute('''
+            INSERT OR REPLACE INTO ocr_cache (image_hash, language, text, ocr_seconds, last_access)
+            VALUES (?, ?, ?, ?, ?)
+            ''', (format(image_hash, "x"), language, text, ocr_seconds, time.time()))
+            self._evict()
+            self.conn.commit()
+
+    def stats(self):
+        """Return hit/miss counters, the hit rate and the OCR time saved by hits"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_ms": self.saved_seconds * 1000,
+            "entries": len(self._memory)
+        }
+
+    def close(self):
+        with self._lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    def _nearest(self, image_hash, language):
+        best_key, best_entry, best_distance = None, None, self.max_distance + 1
+        for key, entry in self._memory.items():
+            if key[1] != language:
+                continue
+            distance = hamming(image_hash, key[0])
+            if distance < best_distance:
+                best_key, best_entry, best_distance = key, entry, distance
+        return best_key, best_entry
+
+    def _load(self, image_hash, language):
+        hex_hash = format(image_hash, "x")
+        row = self.conn.execute(
+            'SELECT text, ocr_seconds FROM ocr_cache WHERE image_hash = ? AND language = ?',
+            (hex_hash, language)
+        ).fetchone()
+        if row is None:
+            return None
+        self.conn.execute('UPDATE ocr_cache SET last_access = ? WHERE image_hash = ? AND language = ?',
+                          (time.time(), hex_hash, language))
+        self.conn.commit()
+        return row
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        count = self.conn.execute('SELECT COUNT(*) FROM ocr_cache').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute('''
+            DELETE FROM ocr_cache WHERE (image_hash, language) IN (
+                SELECT image_hash, language FROM ocr_cache
+                ORDER BY last_access LIMIT ?
+            )
+            ''', (excess,))
+
+
+# Run to replay a frame sequence through the cache, a generated one without arguments:
+#   python -m util.ocr_cache [frame ...]
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import numpy as np
+    from PIL import Image
+    from util.image_preprocess import preprocess, render_sample
+
+    try:
+        import pytesseract
+        pytesseract.get_tesseract_version()
+    except Exception:
+        pytesseract = None
+
+    ASSUMED_OCR_SECONDS = 0.15
+
+    labelled = len(sys.argv) == 1
+    if not labelled:
+        frames = [(path, Image.open(path)) for path in sys.argv[1:]]
+    else:
+        # Dialogue boxes, menus and item names shown again and again, with capture noise and jitter
+        lines = [
+            "The merchant offers you a rusty sword.",
+            "Quest updated: find the lost amulet",
+            "You cannot carry any more items!",
+            "Press E to talk to the innkeeper",
+            "Health Potion x3",
+            "Inventory   Map   Quests   Options",
+            "The merchant offers you a dusty shield."
+        ]
+        rng = np.random.default_rng(0)
+        frames = []
+        for line_index in rng.integers(0, len(lines), 300).tolist():
+            base = np.asarray(render_sample(lines[line_index], size=12, seed=line_index), dtype=np.int16)
+            base = base[:, int(rng.integers(0, 4)):]
+            noise = rng.integers(-4, 5, base.shape)
+            frames.append((lines[line_index], Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8))))
+
+    def recognize(label, image):
+        if pytesseract is None:
+            return label, ASSUMED_OCR_SECONDS
+        start = time.perf_counter()
+        text = pytesseract.image_to_string(image)
+        return text, time.perf_counter() - start
+
+    db_path = os.path.join(tempfile.mkdtemp(), "ocr_cache.db")
+    cache = OcrCache(db_path)
+    lookup_time = 0.0
+    wrong = 0
+    for label, image in frames:
+        processed = preprocess(image)
+        start = time.perf_counter()
+        key = image_key(processed)
+        text = cache.get(key, "eng")
+        lookup_time += time.perf_counter() - start
+        if text is None:
+            text, seconds = recognize(label, processed)
+            cache.put(key, "eng", text, seconds)
+        elif pytesseract is None and labelled and text != label:
+            wrong += 1
+
+    stats = cache.stats()
+    print(f"{len(frames)} frames: hit rate {stats['hit_rate']:.1%} "
+          f"({stats['hits']} hits, {stats['near_hits']} near, {stats['misses']} misses)")
+    print(f"  lookup {lookup_time / len(frames) * 1000:.2f} ms per frame, OCR time saved {stats['saved_ms'] / 1000:.1f} s"
+          + (f" at an assumed {ASSUMED_OCR_SECONDS * 1000:.0f} ms per OCR call" if pytesseract is None else ""))
+    if pytesseract is None and labelled:
+        print(f"  hits returning another line's text: {wrong}")
+    cache.close()
+
+    reopened = OcrCache(db_path)
+    print(f"  entries restored from disk: {reopened.stats()['entries']}")
+    reopened.close()
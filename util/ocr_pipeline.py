@@ -0,0 +1,223 @@
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+from util.ocr_backends import create_backend
+from util.ocr_cache import image_key
+
+STAGES = ("capture", "queue", "preprocess", "lookup", "ocr", "deliver")
+
+# OCR engine of the current pool process
+_engine = None
+
+
+def _init_ocr_worker(backend, language, tesseract_cmd):
+    # Runs once in each OCR process, so the engine and its model stay loaded
+    global _engine
+    _engine = create_backend(backend, language, tesseract_cmd)
+    _engine.recognize(Image.new("L", (32, 32), 255))
+
+
+def _run_ocr(image):
+    """OCR one image in a pool process, returns (text, seconds spent)"""
+    start = time.perf_counter()
+    text = _engine.recognize(image)
+    return text, time.perf_counter() - start
+
+
+class OcrPipeline:
+    """Capture, preprocess and OCR screen regions off the Tk thread
+
+    submit() queues a capture callable on a bounded queue. A stage thread
+    takes the capture and preprocesses it, then hands the image to a process
+    pool for OCR, so several captures are recognized on separate cores. Each
+    pool process creates its OCR backend once and warms it up, so a
+    persistent engine keeps its language model loaded between captures.
+    Results are posted back through `post` (UIDispatcher.post) and reach
+    on_text(text, timings) on the Tk thread. A result older than one already
+    delivered is dropped. When the queue is full the oldest waiting capture
+    is discarded, since a newer capture of the screen supersedes it. With a
+    cache, a capture looking like one recognized before skips OCR.
+    """
+    def __init__(self, post, on_text, preprocess=None, cache=None, backend="auto", language="eng",
+                 tesseract_cmd="", workers=2, max_pending=2):
+        """
+        Args:
+            post: Callable queuing post(callback, *args, key=None) on the Tk thread
+            on_text: Called on the Tk thread as on_text(text, timings), timings in ms per stage
+            preprocess: Optional callable turning a captured image into the image to OCR
+            cache: Optional OcrCache consulted before OCR
+            backend: OCR backend name, see util.ocr_backends.create_backend
+            language: Tesseract language code
+            tesseract_cmd: Path of the tesseract executable, empty to use PATH
+            workers: Number of OCR processes
+            max_pending: Captures waiting for the stage thread before the oldest is dropped
+        """
+        self.post = post
+        self.on_text = on_text
+        self.preprocess = preprocess
+        self.cache = cache
+        self.language = language
+        self.logger = logging.getLogger(__name__)
+
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._sequence = itertools.count(1)
+        self._delivered = 0
+        self._lock = threading.Lock()
+        self._stats = {stage: [0, 0.0, 0.0] for stage in STAGES}   # count, total, max
+        self._dropped = 0
+
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker,
+                                             initargs=(backend, language, tesseract_cmd))
+        self._thread = threading.Thread(target=self._stage_loop, name="ocr-stage", daemon=True)
+        self._thread.start()
+
+    def submit(self, capture):
+        """
+        Queue a screen capture for OCR, may be called from any thread
+
+        Args:
+            capture: Callable returning a PIL image, run on the stage thread
+        """
+        job = {"sequence": next(self._sequence), "capture": capture, "queued": time.perf_counter()}
+        while True:
+            try:
+                self._queue.put_nowait(job)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._count_drop()
+                except queue.Empty:
+                    pass
+
+    def _stage_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                self._process(job)
+            except Exception as e:
+                self.logger.error(f"OCR capture failed: {e}")
+                self._count_drop()
+
+    def _process(self, job):
+        timings = {"queue": time.perf_counter() - job["queued"]}
+
+        start = time.perf_counter()
+        image = job["capture"]()
+        timings["capture"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if self.preprocess is not None:
+            image = self.preprocess(image)
+        timings["preprocess"] = time.perf_counter() - start
+
+        image_hash = None
+        if self.cache is not None:
+            start = time.perf_counter()
+            image_hash = image_key(image)
+            text = self.cache.get(image_hash, self.language)
+            timings["lookup"] = time.perf_counter() - start
+            if text is not None:
+                self.post(self._deliver, job["sequence"], text, timings, time.perf_counter())
+                return
+
+        future = self._executor.submit(_run_ocr, image)
+        future.add_done_callback(lambda f: self._on_ocr_done(job["sequence"], image_hash, timings, f))
+
+    def _on_ocr_done(self, sequence, image_hash, timings, future):
+        # Runs on a pool management thread
+        try:
+            text, timings["ocr"] = future.result()
+        except Exception as e:
+            self.logger.error(f"OCR failed: {e}")
+            self._count_drop()
+            return
+        if image_hash is not None:
+            self.cache.put(image_hash, self.language, text, timings["ocr"])
+        self.post(self._deliver, sequence, text, timings, time.perf_counter())
+
+    def _deliver(self, sequence, text, timings, posted):
+        # Runs on the Tk thread
+        if sequence < self._delivered:
+            self._count_drop()
+            return
+        self._delivered = sequence
+
+        # Delivery covers the wait in the dispatcher queue
+        timings["deliver"] = time.perf_counter() - posted
+        self._record(timings)
+        self.logger.debug(f"OCR #{sequence}: " + ", ".join(
+            f"{stage} {timings[stage] * 1000:.1f} ms" for stage in STAGES if stage in timings))
+        self.on_text(text, {stage: seconds * 1000 for stage, seconds in timings.items()})
+
+    def _record(self, timings):
+        with self._lock:
+            for stage, seconds in timings.items():
+                entry = self._stats[stage]
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def _count_drop(self):
+        with self._lock:
+            self._dropped += 1
+
+    def stats(self):
+        """Return {stage: {count, mean_ms, max_ms}} plus the number of dropped or failed captures"""
+        with self._lock:
+            stats = {
+                stage: {
+                    "count": count,
+                    "mean_ms": total * 1000 / count if count else 0.0,
+                    "max_ms": longest * 1000
+                }
+                for stage, (count, total, longest) in self._stats.items()
+            }
+            stats["dropped"] = self._dropped
+        return stats
+
+    def shutdown(self):
+        """Stop the stage thread and the OCR processes, pending captures are discarded"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put(None)
+        self._thread.join(timeout=2)
+        self._executor.shutdown(wait=False)
+
+
+# Run to time each stage on image files:
+#   python -m util.ocr_pipeline image [image ...]
+if __name__ == "__main__":
+    import sys
+    from PIL import Image
+
+    paths = sys.argv[1:]
+
+    def deliver_now(callback, *args, key=None):
+        # Stands in for the UIDispatcher, there is no Tk thread here
+        callback(*args)
+
+    def show(text, timings):
+        print(" | ".join(f"{stage} {ms:7.1f} ms" for stage, ms in timings.items()))
+        print("  " + text.strip().replace("\n", " ")[:100])
+
+    pipeline = OcrPipeline(deliver_now, show, max_pending=len(paths))
+    start = time.perf_counter()
+    for path in paths:
+        pipeline.submit(lambda path=path: Image.open(path).convert("RGB"))
+    # Results that finish after a newer one are dropped, as in the app
+    while pipeline.stats()["deliver"]["count"] + pipeline.stats()["dropped"] < len(paths):
+        time.sleep(0.01)
+    print(f"{len(paths)} images in {time.perf_counter() - start:.2f} s")
+    for stage, stage_stats in pipeline.stats().items():
+        print(f"  {stage}: {stage_stats}")
+    pipeline.shutdown()
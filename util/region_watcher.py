@@ -0,0 +1,183 @@
+import logging
+import threading
+import time
+from PIL import Image, ImageGrab
+from util.image_hash import thumbnail, changed_share
+
+
+class ScreenRegionSource:
+    """Frame source grabbing a (left, top, right, bottom) screen region"""
+    def __init__(self, region):
+        self.region = region
+
+    def __call__(self):
+        return ImageGrab.grab(self.region)
+
+
+class FileSequenceSource:
+    """Frame source replaying image files in order, returns None after the last one"""
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.position = 0
+
+    def __call__(self):
+        if self.position >= len(self.paths):
+            return None
+        image = Image.open(self.paths[self.position])
+        image.load()
+        self.position += 1
+        return image
+
+
+class RegionWatcher:
+    """Watches a screen region and reports its frames only when the content changes
+
+    Each frame is reduced to a small thumbnail and compared with the last
+    reported one, so a static region costs a grab and a resize per frame.
+    A changed frame is reported once it has stayed the same for
+    `settle_frames` frames, which skips the intermediate frames of text
+    being typed out or faded in.
+    """
+    def __init__(self, source, on_change, fps=2, change_threshold=0.01, settle_frames=1, settle_threshold=0.002,
+                 pixel_threshold=0.04):
+        """
+        Args:
+            source: Callable returning the next frame as a PIL image, or None when there are no more
+            on_change: Called with the changed frame, on the watcher thread
+            fps: Frames checked per second
+            change_threshold: Share of thumbnail cells that must change to count as new content
+            settle_frames: Unchanged frames required before a change is reported
+            settle_threshold: Largest share of changed cells between frames that still counts as unchanged
+            pixel_threshold: Brightness difference of a thumbnail cell counted as a change
+        """
+        self.source = source
+        self.on_change = on_change
+        self.fps = fps
+        self.change_threshold = change_threshold
+        self.settle_frames = settle_frames
+        self.settle_threshold = settle_threshold
+        self.pixel_threshold = pixel_threshold
+        self.logger = logging.getLogger(__name__)
+
+        self._reported = None
+        self._previous = None
+        self._stable = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._stats = {"frames": 0, "changes": 0, "step_time": 0.0}
+
+    def _differs(self, a, b, threshold):
+        return changed_share(a, b, self.pixel_threshold) > threshold
+
+    def step(self, frame):
+        """Check one frame, returns True if it was reported as changed"""
+        start = time.perf_counter()
+        current = thumbnail(frame)
+        previous, self._previous = self._previous, current
+        self._stats["frames"] += 1
+
+        changed = False
+        if self._reported is None or self._differs(current, self._reported, self.change_threshold):
+            if previous is not None and not self._differs(current, previous, self.settle_threshold):
+                self._stable += 1
+            else:
+                self._stable = 0
+            changed = self._stable >= self.settle_frames
+        else:
+            self._stable = 0
+
+        self._stats["step_time"] += time.perf_counter() - start
+        if changed:
+            self._reported = current
+            self._stable = 0
+            self._stats["changes"] += 1
+            self.on_change(frame)
+        return changed
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="region-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def _run(self):
+        interval = 1 / self.fps
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            try:
+                frame = self.source()
+                if frame is None:
+                    return
+                self.step(frame)
+            except Exception as e:
+                self.logger.error(f"Region watcher failed: {e}")
+            self._stop_event.wait(max(0.0, interval - (time.perf_counter() - started)))
+
+    def stats(self):
+        """Return frames checked, changes reported and mean check time in ms"""
+        frames = self._stats["frames"]
+        return {
+            "frames": frames,
+            "changes": self._stats["changes"],
+            "mean_step_ms": self._stats["step_time"] * 1000 / frames if frames else 0.0
+        }
+
+
+# Run to replay frame files, or a generated dialogue sequence without arguments:
+#   python -m util.region_watcher [frame ...]
+if __name__ == "__main__":
+    import sys
+    import numpy as np
+    from util.image_preprocess import render_sample
+
+    if len(sys.argv) > 1:
+        source = FileSequenceSource(sys.argv[1:])
+        expected = None
+    else:
+        lines = [
+            "The merchant offers you a rusty sword.",
+            "Quest updated: find the lost amulet",
+            "You cannot carry any more items!",
+            "Press E to talk to the innkeeper"
+        ]
+        rng = np.random.default_rng(0)
+        frames = []
+        for i, line in enumerate(lines):
+            # Typed out over a few frames, then left on screen
+            for shown in [len(line) * k // 4 for k in range(1, 4)] + [len(line)] * 20:
+                base = np.asarray(render_sample(line[:shown], seed=i), dtype=np.int16)
+                noise = rng.integers(-3, 4, base.shape)
+                frames.append(Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8)))
+        source = iter(frames).__next__
+        expected = len(lines)
+
+    def frame_source():
+        try:
+            return source()
+        except StopIteration:
+            return None
+
+    reported = []
+    watcher = RegionWatcher(frame_source, reported.append)
+    while True:
+        frame = frame_source()
+        if frame is None:
+            break
+        watcher.step(frame)
+
+    stats = watcher.stats()
+    print(f"{stats['frames']} frames, {stats['changes']} sent to OCR"
+          + (f" (expected {expected})" if expected is not None else "")
+          + f", {stats['mean_step_ms']:.2f} ms per frame check")
+    print(f"OCR calls avoided: {stats['frames'] - stats['changes']} of {stats['frames']}")
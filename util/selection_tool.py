@@ -2,17 +2,25 @@ import tkinter as tk
 import keyboard
 from pynput import mouse
 from PIL import ImageGrab
-import pytesseract
 
-pytesseract.pytesseract.tesseract_cmd = r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+# Time for the overlay to disappear from the screen before the region is grabbed
+OVERLAY_HIDE_MS = 50
 
 class GlobalSelectionApp:
-    def __init__(self, parent):
+    """Select a screen region with the mouse and OCR it through an OcrPipeline
+
+    pynput and keyboard call back on their own threads, so their events are
+    posted to the parent's UIDispatcher and handled on the Tk thread.
+    """
+    def __init__(self, parent, pipeline):
         self.parent = parent
+        self.dispatcher = parent.dispatcher
+        self.pipeline = pipeline
         self.active = False
         self.start_x = None
         self.start_y = None
         self.result_window = None
+        self.on_region = None
 
         self.root = tk.Toplevel(self.parent)
         self.root.attributes("-fullscreen", True)
@@ -26,15 +34,25 @@ class GlobalSelectionApp:
 
         self.rect_id = None
 
-        keyboard.add_hotkey("esc", self.on_esc)
+        keyboard.add_hotkey("esc", lambda: self.dispatcher.post(self.on_esc))
+
+        self.mouse_listener = self._create_listener()
 
-        self.mouse_listener = mouse.Listener(
-            on_click=self.on_mouse_press,
-            on_move=self.on_mouse_move
+    def _create_listener(self):
+        return mouse.Listener(
+            on_click=lambda *args: self.dispatcher.post(self.on_mouse_press, *args),
+            on_move=lambda *args: self.dispatcher.post(self.on_mouse_move, *args, key="selection.move")
         )
 
-    def on_ctrl_e(self):
+    def on_ctrl_e(self, on_region=None):
+        """
+        Start selecting a region, OCR'd once when the selection ends
+
+        Args:
+            on_region: Called with the (left, top, right, bottom) region instead of OCR'ing it
+        """
         print("Selection mode active")
+        self.on_region = on_region
         self.active = True
         self.root.deiconify()
         if not self.mouse_listener.running:
@@ -49,15 +67,17 @@ class GlobalSelectionApp:
         if self.active and button == mouse.Button.left and pressed:
             self.start_x, self.start_y = x, y
             self.rect_id = self.canvas.create_rectangle(x, y, x, y, outline="red", width=2)
-        elif self.active and button == mouse.Button.left and not pressed:
-            self.root.attributes("-alpha", 0)
-            capture = self.screenshot(self.start_x, self.start_y, x - self.start_x, y - self.start_y)
-            print("Saved as img.png")
-            text = self.extract_text(capture)
-            print(text)
-            self.parent.native_text_widget.delete(1.0, tk.END)
-            self.parent.native_text_widget.insert(tk.END, text)
+        elif self.active and button == mouse.Button.left and not pressed and self.start_x is not None:
+            region = (min(self.start_x, x), min(self.start_y, y), max(self.start_x, x), max(self.start_y, y))
+            on_region = self.on_region
             self.cancel_selection()
+            if region[2] <= region[0] or region[3] <= region[1]:
+                return
+            # The region is grabbed once the overlay is gone
+            if on_region is not None:
+                self.root.after(OVERLAY_HIDE_MS, on_region, region)
+            else:
+                self.root.after(OVERLAY_HIDE_MS, self.pipeline.submit, lambda: self.screenshot(*region))
 
     def on_mouse_move(self, x, y):
         if self.active and self.start_x is not None and self.start_y is not None:
@@ -65,6 +85,7 @@ class GlobalSelectionApp:
 
     def cancel_selection(self):
         self.active = False
+        self.on_region = None
         self.root.attributes("-alpha", 0.2)
         self.root.withdraw()
         if self.rect_id:
@@ -73,17 +94,21 @@ class GlobalSelectionApp:
         self.rect_id = None
         if self.mouse_listener.running:
             self.mouse_listener.stop()
-        self.mouse_listener = mouse.Listener(
-            on_click=self.on_mouse_press,
-            on_move=self.on_mouse_move
-        )
-
-    def screenshot(x, y, width, height):
-        return ImageGrab.grab((x, y, x + width, y + height))
+        self.mouse_listener = self._create_listener()
 
-    def extract_text(img):
-        return pytesseract.image_to_string(img)
+    @staticmethod
+    def screenshot(left, top, right, bottom):
+        return ImageGrab.grab((left, top, right, bottom))
 
 if __name__ == "__main__":
-    app = GlobalSelectionApp()
-    app.root.mainloop()
\ No newline at end of file
+    from core.ui_dispatcher import UIDispatcher
+    from util.ocr_pipeline import OcrPipeline
+
+    root = tk.Tk()
+    root.dispatcher = UIDispatcher(root)
+    root.dispatcher.start()
+    pipeline = OcrPipeline(root.dispatcher.post, lambda text, timings: print(timings, text, sep="\n"))
+    app = GlobalSelectionApp(root, pipeline)
+    app.on_ctrl_e()
+    root.mainloop()
+    pipeline.shutdown()
\ No newline at end of file
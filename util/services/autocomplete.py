@@ -0,0 +1,111 @@
+import heapq
+import logging
+import os
+from bisect import bisect_left, insort
+
+
+class PrefixIndex:
+    """Local autocomplete over a sorted word array, ranked by frequency
+
+    Words are kept casefolded in a sorted list, so the candidates for a prefix
+    are a contiguous slice found with two binary searches. Each word carries a
+    weight (saved words, past lookups, word list frequency) used for ranking.
+    """
+    def __init__(self):
+        self._words = []
+        self._weights = {}
+        self._display = {}
+        self._memo = {}
+
+    def __len__(self):
+        return len(self._words)
+
+    def add(self, word, weight=1):
+        """Add a word or increase the weight of a known one"""
+        key = self._register(word, weight)
+        if key is not None:
+            insort(self._words, key)
+        self._memo.clear()
+
+    def add_many(self, words, weight=1):
+        """Add several words, sorting the array once instead of per word"""
+        new_keys = [key for key in (self._register(word, weight) for word in words) if key is not None]
+        if new_keys:
+            self._words.extend(new_keys)
+            self._words.sort()
+        self._memo.clear()
+
+    def _register(self, word, weight):
+        """Update the weight of a word and return its key if it is new to the index"""
+        word = word.strip()
+        if not word:
+            return None
+
+        key = word.casefold()
+        is_new = key not in self._weights
+        if is_new:
+            self._weights[key] = 0
+            self._display[key] = word
+        self._weights[key] += weight
+        return key if is_new else None
+
+    def load_word_list(self, path):
+        """Load a word list with one `word` or `word<TAB>count` per line
+
+        Lines without a count are weighted by their position, so frequency
+        ordered lists rank their first entries highest. Lines whose count is
+        not a number, such as a header, are skipped and logged.
+        """
+        if not path or not os.path.exists(path):
+            return 0
+
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [line.rstrip("\n").split("\t") for line in f if line.strip()]
+
+        total = len(lines)
+        skipped = 0
+        for rank, parts in enumerate(lines):
+            try:
+                weight = float(parts[1]) if len(parts) > 1 else (total - rank) / total
+            except ValueError:
+                skipped += 1
+                continue
+            key = self._register(parts[0], weight)
+            if key is not None:
+                self._words.append(key)
+        self._words.sort()
+        self._memo.clear()
+
+        if skipped:
+            logging.getLogger(__name__).warning(f"Skipped {skipped} unparsable lines in word list {path}")
+        return total - skipped
+
+    def record_use(self, word, weight=5):
+        """Boost a word the user looked up or saved"""
+        self.add(word, weight)
+
+    def complete(self, prefix, limit=10):
+        """Return up to `limit` words starting with the prefix, most frequent first"""
+        prefix = prefix.strip().casefold()
+        if not prefix:
+            return []
+
+        memo_key = (prefix, limit)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        lo = bisect_left(self._words, prefix)
+        hi = bisect_left(self._words, prefix + "\U0010ffff", lo)
+        candidates = self._words[lo:hi] if hi - lo <= limit else None
+
+        if candidates is None:
+            candidates = heapq.nlargest(limit, (self._words[i] for i in range(lo, hi)),
+                                        key=self._weights.__getitem__)
+        else:
+            candidates.sort(key=self._weights.__getitem__, reverse=True)
+
+        result = [self._display[key] for key in candidates]
+        if len(self._memo) > 4096:
+            self._memo.clear()
+        self._memo[memo_key] = result
+        return result
@@ -1,9 +1,255 @@
+import json
+import mmap
+import os
+import struct
+import time
+
+INDEX_MAGIC = b"PYDX"
+INDEX_VERSION = 1
+
+_HEADER = struct.Struct("<4sIQ")     # magic, version, key count
+_OFFSET = struct.Struct("<Q")        # position of a key entry / data record
+_KEY_LEN = struct.Struct("<H")
+_RECORD_LEN = struct.Struct("<I")
+
+
+def _index_key(word, language):
+    return f"{language}\x00{word.casefold()}".encode("utf-8")
+
+
+def _words(items):
+    return [item["word"] for item in items or [] if item.get("word")]
+
+
+def _convert_entry(entry):
+    """Reduce a Wiktextract entry to the fields the lookup result needs"""
+    definitions = []
+    examples = []
+    for sense in entry.get("senses", []):
+        glosses = sense.get("glosses") or sense.get("raw_glosses") or []
+        if glosses:
+            definitions.append("; ".join(glosses))
+        for example in sense.get("examples", []):
+            if example.get("text"):
+                examples.append(example["text"])
+
+    return {
+        "word": entry["word"],
+        "pos": entry.get("pos", ""),
+        "definitions": definitions,
+        "examples": examples,
+        "etymology": entry.get("etymology_text", ""),
+        "ipa": [sound["ipa"] for sound in entry.get("sounds", []) if sound.get("ipa")],
+        "synonyms": _words(entry.get("synonyms")),
+        "antonyms": _words(entry.get("antonyms")),
+        "related": _words(entry.get("related")) + _words(entry.get("derived"))
+    }
+
+
+def build_dictionary(dump_path, output_path, languages=None, progress_callback=None):
+    """
+    Import a Wiktextract JSONL dump into an indexed offline dictionary
+
+    Writes `<output_path>.dat` with length-prefixed JSON records and
+    `<output_path>.idx` with a sorted key table that DictionaryService
+    binary-searches through mmap.
+
+    Args:
+        dump_path: Path to the Wiktextract JSONL file
+        output_path: Base path of the generated files
+        languages: Optional collection of language names to keep
+        progress_callback: Called with the number of imported entries every 10k entries
+
+    Returns:
+        Dict with the number of imported entries, distinct keys and elapsed seconds
+    """
+    start = time.perf_counter()
+    keys = []
+
+    with open(dump_path, "r", encoding="utf-8") as dump, open(output_path + ".dat", "wb") as data:
+        offset = 0
+        for line in dump:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if "word" not in entry or (languages and entry.get("lang") not in languages):
+                continue
+
+            record = json.dumps(_convert_entry(entry), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            data.write(_RECORD_LEN.pack(len(record)))
+            data.write(record)
+            keys.append((_index_key(entry["word"], entry.get("lang", "")), offset))
+            offset += _RECORD_LEN.size + len(record)
+
+            if progress_callback and len(keys) % 10000 == 0:
+                progress_callback(len(keys))
+
+    keys.sort()
+
+    with open(output_path + ".idx", "wb") as index:
+        index.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(keys)))
+
+        position = _HEADER.size + _OFFSET.size * len(keys)
+        for key, _ in keys:
+            index.write(_OFFSET.pack(position))
+            position += _KEY_LEN.size + len(key) + _OFFSET.size
+
+        for key, record_offset in keys:
+            index.write(_KEY_LEN.pack(len(key)))
+            index.write(key)
+            index.write(_OFFSET.pack(record_offset))
+
+    return {
+        "entries": len(keys),
+        "keys": len({key for key, _ in keys}),
+        "seconds": time.perf_counter() - start
+    }
+
+
 class DictionaryService:
-    def __init__(self):
-        self.dictionary = {
-            "hello": "world",
-            "world": "hello"
+    """Offline dictionary answering lookups from an index built by build_dictionary
+
+    Both files are memory-mapped, so opening is instant and lookups are a
+    binary search over the key table plus one record read per entry.
+    """
+    def __init__(self, path):
+        self.path = path
+
+        with open(path + ".idx", "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(path + ".dat", "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.count = _HEADER.unpack_from(self._index, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self.close()
+            raise ValueError(f"Not a dictionary index: {path}.idx")
+
+    @staticmethod
+    def exists(path):
+        return bool(path) and os.path.exists(path + ".idx") and os.path.exists(path + ".dat")
+
+    def get_word_data(self, word, language="English"):
+        """Return the lookup result in the same shape as WiktionaryService.get_word_data"""
+        records = [self._read_record(offset) for offset in self._find(_index_key(word, language))]
+        if not records:
+            return {"error": f"Word not found: {word}"}
+
+        # Prefer entries with the exact spelling, e.g. "Polish" over "polish"
+        exact = [record for record in records if record["word"] == word]
+        return self._build_result(exact or records)
+
+    def get_many(self, words, language="English"):
+        for word in dict.fromkeys(words):
+            yield word, self.get_word_data(word, language)
+
+    def search_similar_words(self, prefix, limit=10, language="English"):
+        """Return up to `limit` distinct words starting with the prefix"""
+        key_prefix = _index_key(prefix, language)
+        words = []
+        i = self._lower_bound(key_prefix)
+        while i < self.count and len(words) < limit:
+            key, _ = self._entry(i)
+            if not key.startswith(key_prefix):
+                break
+            word = key.split(b"\x00", 1)[1].decode("utf-8")
+            if not words or words[-1] != word:
+                words.append(word)
+            i += 1
+        return words
+
+    def shutdown(self):
+        self.close()
+
+    def close(self):
+        if self._index is not None:
+            self._index.close()
+            self._data.close()
+            self._index = self._data = None
+
+    def _entry(self, i):
+        position = _OFFSET.unpack_from(self._index, _HEADER.size + _OFFSET.size * i)[0]
+        key_len = _KEY_LEN.unpack_from(self._index, position)[0]
+        key_start = position + _KEY_LEN.size
+        key = self._index[key_start:key_start + key_len]
+        return key, _OFFSET.unpack_from(self._index, key_start + key_len)[0]
+
+    def _lower_bound(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, key):
+        offsets = []
+        i = self._lower_bound(key)
+        while i < self.count:
+            entry_key, offset = self._entry(i)
+            if entry_key != key:
+                break
+            offsets.append(offset)
+            i += 1
+        return offsets
+
+    def _read_record(self, offset):
+        length = _RECORD_LEN.unpack_from(self._data, offset)[0]
+        start = offset + _RECORD_LEN.size
+        return json.loads(self._data[start:start + length])
+
+    def _build_result(self, records):
+        result = {
+            "word": records[0]["word"],
+            "definitions": [],
+            "definitions_by_pos": {},
+            "etymology": "",
+            "pronunciation": "",
+            "examples": [],
+            "related_terms": [],
+            "related_words": {"synonyms": [], "antonyms": []},
+            "translations": {}
         }
+        pronunciations = []
+
+        for record in records:
+            result["definitions"].extend(record["definitions"])
+            result["definitions_by_pos"].setdefault(record["pos"], []).extend(record["definitions"])
+            result["examples"].extend(record["examples"])
+            result["etymology"] = result["etymology"] or record["etymology"]
+            pronunciations.extend(ipa for ipa in record["ipa"] if ipa not in pronunciations)
+            result["related_terms"].extend(record["related"])
+            result["related_words"]["synonyms"].extend(record["synonyms"])
+            result["related_words"]["antonyms"].extend(record["antonyms"])
+
+        result["pronunciation"] = ", ".join(pronunciations)
+        return result
+
+
+# Run to import a dump and measure lookup latency:
+#   python -m util.services.dictionary_service dump.jsonl offline_dictionary [English ...]
+if __name__ == "__main__":
+    import random
+    import sys
+
+    dump_path, output_path = sys.argv[1], sys.argv[2]
+    stats = build_dictionary(dump_path, output_path, set(sys.argv[3:]) or None)
+    print(f"Imported {stats['entries']} entries ({stats['keys']} keys) in {stats['seconds']:.1f} s, "
+          f"{stats['entries'] / stats['seconds']:.0f} entries/s")
+
+    service = DictionaryService(output_path)
+    sample = [service._entry(random.randrange(service.count))[0].decode("utf-8").split("\x00")
+              for _ in range(min(service.count, 10000))]
+    if sample:
+        start = time.perf_counter()
+        for language, word in sample:
+            service.get_word_data(word, language)
+        print(f"Lookup: {(time.perf_counter() - start) / len(sample) * 1e6:.1f} us")
 
-    def get_word(self, word):
-        return self.dictionary.get(word, None)
\ No newline at end of file
+        start = time.perf_counter()
+        for language, word in sample:
+            service.search_similar_words(word[:2], language=language)
+        print(f"Prefix search: {(time.perf_counter() - start) / len(sample) * 1e6:.1f} us")
+    service.close()
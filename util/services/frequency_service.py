@@ -0,0 +1,259 @@
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+TABLE_MAGIC = b"FRQT"
+TABLE_VERSION = 1
+
+_HEADER = struct.Struct("<4sII")     # magic, version, slot count
+_SLOT = struct.Struct("<II")         # word offset + 1 (0 marks an empty slot), rank
+_WORD_LEN = struct.Struct("<H")
+
+# Share of running words that must come from the most common COMMON_RANK words
+COMMON_RANK = 2000
+LEVEL_COVERAGE = (
+    (0.90, "Beginner"),
+    (0.80, "Intermediate")
+)
+
+
+def _slot_of(word_bytes, mask):
+    return zlib.crc32(word_bytes) & mask
+
+
+def build_frequency_table(word_list_path, output_path):
+    """
+    Pack a frequency ordered word list into a hashed rank table
+
+    The word list has one `word` or `word<TAB>count` per line, most frequent
+    first. The table is an open addressing hash of (word offset, rank) slots
+    followed by the length-prefixed words, read through mmap by FrequencyTable.
+
+    Returns:
+        Number of words in the table
+    """
+    ranks = {}
+    with open(word_list_path, "r", encoding="utf-8") as f:
+        for line in f:
+            word = line.split("\t", 1)[0].strip().casefold()
+            if word and word not in ranks:
+                ranks[word] = len(ranks) + 1
+
+    slot_count = 1
+    while slot_count < len(ranks) * 2:
+        slot_count *= 2
+    mask = slot_count - 1
+
+    slots = bytearray(_SLOT.size * slot_count)
+    words = bytearray()
+    for word, rank in ranks.items():
+        word_bytes = word.encode("utf-8")
+        slot = _slot_of(word_bytes, mask)
+        while _SLOT.unpack_from(slots, slot * _SLOT.size)[0]:
+            slot = (slot + 1) & mask
+        _SLOT.pack_into(slots, slot * _SLOT.size, len(words) + 1, rank)
+        words += _WORD_LEN.pack(len(word_bytes)) + word_bytes
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, slot_count))
+        f.write(slots)
+        f.write(words)
+    os.replace(tmp_path, output_path)
+    return len(ranks)
+
+
+class FrequencyTable:
+    """Word frequency ranks read from a table built by build_frequency_table
+
+    The file is memory-mapped, so opening costs nothing and a lookup is one
+    hash plus, on average, about one slot probe.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.slot_count = _HEADER.unpack_from(self._map, 0)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            self.close()
+            raise ValueError(f"Not a frequency table: {path}")
+        self._mask = self.slot_count - 1
+        self._words_start = _HEADER.size + _SLOT.size * self.slot_count
+
+    def rank(self, word):
+        """Return the 1-based frequency rank of a casefolded word, or None if unlisted"""
+        word_bytes = word.encode("utf-8")
+        slot = _slot_of(word_bytes, self._mask)
+        while True:
+            offset, rank = _SLOT.unpack_from(self._map, _HEADER.size + slot * _SLOT.size)
+            if not offset:
+                return None
+
+            start = self._words_start + offset - 1
+            length = _WORD_LEN.unpack_from(self._map, start)[0]
+            start += _WORD_LEN.size
+            if self._map[start:start + length] == word_bytes:
+                return rank
+            slot = (slot + 1) & self._mask
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class FrequencyService:
+    """Opens the frequency table of each configured language on first use
+
+    Each word list is packed into `<word list>.freq` the first time it is
+    used, and again whenever the word list is newer than its table.
+    """
+    def __init__(self, word_lists):
+        self.word_lists = dict(word_lists or {})
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def get_table(self, language):
+        """Return the FrequencyTable for a language, or None if it has no word list"""
+        with self._lock:
+            if language not in self._tables:
+                self._tables[language] = self._open(self.word_lists.get(language))
+            return self._tables[language]
+
+    def _open(self, word_list_path):
+        if not word_list_path or not os.path.exists(word_list_path):
+            return None
+
+        table_path = word_list_path + ".freq"
+        if not os.path.exists(table_path) or os.path.getmtime(table_path) < os.path.getmtime(word_list_path):
+            build_frequency_table(word_list_path, table_path)
+        return FrequencyTable(table_path)
+
+    def close(self):
+        with self._lock:
+            for table in self._tables.values():
+                if table is not None:
+                    table.close()
+            self._tables.clear()
+
+
+class KnownWords:
+    """Casefolded set of the saved words, reloaded only after the saved words change"""
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._words = frozenset()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            version = self.db_manager.words_version
+            if version != self._version:
+                self._words = frozenset(word.casefold() for word in self.db_manager.get_word_list())
+                self._version = version
+            return self._words
+
+
+def is_candidate(word, known, min_length=2):
+    """Whether a word of a text should be listed as unknown"""
+    return word not in known and len(word) >= min_length and not word.isdigit()
+
+
+def score_words(counts, table=None, known=frozenset(), min_length=2):
+    """
+    Rank the words of a text that are not known yet
+
+    Args:
+        counts: Mapping of casefolded word to its count in the text
+        table: FrequencyTable of the text's language, or None
+        known: Set of casefolded known words
+        min_length: Shorter words are skipped
+
+    Returns:
+        Dict with "unknown_words" (most frequent in the text first, then the most
+        common in the language) and "coverage", the share of running words
+        within the COMMON_RANK most common words, None without a table
+    """
+    unlisted = float("inf")
+    ranked = []
+    common_tokens = total_tokens = 0
+
+    for word, count in counts.items():
+        rank = table.rank(word) if table is not None else None
+        total_tokens += count
+        if rank is not None and rank <= COMMON_RANK:
+            common_tokens += count
+
+        if not is_candidate(word, known, min_length):
+            continue
+        ranked.append((-count, rank if rank is not None else unlisted, word))
+
+    ranked.sort()
+    coverage = common_tokens / total_tokens if table is not None and total_tokens else None
+    return {
+        "unknown_words": [word for _, _, word in ranked],
+        "coverage": coverage
+    }
+
+
+def reading_level_from_coverage(coverage):
+    """Map the share of common words to a reading level"""
+    for threshold, level in LEVEL_COVERAGE:
+        if coverage >= threshold:
+            return level
+    return "Advanced"
+
+
+# Run to time building a table and scoring 1M tokens:
+#   python -m util.services.frequency_service [word_count] [token_count]
+if __name__ == "__main__":
+    import random
+    import sys
+    import tempfile
+    import time
+    from collections import Counter
+
+    word_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    token_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+
+    rng = random.Random(0)
+    vocabulary = list(dict.fromkeys(
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 12)))
+        for _ in range(word_count)
+    ))
+    work_dir = tempfile.mkdtemp()
+    word_list_path = os.path.join(work_dir, "words.txt")
+    with open(word_list_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocabulary))
+
+    start = time.perf_counter()
+    built = build_frequency_table(word_list_path, word_list_path + ".freq")
+    print(f"Built table of {built} words in {time.perf_counter() - start:.2f} s "
+          f"({os.path.getsize(word_list_path + '.freq') / 1e6:.1f} MB)")
+
+    table = FrequencyTable(word_list_path + ".freq")
+    assert all(table.rank(word) == i + 1 for i, word in enumerate(vocabulary[:1000]))
+    assert table.rank("not-a-listed-word") is None
+
+    # Zipf-like text: common words dominate, plus words missing from the list
+    weights = [1 / (i + 1) for i in range(len(vocabulary))]
+    tokens = rng.choices(vocabulary, weights=weights, k=token_count)
+    tokens += [f"unlisted{i}" for i in range(token_count // 100)]
+    counts = Counter(tokens)
+    known = frozenset(rng.sample(vocabulary, len(vocabulary) // 10))
+
+    start = time.perf_counter()
+    result = score_words(counts, table, known)
+    elapsed = time.perf_counter() - start
+    print(f"Scored {len(tokens)} tokens ({len(counts)} distinct) in {elapsed * 1000:.1f} ms: "
+          f"{len(result['unknown_words'])} unknown, coverage {result['coverage']:.2f}, "
+          f"{reading_level_from_coverage(result['coverage'])}")
+
+    start = time.perf_counter()
+    for word in vocabulary[:100000]:
+        table.rank(word)
+    print(f"rank(): {(time.perf_counter() - start) / min(len(vocabulary), 100000) * 1e6:.2f} us per lookup")
+    table.close()
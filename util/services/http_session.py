@@ -0,0 +1,161 @@
+import logging
+import threading
+import time
+import requests
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Pymage/0.1 (language learning assistant)"
+
+DEFAULT_SETTINGS = {
+    "pool_size": 10,
+    "timeout": (3.05, 10),
+    "retries": 3,
+    "backoff_factor": 0.3,
+    "requests_per_second": 10
+}
+
+_session = None
+_session_lock = threading.Lock()
+_settings = dict(DEFAULT_SETTINGS)
+
+
+class HostRateLimiter:
+    """Spaces out requests to the same host to at most `rate` per second"""
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class PooledSession(requests.Session):
+    """requests.Session with a default timeout and per-host rate limit applied to every request"""
+    def __init__(self, timeout, rate_limiter=None):
+        super().__init__()
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        if self.rate_limiter:
+            self.rate_limiter.wait(url)
+        return super().request(method, url, **kwargs)
+
+
+def configure_session(**settings):
+    """Change the shared session settings
+
+    Accepts pool_size, timeout, retries, backoff_factor and requests_per_second
+    (0 disables the per-host rate limit), other keys are logged and ignored.
+    The current session is closed and a new one is built with the new
+    settings on next use.
+    """
+    global _session
+    unknown = set(settings) - set(DEFAULT_SETTINGS)
+    if unknown:
+        logging.getLogger(__name__).warning(f"Ignoring unknown network settings: {', '.join(sorted(unknown))}")
+        settings = {key: value for key, value in settings.items() if key not in unknown}
+
+    with _session_lock:
+        _settings.update(settings)
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_session():
+    """Return the process-wide keep-alive session used for all HTTP traffic"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session(_settings)
+    return _session
+
+
+def close_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _create_session(settings):
+    retry = Retry(
+        total=settings["retries"],
+        backoff_factor=settings["backoff_factor"],
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings["pool_size"],
+        pool_maxsize=settings["pool_size"],
+        max_retries=retry
+    )
+
+    session = PooledSession(settings["timeout"], HostRateLimiter(settings["requests_per_second"]))
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Run to compare per-request latency with and without the shared session
+if __name__ == "__main__":
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"parse": {"text": "<p>stub</p>"}}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+    rounds = 500
+    configure_session(requests_per_second=0)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        requests.get(url, params={"page": "hello"})
+    per_request = (time.perf_counter() - start) / rounds * 1000
+    print(f"requests.get:       {per_request:.3f} ms/request")
+
+    session = get_session()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        session.get(url, params={"page": "hello"})
+    per_request = (time.perf_counter() - start) / rounds * 1000
+    print(f"shared session.get: {per_request:.3f} ms/request")
+
+    server.shutdown()
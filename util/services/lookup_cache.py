@@ -0,0 +1,161 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class LookupCache:
+    """Persistent cache for parsed dictionary lookups
+
+    Entries are keyed by (word, language, parser version) and stored in SQLite,
+    with a small in-memory LRU in front of it so repeat lookups never touch disk.
+    The LRU keeps the JSON text, so every hit returns a fresh dict that the
+    caller is free to modify.
+    Entries older than `ttl` seconds are treated as misses, but can still be
+    served when the network is unavailable. The on-disk store is trimmed to
+    `max_entries` by evicting the least recently used rows.
+    """
+    def __init__(self, db_path="lookup_cache.db", ttl=7 * 24 * 3600, max_entries=5000, memory_entries=256):
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+    def create_tables(self):
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS lookup_cache (
+            word TEXT NOT NULL,
+            language TEXT NOT NULL,
+            parser_version INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            created REAL NOT NULL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (word, language, parser_version)
+        ) WITHOUT ROWID
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_lookup_cache_access ON lookup_cache (last_access)')
+        self.conn.commit()
+
+    def get(self, word, language, parser_version, allow_expired=False):
+        """Return the cached result dict, or None on a miss
+
+        Args:
+            word: Looked up word
+            language: Language section the result was parsed for
+            parser_version: Version of the parser that produced the result
+            allow_expired: Also return entries older than the TTL (offline fallback)
+        """
+        key = (word, language, parser_version)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and (allow_expired or now - entry[0] < self.ttl):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return json.loads(entry[1])
+
+            row = self.conn.execute('''
+            SELECT data, created FROM lookup_cache
+            WHERE word = ? AND language = ? AND parser_version = ?
+            ''', key).fetchone()
+
+            if row is None or (not allow_expired and now - row[1] >= self.ttl):
+                self.misses += 1
+                return None
+
+            self.conn.execute('''
+            UPDATE lookup_cache SET last_access = ?
+            WHERE word = ? AND language = ? AND parser_version = ?
+            ''', (now,) + key)
+            self.conn.commit()
+
+            self._remember(key, row[1], row[0])
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, word, language, parser_version, data):
+        """Store a parsed result and evict old entries if the cache is full"""
+        key = (word, language, parser_version)
+        now = time.time()
+        text = json.dumps(data)
+
+        with self._lock:
+            self.conn.execute('''
+            INSERT OR REPLACE INTO lookup_cache (word, language, parser_version, data, created, last_access)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ''', key + (text, now, now))
+            self._evict()
+            self.conn.commit()
+            self._remember(key, now, text)
+
+    def words(self, language=None):
+        """Return all cached words, optionally for a single language"""
+        with self._lock:
+            if language:
+                rows = self.conn.execute(
+                    'SELECT DISTINCT word FROM lookup_cache WHERE language = ?', (language,)
+                ).fetchall()
+            else:
+                rows = self.conn.execute('SELECT DISTINCT word FROM lookup_cache').fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self):
+        """Return hit/miss counters and the number of stored entries"""
+        with self._lock:
+            entries = self.conn.execute('SELECT COUNT(*) FROM lookup_cache').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self.conn.execute('DELETE FROM lookup_cache')
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    def _remember(self, key, created, text):
+        self._memory[key] = (created, text)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        count = self.conn.execute('SELECT COUNT(*) FROM lookup_cache').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute('''
+            DELETE FROM lookup_cache WHERE (word, language, parser_version) IN (
+                SELECT word, language, parser_version FROM lookup_cache
+                ORDER BY last_access LIMIT ?
+            )
+            ''', (excess,))
@@ -0,0 +1,288 @@
+import heapq
+import re
+import threading
+from collections import Counter
+from util.services.frequency_service import COMMON_RANK, is_candidate, reading_level_from_coverage
+
+WORD_PATTERN = re.compile(r"\w+")
+WORD_CHAR = re.compile(r"\w")
+
+CHUNK_SIZE = 1 << 16
+
+
+class TextStatistics:
+    """Word counts accumulated one chunk at a time
+
+    Chunks may split a word, so a trailing run of word characters is held back
+    and prepended to the next chunk. Call finish() after the last chunk.
+    """
+    def __init__(self):
+        self.counts = Counter()
+        self.word_count = 0
+        self._carry = ""
+
+    def add_chunk(self, chunk):
+        chunk = self._carry + chunk
+        end = len(chunk)
+        while end and WORD_CHAR.match(chunk, end - 1):
+            end -= 1
+        self._carry = chunk[end:]
+        self._count(chunk[:end])
+
+    def finish(self):
+        if self._carry:
+            self._count(self._carry)
+            self._carry = ""
+        return self
+
+    def _count(self, text):
+        words = WORD_PATTERN.findall(text.casefold())
+        self.word_count += len(words)
+        self.counts.update(words)
+
+    @property
+    def unique_words(self):
+        return len(self.counts)
+
+    def share_longer_than(self, length):
+        """Fraction of all words longer than `length` characters"""
+        if not self.word_count:
+            return 0.0
+        return sum(count for word, count in self.counts.items() if len(word) > length) / self.word_count
+
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE):
+    """Yield chunks of a string or a text file object"""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def analyze(source, chunk_size=CHUNK_SIZE, progress_callback=None, cancel_event=None):
+    """
+    Count the words of a text in one streaming pass
+
+    Args:
+        source: Text string or text file object
+        chunk_size: Characters tokenized per step
+        progress_callback: Called as progress_callback(processed, total) after each
+            chunk, total is None for file objects
+        cancel_event: threading.Event, checked between chunks
+
+    Returns:
+        TextStatistics, or None if the analysis was cancelled
+    """
+    total = len(source) if isinstance(source, str) else None
+    stats = TextStatistics()
+    processed = 0
+
+    for chunk in iter_chunks(source, chunk_size):
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+
+        stats.add_chunk(chunk)
+        processed += len(chunk)
+        if progress_callback:
+            progress_callback(processed, total)
+
+    return stats.finish()
+
+
+def reading_level(stats):
+    """Estimate the reading level from the share of long words"""
+    if stats.word_count == 0:
+        return "N/A"
+    if stats.share_longer_than(6) > 0.2:
+        return "Advanced"
+    if stats.share_longer_than(4) > 0.3:
+        return "Intermediate"
+    return "Beginner"
+
+
+class IncrementalAnalyzer:
+    """Word statistics of an editable text, updated from the edited paragraphs only
+
+    Each edit is recorded as the text of the affected paragraphs before and
+    after it. diff() tokenizes just those paragraphs into a count delta and
+    apply() folds it into the running totals. Deltas add up in any order, so
+    they can be computed on a worker thread. The unknown word counts, common
+    word tokens and long word tokens behind the reading level are kept
+    alongside the totals. Reading the statistics never rescans the text.
+    """
+    def __init__(self, table=None, known=frozenset()):
+        self.table = table
+        self.known = known
+        self.totals = Counter()
+        self.word_count = 0
+        self._unknown = {}
+        self._ranks = {}
+        self._common_tokens = 0
+        self._long_tokens = {4: 0, 6: 0}
+        self._pending = []
+        self._pending_chars = 0
+        self._lock = threading.Lock()
+
+    def record_edit(self, old_text, new_text):
+        """Queue the text of the paragraphs an edit touched, before and after it"""
+        with self._lock:
+            self._pending.append((old_text, new_text))
+            self._pending_chars += len(old_text) + len(new_text)
+
+    def pending_chars(self):
+        with self._lock:
+            return self._pending_chars
+
+    def take_pending(self):
+        with self._lock:
+            edits, self._pending, self._pending_chars = self._pending, [], 0
+            return edits
+
+    @staticmethod
+    def diff(edits):
+        """Return the count delta of the given edits, safe to run on any thread"""
+        delta = Counter()
+        for old_text, new_text in edits:
+            delta.update(WORD_PATTERN.findall(new_text.casefold()))
+            delta.subtract(WORD_PATTERN.findall(old_text.casefold()))
+        return delta
+
+    def apply(self, delta):
+        """Add a count delta to the totals, must run on the owning thread"""
+        for word, change in delta.items():
+            if not change:
+                continue
+            count = self.totals[word] + change
+            if count > 0:
+                self.totals[word] = count
+            else:
+                del self.totals[word]
+            self._track(word, change, count)
+
+    def reset(self, counts):
+        """Replace the totals with the counts of a full analysis"""
+        self.totals = Counter(counts)
+        self.set_vocabulary(self.table, self.known)
+
+    def set_vocabulary(self, table, known):
+        """Change the frequency table or known words and rebuild what depends on them"""
+        self.table = table
+        self.known = known
+        self._ranks.clear()
+        self._unknown.clear()
+        self._common_tokens = 0
+        self._long_tokens = dict.fromkeys(self._long_tokens, 0)
+        self.word_count = 0
+        for word, count in self.totals.items():
+            self._track(word, count, count)
+
+    def _track(self, word, change, count):
+        self.word_count += change
+        for length in self._long_tokens:
+            if len(word) > length:
+                self._long_tokens[length] += change
+
+        rank = self._rank(word)
+        if rank is not None and rank <= COMMON_RANK:
+            self._common_tokens += change
+
+        if is_candidate(word, self.known):
+            if count > 0:
+                self._unknown[word] = count
+            else:
+                self._unknown.pop(word, None)
+
+    def _rank(self, word):
+        if self.table is None:
+            return None
+        if word not in self._ranks:
+            self._ranks[word] = self.table.rank(word)
+        return self._ranks[word]
+
+    def statistics(self):
+        if self.word_count <= 0:
+            reading_level = "N/A"
+        elif self.table is not None:
+            reading_level = reading_level_from_coverage(self._common_tokens / self.word_count)
+        elif self._long_tokens[6] / self.word_count > 0.2:
+            reading_level = "Advanced"
+        elif self._long_tokens[4] / self.word_count > 0.3:
+            reading_level = "Intermediate"
+        else:
+            reading_level = "Beginner"
+
+        return {
+            "word_count": self.word_count,
+            "unique_words": len(self.totals),
+            "reading_level": reading_level
+        }
+
+    def unknown_count(self):
+        return len(self._unknown)
+
+    def unknown_words(self, limit=None):
+        """Unknown words in the same order as score_words, only `limit` are sorted when given"""
+        unlisted = float("inf")
+        keys = ((-count, self._rank(word) or unlisted, word) for word, count in self._unknown.items())
+        ranked = heapq.nsmallest(limit, keys) if limit is not None else sorted(keys)
+        return [word for _, _, word in ranked]
+
+
+# Run to time the analysis on files, or on a generated corpus without arguments:
+#   python -m util.services.text_analysis [file ...]
+if __name__ == "__main__":
+    import math
+    import random
+    import sys
+    import time
+
+    if len(sys.argv) > 1:
+        corpora = [(path, open(path, encoding="utf-8").read()) for path in sys.argv[1:]]
+    else:
+        rng = random.Random(0)
+        vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(1, 12)))
+                      for _ in range(50000)]
+        words = rng.choices(vocabulary, k=1500000)
+        sentences = (" ".join(words[i:i + 12]) + ".\n" for i in range(0, len(words), 12))
+        corpora = [("generated", "".join(sentences))]
+
+    for name, text in corpora:
+        size_mb = len(text.encode("utf-8")) / 1e6
+
+        # What ReadingController.analyze_text used to do on the Tk thread
+        start = time.perf_counter()
+        naive_words = re.findall(r'\b\w+\b', text.lower())
+        naive_unique = sorted(set(naive_words))
+        len([w for w in naive_words if len(w) > 6]), len([w for w in naive_words if len(w) > 4])
+        naive = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stats = analyze(text)
+        level = reading_level(stats)
+        streamed = time.perf_counter() - start
+
+        assert stats.word_count == len(naive_words) and stats.unique_words == len(naive_unique)
+        print(f"{name}: {size_mb:.1f} MB, {stats.word_count} words, {stats.unique_words} unique, {level}")
+        print(f"  findall + sort: {naive * 1000:8.1f} ms in one blocking call")
+        print(f"  analyze:        {streamed * 1000:8.1f} ms ({size_mb / streamed:.1f} MB/s), "
+              f"{math.ceil(len(text) / CHUNK_SIZE)} cancellable steps")
+
+        # One typed word in the middle paragraph, re-counted incrementally
+        analyzer = IncrementalAnalyzer()
+        analyzer.reset(stats.counts)
+        lines = text.split("\n")
+        middle = lines[len(lines) // 2]
+        start = time.perf_counter()
+        analyzer.record_edit(middle, middle + " typed")
+        analyzer.apply(analyzer.diff(analyzer.take_pending()))
+        analyzer.statistics()
+        analyzer.unknown_words(50)
+        incremental = time.perf_counter() - start
+        assert analyzer.word_count == stats.word_count + 1
+        print(f"  one edit:       {incremental * 1000:8.3f} ms incrementally")
@@ -0,0 +1,209 @@
+import math
+import time
+import numpy as np
+
+DAY = 24 * 3600
+
+MIN_EASE = 1.3
+DEFAULT_EASE = 2.5
+
+# Grades follow SM-2: 0-2 failed recall, 3 hard, 4 good, 5 easy
+GRADE_AGAIN = 1
+GRADE_HARD = 3
+GRADE_GOOD = 4
+GRADE_EASY = 5
+
+
+def schedule_batch(ease, interval, repetitions, lapses, grades):
+    """
+    Apply one SM-2 review to many cards at once
+
+    Args:
+        ease, interval, repetitions, lapses: Current state arrays, interval in days
+        grades: Array of grades 0-5
+
+    Returns:
+        Tuple of new (ease, interval, repetitions, lapses) arrays
+    """
+    ease = np.asarray(ease, dtype=np.float64)
+    interval = np.asarray(interval, dtype=np.float64)
+    repetitions = np.asarray(repetitions, dtype=np.int64)
+    lapses = np.asarray(lapses, dtype=np.int64)
+    grades = np.asarray(grades, dtype=np.int64)
+
+    passed = grades >= 3
+    miss = 5 - grades
+    new_ease = np.maximum(MIN_EASE, ease + 0.1 - miss * (0.08 + miss * 0.02))
+
+    grown = np.where(repetitions == 0, 1.0, np.where(repetitions == 1, 6.0, np.round(interval * ease)))
+    new_interval = np.where(passed, grown, 1.0)
+    new_repetitions = np.where(passed, repetitions + 1, 0)
+    new_lapses = np.where(passed, lapses, lapses + 1)
+    return new_ease, new_interval, new_repetitions, new_lapses
+
+
+def schedule(ease, interval, repetitions, lapses, grade):
+    """Apply one SM-2 review to a single card, same rules as schedule_batch"""
+    if grade >= 3:
+        if repetitions == 0:
+            interval = 1.0
+        elif repetitions == 1:
+            interval = 6.0
+        else:
+            interval = float(round(interval * ease))
+        repetitions += 1
+    else:
+        interval = 1.0
+        repetitions = 0
+        lapses += 1
+
+    miss = 5 - grade
+    ease = max(MIN_EASE, ease + 0.1 - miss * (0.08 + miss * 0.02))
+    return ease, interval, repetitions, lapses
+
+
+def mastery_level(repetitions):
+    """Map consecutive successful reviews to the 0-5 stars shown on word cards"""
+    return min(5, repetitions)
+
+
+class VocabularyService:
+    """Spaced repetition on top of the review state stored in WordDatabase"""
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+
+    def get_due_cards(self, limit=20, now=None):
+        """Return up to `limit` cards due now as dicts, most overdue first"""
+        now = time.time() if now is None else now
+        return [self._card(row) for row in self.db_manager.get_due_cards(now, limit)]
+
+    def get_cards(self, word_ids):
+        """Return cards for the given words, whether due or not"""
+        return [self._card(row) for row in self.db_manager.get_review_states(word_ids)]
+
+    def get_mastery(self, word_ids):
+        """Return {word_id: mastery level} for the given words"""
+        return {row[0]: mastery_level(row[5]) for row in self.db_manager.get_review_states(word_ids)}
+
+    def record_review(self, card, grade, now=None):
+        """Schedule a card after one review and store its new state"""
+        now = time.time() if now is None else now
+        ease, interval, repetitions, lapses = schedule(
+            card['ease'], card['interval'], card['repetitions'], card['lapses'], grade
+        )
+        card.update(ease=ease, interval=interval, repetitions=repetitions, lapses=lapses,
+                    due=int(now + interval * DAY))
+        self.db_manager.update_review_states([
+            (ease, interval, repetitions, lapses, card['due'], int(now), card['word_id'])
+        ])
+        return card
+
+    def record_reviews(self, cards, grades, now=None):
+        """Schedule many cards at once, e.g. after importing review history"""
+        if not cards:
+            return 0
+        now = time.time() if now is None else now
+
+        ease, interval, repetitions, lapses = schedule_batch(
+            [card['ease'] for card in cards],
+            [card['interval'] for card in cards],
+            [card['repetitions'] for card in cards],
+            [card['lapses'] for card in cards],
+            grades
+        )
+        due = (now + interval * DAY).astype(np.int64)
+
+        return self.db_manager.update_review_states(zip(
+            ease.tolist(), interval.tolist(), repetitions.tolist(), lapses.tolist(), due.tolist(),
+            [int(now)] * len(cards), [card['word_id'] for card in cards]
+        ))
+
+    def _card(self, row):
+        word_id, word, source_language, ease, interval, repetitions, lapses, due = row
+        return {
+            'word_id': word_id,
+            'word': word,
+            'source_language': source_language,
+            'ease': ease,
+            'interval': interval,
+            'repetitions': repetitions,
+            'lapses': lapses,
+            'due': due
+        }
+
+
+def simulate(card_count=100000, days=365, retention=0.9, seed=0):
+    """
+    Simulate daily SM-2 reviews of a growing deck
+
+    New cards are introduced evenly over the period. A review succeeds with
+    probability retention ** (elapsed / interval), a rough forgetting curve.
+
+    Returns:
+        Dict with total reviews, lapses and the daily review counts
+    """
+    rng = np.random.default_rng(seed)
+    new_per_day = math.ceil(card_count / days)
+
+    ease = np.full(card_count, DEFAULT_EASE)
+    interval = np.zeros(card_count)
+    repetitions = np.zeros(card_count, dtype=np.int64)
+    lapses = np.zeros(card_count, dtype=np.int64)
+    due = np.arange(card_count) // new_per_day
+    last_review = due.copy()
+
+    daily_reviews = np.zeros(days, dtype=np.int64)
+    for day in range(days):
+        idx = np.flatnonzero(due <= day)
+        if not len(idx):
+            continue
+
+        elapsed = day - last_review[idx]
+        recall = retention ** (elapsed / np.maximum(interval[idx], 1.0))
+        remembered = rng.random(len(idx)) < recall
+        grades = np.where(remembered, rng.integers(GRADE_HARD, GRADE_EASY + 1, len(idx)), GRADE_AGAIN)
+
+        ease[idx], interval[idx], repetitions[idx], lapses[idx] = schedule_batch(
+            ease[idx], interval[idx], repetitions[idx], lapses[idx], grades
+        )
+        due[idx] = day + interval[idx].astype(np.int64)
+        last_review[idx] = day
+        daily_reviews[day] = len(idx)
+
+    return {
+        "reviews": int(daily_reviews.sum()),
+        "lapses": int(lapses.sum()),
+        "daily_reviews": daily_reviews,
+        "mean_ease": float(ease.mean())
+    }
+
+
+# Run to simulate a year of reviews:
+#   python -m util.services.vocabulary_service [card_count] [days]
+if __name__ == "__main__":
+    import sys
+
+    card_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+
+    start = time.perf_counter()
+    result = simulate(card_count, days)
+    elapsed = time.perf_counter() - start
+
+    daily = result["daily_reviews"]
+    print(f"Simulated {days} days over {card_count} cards in {elapsed:.2f} s")
+    print(f"  reviews: {result['reviews']} ({result['reviews'] / elapsed / 1e6:.1f} M/s)")
+    print(f"  daily reviews: mean {daily.mean():.0f}, max {daily.max()}")
+    print(f"  lapses: {result['lapses']}, mean ease {result['mean_ease']:.2f}")
+
+    # Same rules one card at a time, for comparison
+    sample = min(card_count, 10000)
+    grades = np.random.default_rng(1).integers(0, 6, sample)
+    start = time.perf_counter()
+    for grade in grades.tolist():
+        schedule(DEFAULT_EASE, 6.0, 2, 0, grade)
+    scalar = (time.perf_counter() - start) / sample
+    start = time.perf_counter()
+    schedule_batch(np.full(sample, DEFAULT_EASE), np.full(sample, 6.0), np.full(sample, 2), np.zeros(sample), grades)
+    batch = (time.perf_counter() - start) / sample
+    print(f"Per card: schedule() {scalar * 1e6:.2f} us, schedule_batch() {batch * 1e6:.3f} us")
@@ -0,0 +1,358 @@
+import html
+import re
+from html.parser import HTMLParser
+
+_H2_RE = re.compile(r'<h2\b[^>]*>(.*?)</h2>', re.S | re.I)
+_SECTION_END_RE = re.compile(r'<div\b[^>]*\bmw-heading2\b[^>]*>\s*<h2\b|<h2\b', re.I)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+_VOID_TAGS = {"area", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+_SKIPPED_TAGS = {"style", "script"}
+_HEADER_TAGS = {"h3", "h4", "h5", "h6"}
+_LIST_TAGS = {"ol", "ul", "dl"}
+
+# Level 3+ headers that are not parts of speech
+_NON_POS_SECTIONS = {
+    "alternative forms", "anagrams", "antonyms", "coordinate terms", "derived terms",
+    "descendants", "further reading", "hypernyms", "hyponyms", "pronunciation",
+    "quotations", "references", "related terms", "see also", "statistics", "synonyms",
+    "translations", "usage notes", "conjugation", "declension", "inflection", "mutation"
+}
+_RELATED_SECTIONS = {"related terms", "derived terms"}
+
+DEFINITION_FALLBACK = "Definition parsing failed. Click 'Open in Browser' to see the full entry."
+
+
+def find_language_section(html_content, language):
+    """Return the slice of the page belonging to the given language
+
+    Returns None if the page has language headers but none matches, and the
+    whole page if it has no language headers at all.
+    """
+    headers = list(_H2_RE.finditer(html_content))
+    if not headers:
+        return html_content
+
+    for match in headers:
+        title = html.unescape(_TAG_RE.sub("", match.group(1))).replace("[edit]", "").strip()
+        if title == language:
+            end = _SECTION_END_RE.search(html_content, match.end())
+            return html_content[match.end():end.start() if end else len(html_content)]
+    return None
+
+
+def parse_language_section(html_content, language, word=""):
+    """Parse a Wiktionary page into the lookup result dict for one language
+
+    Only the requested language's section is tokenized, in a single pass.
+    `word` is the page title, returned as the result's "word".
+    """
+    section = find_language_section(html_content, language)
+    parser = _SectionParser(word)
+    if section is not None:
+        parser.feed(section)
+        parser.close()
+    return parser.result()
+
+
+class _SectionParser(HTMLParser):
+    """Streaming tokenizer that builds the result while walking the section once"""
+    def __init__(self, word=""):
+        super().__init__(convert_charrefs=True)
+        self.word = word
+        self.stack = []
+        self.skip_depth = None
+
+        self.section = None
+        self.section_kind = None
+        self.pos = None
+        self.header_depth = None
+        self.header_text = []
+
+        self.ol_depth = 0
+        self.definition = None
+        self.definition_depth = None
+        self.nested_depth = None
+        self.example = None
+        self.example_depth = None
+
+        self.etymology = None
+        self.etymology_depth = None
+        self.ipa = None
+        self.ipa_depth = None
+        self.link = None
+        self.link_depth = None
+
+        self.definitions_by_pos = {}
+        self.examples = []
+        self.etymology_text = ""
+        self.pronunciations = []
+        self.related_terms = []
+        self.related_words = {"synonyms": [], "antonyms": []}
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _VOID_TAGS:
+            if tag == "br":
+                self.handle_data(" ")
+            return
+
+        self.stack.append(tag)
+        depth = len(self.stack)
+        if self.skip_depth is not None:
+            return
+
+        classes = (dict(attrs).get("class") or "").split()
+        if tag in _SKIPPED_TAGS or "mw-editsection" in classes or "reference" in classes:
+            self.skip_depth = depth
+            return
+
+        if tag in _HEADER_TAGS:
+            self._close_section()
+            self.header_depth = depth
+            self.header_text = []
+            return
+
+        kind = self.section_kind
+        if kind == "pos":
+            if tag == "ol":
+                self.ol_depth += 1
+            if tag == "li" and self.ol_depth == 1 and self.definition is None:
+                self.definition = []
+                self.definition_depth = depth
+            elif self.definition is not None and tag in _LIST_TAGS and self.nested_depth is None:
+                self.nested_depth = depth
+            elif tag == "dd" and self.nested_depth == depth - 1 and self.example is None:
+                self.example = []
+                self.example_depth = depth
+        elif kind == "etymology" and tag == "p" and not self.etymology_text and self.etymology is None:
+            self.etymology = []
+            self.etymology_depth = depth
+        elif kind == "pronunciation" and "IPA" in classes and self.ipa is None:
+            self.ipa = []
+            self.ipa_depth = depth
+        elif kind in ("synonyms", "antonyms", "related") and tag == "a" and self.link is None:
+            self.link = []
+            self.link_depth = depth
+
+    def handle_endtag(self, tag):
+        if tag in _VOID_TAGS or tag not in self.stack:
+            return
+
+        # Pop to the matching tag, tolerating unclosed children
+        while self.stack:
+            depth = len(self.stack)
+            popped = self.stack.pop()
+            self._on_close(popped, depth)
+            if popped == tag:
+                break
+
+    def handle_data(self, data):
+        if self.skip_depth is not None:
+            return
+        if self.header_depth is not None:
+            self.header_text.append(data)
+            return
+        if self.definition is not None and self.nested_depth is None:
+            self.definition.append(data)
+        if self.example is not None:
+            self.example.append(data)
+        if self.etymology is not None:
+            self.etymology.append(data)
+        if self.ipa is not None:
+            self.ipa.append(data)
+        if self.link is not None:
+            self.link.append(data)
+
+    def _on_close(self, tag, depth):
+        if self.skip_depth is not None:
+            if depth == self.skip_depth:
+                self.skip_depth = None
+            return
+
+        if depth == self.header_depth:
+            self._open_section(_clean(self.header_text))
+            self.header_depth = None
+        elif depth == self.example_depth:
+            text = _clean(self.example)
+            if len(text) > 12:
+                self.examples.append(text)
+            self.example = self.example_depth = None
+        elif depth == self.nested_depth:
+            self.nested_depth = None
+        elif depth == self.definition_depth:
+            text = _clean(self.definition)
+            if len(text) > 1:
+                self.definitions_by_pos.setdefault(self.pos, []).append(text)
+            self.definition = self.definition_depth = None
+        elif depth == self.etymology_depth:
+            self.etymology_text = _clean(self.etymology)
+            self.etymology = self.etymology_depth = None
+        elif depth == self.ipa_depth:
+            text = _clean(self.ipa)
+            if text and text not in self.pronunciations:
+                self.pronunciations.append(text)
+            self.ipa = self.ipa_depth = None
+        elif depth == self.link_depth:
+            self._add_link(_clean(self.link))
+            self.link = self.link_depth = None
+
+        if tag == "ol" and self.section_kind == "pos" and self.ol_depth:
+            self.ol_depth -= 1
+
+    def _open_section(self, title):
+        self.section = title
+        name = title.lower()
+        if name.startswith("etymology"):
+            self.section_kind = "etymology"
+        elif name == "pronunciation":
+            self.section_kind = "pronunciation"
+        elif name in ("synonyms", "antonyms"):
+            self.section_kind = name
+        elif name in _RELATED_SECTIONS:
+            self.section_kind = "related"
+        elif name in _NON_POS_SECTIONS:
+            self.section_kind = None
+        else:
+            self.section_kind = "pos"
+            self.pos = name
+
+    def _close_section(self):
+        self.section = self.section_kind = None
+        self.ol_depth = 0
+        self.definition = self.definition_depth = self.nested_depth = None
+        self.example = self.example_depth = None
+        self.etymology = self.etymology_depth = None
+        self.ipa = self.ipa_depth = None
+        self.link = self.link_depth = None
+
+    def _add_link(self, text):
+        if not text:
+            return
+        if self.section_kind == "related":
+            target = self.related_terms
+        else:
+            target = self.related_words[self.section_kind]
+        if text not in target:
+            target.append(text)
+
+    def result(self):
+        definitions = [d for defs in self.definitions_by_pos.values() for d in defs]
+        return {
+            "word": self.word,
+            "definitions": definitions or [DEFINITION_FALLBACK],
+            "definitions_by_pos": self.definitions_by_pos,
+            "etymology": self.etymology_text,
+            "pronunciation": ", ".join(self.pronunciations),
+            "examples": self.examples,
+            "related_terms": self.related_terms,
+            "related_words": self.related_words,
+            "translations": {}
+        }
+
+
+def _clean(parts):
+    return " ".join("".join(parts).split())
+
+
+def _sample_page(languages=40, senses=10):
+    """A generated page shaped like a Wiktionary parse, English among many other languages"""
+    def heading(level, title):
+        return (f'<div class="mw-heading mw-heading{level}"><h{level} id="{title}">{title}</h{level}>'
+                f'<span class="mw-editsection">[<a href="#">edit</a>]</span></div>')
+
+    def language_section(name):
+        parts = [heading(2, name), heading(3, "Etymology"),
+                 f"<p>From Old {name} <i>sampel</i>, from Latin <i>exemplum</i>.</p>",
+                 heading(3, "Pronunciation"),
+                 '<ul><li>IPA: <span class="IPA">/\u02c8s\u00e6mp\u0259l/</span></li></ul>']
+        for pos in ("Noun", "Verb"):
+            parts.append(heading(3, pos))
+            parts.append("<p><b>sample</b> (<i>plural</i> samples)</p><ol>")
+            for i in range(senses):
+                parts.append(f'<li>A {pos.lower()} sense number {i} of the <a href="#">word</a>.'
+                             f'<sup class="reference">[{i}]</sup><dl><dd><i>A quoted example of '
+                             f'sense {i} in a full sentence.</i></dd></dl></li>')
+            parts.append("</ol>")
+            parts.append(heading(4, "Synonyms"))
+            parts.append("<ul>" + "".join(f'<li><a href="#">synonym{i}</a></li>' for i in range(5)) + "</ul>")
+        parts.append(heading(3, "References"))
+        parts.append("<ol>" + "".join(f"<li>Reference {i}</li>" for i in range(senses)) + "</ol>")
+        return "".join(parts)
+
+    names = [f"Language{i}" for i in range(languages)]
+    names.insert(languages // 2, "English")
+    return '<div class="mw-parser-output">' + "".join(language_section(name) for name in names) + "</div>"
+
+
+def _parse_with_beautifulsoup(html_content, target_language):
+    # What WiktionaryService.parse_wiktionary_content did before this module, kept to compare against
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_content, 'html.parser')
+    result = {"definitions": [], "etymology": "", "pronunciation": "", "examples": []}
+
+    for header in soup.find_all(['h2', 'h3', 'h4']):
+        if header.get_text().strip() == target_language:
+            break
+
+    for ol in soup.find_all('ol'):
+        for li in ol.find_all('li', recursive=False):
+            definition_text = li.get_text().strip()
+            if definition_text and len(definition_text) > 1:
+                result["definitions"].append(definition_text)
+                for example in li.find_all(['dd', 'i', 'cite']):
+                    example_text = example.get_text().strip()
+                    if example_text and len(example_text) > 12:
+                        result["examples"].append(example_text)
+
+    etymology_section = soup.find(lambda tag: tag.name in ["h3", "h4"] and "Etymology" in tag.get_text())
+    if etymology_section:
+        next_elem = etymology_section.find_next(['p', 'div'])
+        if next_elem:
+            result["etymology"] = next_elem.get_text().strip()
+
+    pron_section = soup.find(lambda tag: tag.name in ["h3", "h4"] and "Pronunciation" in tag.get_text())
+    if pron_section:
+        result["pronunciation"] = ", ".join(span.get_text() for span in soup.find_all('span', class_="IPA"))
+    return result
+
+
+# Run with saved pages (raw HTML or API JSON responses) to time the parser, a generated page without arguments:
+#   python -m util.services.wiktionary_parser [page ...]
+if __name__ == "__main__":
+    import json
+    import sys
+    import time
+
+    try:
+        import bs4
+    except ImportError:
+        bs4 = None
+
+    pages = []
+    for path in sys.argv[1:]:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        if content.lstrip().startswith("{"):
+            content = json.loads(content)["parse"]["text"]
+        pages.append((path, content))
+    if not pages:
+        pages = [("generated, 1 language", _sample_page(languages=0)),
+                 ("generated, 41 languages", _sample_page())]
+
+    def bench(parse, content, rounds=20):
+        parse(content, "English")
+        start = time.perf_counter()
+        for _ in range(rounds):
+            result = parse(content, "English")
+        return (time.perf_counter() - start) / rounds * 1000, result
+
+    for name, content in pages:
+        elapsed, result = bench(parse_language_section, content)
+        print(f"{name}: {len(content) / 1024:.0f} KiB")
+        print(f"  section parser: {elapsed:8.2f} ms, {len(result['definitions'])} definitions")
+        if bs4 is not None:
+            old_elapsed, old_result = bench(_parse_with_beautifulsoup, content, rounds=3)
+            print(f"  BeautifulSoup:  {old_elapsed:8.2f} ms, {len(old_result['definitions'])} definitions, "
+                  f"{old_elapsed / elapsed:.0f}x slower")
+    if bs4 is None:
+        print("Install beautifulsoup4 to compare against the previous parser")
@@ -1,12 +1,36 @@
 import requests
 import json
-from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from util.services.lookup_cache import LookupCache
+from util.services.http_session import get_session
+from util.services.wiktionary_parser import DEFINITION_FALLBACK, parse_language_section
+
+# Bump whenever parse_wiktionary_content changes its output, so stale cache entries are ignored
+PARSER_VERSION = 3
 
 class WiktionaryService:
-    def __init__(self):
+    def __init__(self, cache=None, session=None, max_workers=8):
         self.base_url = "https://en.wiktionary.org/w/api.php"
+        self.cache = cache
+        self._session = session
+        self.max_workers = max_workers
+        
+        self._executor = None
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
         
+    @property
+    def session(self):
+        """The session given at init, otherwise the shared one as currently configured"""
+        return self._session or get_session()
+    
     def get_word_data(self, word, language="English"):
+        if self.cache:
+            cached = self.cache.get(word, language, PARSER_VERSION)
+            if cached is not None:
+                return cached
+        
         params = {
             "action": "parse",
             "page": word,
@@ -16,7 +40,7 @@ class WiktionaryService:
         }
         
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -25,74 +49,85 @@ class WiktionaryService:
             
             html_content = data["parse"]["text"]
             
-            return self.parse_wiktionary_content(html_content, language)
+            result = self.parse_wiktionary_content(html_content, language, word)
+            # A page the parser could not read is fetched again next time
+            if self.cache and result["definitions"] != [DEFINITION_FALLBACK]:
+                self.cache.put(word, language, PARSER_VERSION, result)
+            return result
             
         except requests.RequestException as e:
+            # Serve an expired entry rather than nothing when offline
+            if self.cache:
+                cached = self.cache.get(word, language, PARSER_VERSION, allow_expired=True)
+                if cached is not None:
+                    return cached
             return {"error": f"Request failed: {str(e)}"}
         except KeyError as e:
             return {"error": f"Failed to parse response for word: {word} - {str(e)}"}
         except Exception as e:
             return {"error": f"An unexpected error occurred: {str(e)}"}
     
-    def parse_wiktionary_content(self, html_content, target_language):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        result = {
-            "definitions": [],
-            "etymology": "",
-            "pronunciation": "",
-            "examples": [],
-            "related_terms": [],
-            "translations": {}
-        }
-        
-        # Try to find the language section
-        language_header = None
-        for header in soup.find_all(['h2', 'h3', 'h4']):
-            header_text = header.get_text().strip()
-            if header_text == target_language:
-                language_header = header
-                break
-        
-        if not language_header:
-            pass
-        
-        # Extract definitions usually ordered lists (ol)
-        definition_lists = soup.find_all('ol')
-        for ol in definition_lists:
-            for li in ol.find_all('li', recursive=False):
-                definition_text = li.get_text().strip()
-                if definition_text and len(definition_text) > 1:
-                    result["definitions"].append(definition_text)
-                    
-                    # Look for examples within this definition (often in italics or quotes)
-                    examples = li.find_all(['dd', 'i', 'cite'])
-                    for example in examples:
-                        example_text = example.get_text().strip()
-                        if example_text and len(example_text) > 12: 
-                            result["examples"].append(example_text)
+    def get_many(self, words, language="English"):
+        """
+        Look up many words concurrently
         
-        etymology_section = soup.find(lambda tag: tag.name in ["h3", "h4"] and "Etymology" in tag.get_text())
-        if etymology_section:
-            next_elem = etymology_section.find_next(['p', 'div'])
-            if next_elem:
-                result["etymology"] = next_elem.get_text().strip()
+        At most `max_workers` requests run at once, and the shared session keeps
+        them under the per-host rate limit. Duplicate words, including words that
+        another caller is already fetching, share a single request.
         
-        pron_section = soup.find(lambda tag: tag.name in ["h3", "h4"] and "Pronunciation" in tag.get_text())
-        if pron_section:
-            ipa_spans = soup.find_all('span', class_="IPA")
-            if ipa_spans:
-                pronunciations = [span.get_text() for span in ipa_spans]
-                result["pronunciation"] = ", ".join(pronunciations)
-            else:
-                next_elem = pron_section.find_next(['p', 'div', 'ul'])
-                if next_elem:
-                    result["pronunciation"] = next_elem.get_text().strip()
+        Args:
+            words: Iterable of words to look up
+            language: Language section to parse
+            
+        Yields:
+            (word, result) tuples in completion order, cache hits first
+        """
+        pending = {}
+        for word in dict.fromkeys(words):
+            if self.cache:
+                cached = self.cache.get(word, language, PARSER_VERSION)
+                if cached is not None:
+                    yield word, cached
+                    continue
+            pending[self._submit_lookup(word, language)] = word
         
-        if not result["definitions"]:
-            result["definitions"] = ["Definition parsing failed. Click 'Open in Browser' to see the full entry."]
+        for future in as_completed(pending):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"error": f"An unexpected error occurred: {str(e)}"}
+            yield pending[future], result
+    
+    def _submit_lookup(self, word, language):
+        key = (word, language)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future
+            
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="wiktionary")
+            future = self._executor.submit(self.get_word_data, word, language)
+            self._in_flight[key] = future
         
-        return result
+        future.add_done_callback(lambda f: self._forget_lookup(key, f))
+        return future
+    
+    def _forget_lookup(self, key, future):
+        with self._in_flight_lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+    
+    def shutdown(self):
+        """Stop the batch lookup workers"""
+        with self._in_flight_lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
+    
+    def parse_wiktionary_content(self, html_content, target_language, word=""):
+        return parse_language_section(html_content, target_language, word)
     
     def search_similar_words(self, prefix, limit=10):
         """
@@ -114,7 +149,7 @@ class WiktionaryService:
         }
         
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -125,8 +160,71 @@ class WiktionaryService:
         except requests.RequestException:
             return []
 
-# Run to test the service
+# Run to look up a word live, or with --stub to time a 500 word batch against a local server:
+#   python -m util.services.wiktionary_service [--stub]
 if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from util.services.http_session import configure_session
+    
+    if "--stub" not in sys.argv:
+        service = WiktionaryService(LookupCache())
+        result = service.get_word_data("hello")
+        print(json.dumps(result, indent=2))
+        
+        start = time.perf_counter()
+        for _ in range(1000):
+            service.get_word_data("hello")
+        print(f"Cached lookup: {(time.perf_counter() - start) * 1000:.4f} us")
+        print(service.cache.stats())
+        sys.exit()
+    
+    LATENCY = 0.02
+    
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_GET(self):
+            # Stands in for the round trip to Wiktionary
+            time.sleep(LATENCY)
+            body = json.dumps({"parse": {"text": '<h2 id="English">English</h2><p>stub</p>'}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    words = [f"word{i}" for i in range(500)]
+    configure_session(requests_per_second=0)
+    
     service = WiktionaryService()
-    result = service.get_word_data("hello")
-    print(json.dumps(result, indent=2))
\ No newline at end of file
+    service.base_url = f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+    start = time.perf_counter()
+    for word in words:
+        service.get_word_data(word)
+    serial = time.perf_counter() - start
+    print(f"get_word_data loop: {serial:.2f} s, {len(words) / serial:.0f} words/s")
+    
+    for workers in (4, 8, 16):
+        service = WiktionaryService(LookupCache(f"{tempfile.mkdtemp()}/lookup_cache.db"), max_workers=workers)
+        service.base_url = f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+        start = time.perf_counter()
+        results = dict(service.get_many(words))
+        batch = time.perf_counter() - start
+        errors = sum(1 for result in results.values() if "error" in result)
+        print(f"get_many, {workers:2} workers: {batch:.2f} s, {len(words) / batch:.0f} words/s, "
+              f"{serial / batch:.1f}x, {errors} errors")
+        
+        start = time.perf_counter()
+        dict(service.get_many(words))
+        print(f"  again from the cache: {(time.perf_counter() - start) * 1000:.1f} ms")
+        service.shutdown()
+    
+    server.shutdown()